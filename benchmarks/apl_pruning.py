@@ -0,0 +1,127 @@
+"""
+Payload bytes saved by the viewport pruning of the APL documents
+
+For each device viewport of envelopes.APL_VIEWPORTS, reports the APL viewport
+profile the documents are pruned for, the compact JSON size of every APL
+document and of the launch, recipe and help response envelopes with the full
+and the pruned documents, and the bytes saved. Checks that the pruned
+documents have no condition left on the viewport profile, and that the
+documents are only pruned for the APL profile of the device: the viewports of
+the other profiles (ex: a 1920x1080 hubLandscapeXLarge hub, HUB_LANDSCAPE_LARGE
+for the SDK) get the full documents.
+
+usage: python benchmarks/apl_pruning.py [--locales en-US,fr-FR] [--json]
+"""
+import argparse
+import json
+import platform
+import random
+import re
+import sys
+
+import envelopes
+
+# Conditions on the viewport profile, which must all be resolved in the pruned documents
+VIEWPORT_CONDITION = re.compile(r'"when":"[^"]*@viewportProfile')
+
+
+def size(value):
+    return len(json.dumps(value, separators=(',', ':'), ensure_ascii=False).encode('utf-8'))
+
+
+def build_requests(lambda_handler, locale, models):
+    """
+    Returns the (request name, request, session attributes) of the responses with an APL document
+    """
+    sauce_id, value, _ = envelopes.get_slot_values(models[locale])[0]
+    launch = lambda_handler(envelopes.envelope(envelopes.launch_request(), locale, new=True), None)
+    return [
+        ('LaunchRequest', envelopes.launch_request(), None),
+        ('RecipeIntent', envelopes.recipe_intent_request(value, sauce_id), launch['sessionAttributes']),
+        ('HelpIntent', envelopes.intent_request('AMAZON.HelpIntent'), launch['sessionAttributes'])
+    ]
+
+
+def response_size(lambda_handler, request, locale, viewport, attributes):
+    # Same random sauce names with and without pruning
+    random.seed(0)
+    response = lambda_handler(envelopes.envelope(request, locale, new=attributes is None, attributes=attributes,
+                                                 viewport=viewport), None)
+    response.pop('userAgent', None)
+    return size(response)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--locales', default='en-US', help='comma separated locales (default: en-US)')
+    parser.add_argument('--json', action='store_true', help='print the result as json')
+    args = parser.parse_args()
+
+    lambda_function = envelopes.load_skill()
+    import apl_utils
+    from ask_sdk_core.serialize import DefaultSerializer
+    from ask_sdk_core.handler_input import HandlerInput
+    from ask_sdk_model import RequestEnvelope
+    models = envelopes.load_models()
+    locales = args.locales.split(',')
+
+    result = {'python': platform.python_version(), 'viewports': {}}
+    unresolved = []
+    mispruned = []
+    for device, viewport in envelopes.APL_VIEWPORTS.items():
+        request_envelope = DefaultSerializer().deserialize(
+            json.dumps(envelopes.envelope(envelopes.launch_request(), locales[0], viewport=viewport)), RequestEnvelope)
+        profile = apl_utils.get_viewport_profile(HandlerInput(request_envelope))
+        if profile not in (None, device):
+            mispruned.append((device, profile))
+        documents = {}
+        for name in apl_utils.APL_DOC_FILES:
+            full = apl_utils.get_apl_document(name)
+            pruned = apl_utils.prune_apl_document(full, profile) if profile else full
+            documents[name] = {'full_bytes': size(full), 'pruned_bytes': size(pruned),
+                               'saved_bytes': size(full) - size(pruned)}
+            if profile and VIEWPORT_CONDITION.search(json.dumps(pruned, separators=(',', ':'))):
+                unresolved.append((device, name))
+        responses = {}
+        for locale in locales:
+            for name, request, attributes in build_requests(lambda_function.lambda_handler, locale, models):
+                apl_utils.APL_DOC_PRUNING = False
+                full = response_size(lambda_function.lambda_handler, request, locale, viewport, attributes)
+                apl_utils.APL_DOC_PRUNING = True
+                pruned = response_size(lambda_function.lambda_handler, request, locale, viewport, attributes)
+                stats = responses.setdefault(name, {'full_bytes': 0, 'pruned_bytes': 0})
+                stats['full_bytes'] += full
+                stats['pruned_bytes'] += pruned
+        for stats in responses.values():
+            stats['full_bytes'] //= len(locales)
+            stats['pruned_bytes'] //= len(locales)
+            stats['saved_bytes'] = stats['full_bytes'] - stats['pruned_bytes']
+            stats['saved_rate'] = round(stats['saved_bytes'] / stats['full_bytes'], 3)
+        result['viewports'][device] = {'profile': profile, 'documents': documents, 'responses': responses}
+
+    if args.json:
+        print(json.dumps(result, indent=2, sort_keys=True))
+    else:
+        print("python {}  locales {}".format(result['python'], ','.join(locales)))
+        print("{:<22} {:<19} {:<24} {:>8} {:>9} {:>8} {:>7}".format(
+            'viewport', 'pruned for', 'payload', 'full B', 'pruned B', 'saved B', 'saved'))
+        for device, stats in result['viewports'].items():
+            rows = [('document ' + name, values) for name, values in stats['documents'].items()]
+            rows += [('response ' + name, values) for name, values in stats['responses'].items()]
+            for label, values in rows:
+                print("{:<22} {:<19} {:<24} {:>8} {:>9} {:>8} {:>6.1f}%".format(
+                    device, stats['profile'] or '-', label,
+                    values['full_bytes'], values['pruned_bytes'], values['saved_bytes'],
+                    100.0 * values['saved_bytes'] / values['full_bytes']))
+    for device, profile in mispruned:
+        print("FAILED: {} documents pruned for {}".format(device, profile))
+    for device, name in unresolved:
+        print("FAILED: {} document pruned for {} has unresolved viewport conditions".format(name, device))
+    errors = envelopes.logged_errors()
+    if errors:
+        print("FAILED: {} requests were not handled successfully".format(errors))
+    return 1 if unresolved or mispruned or errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""
+Startup benchmark of the static skill content: asset bundle against scattered loading
+
+Loads the localized strings, the recipes of every language, the recipe images,
+the APL documents and the sauce names table in fresh interpreters, either from
+their source files (JSON files parsed one by one and recipe modules imported)
+or from lambda/py/assets.bundle (built with tools/build_asset_bundle.py).
+Reports the median time of the loading alone, and of the import of
+lambda_function followed by the first use of every asset.
+
+usage: python benchmarks/asset_loading.py [--runs 20] [--json]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+import envelopes
+
+# Modules imported by the skill and the SDK before the assets are loaded, left out of the loading time
+COMMON_IMPORTS = "import time, json, logging, hashlib, marshal\n"
+
+# Loading of the assets from their source files, as the skill does without bundle
+SCATTERED_SCRIPT = COMMON_IMPORTS + (
+    "start = time.perf_counter()\n"
+    "import recipes\n"
+    "for file_path in ('language_strings.json', 'sauce_names.json', 'documents/launchRequest.json',\n"
+    "                  'documents/recipeIntent.json', 'documents/helpIntent.json'):\n"
+    "    with open(file_path, encoding='utf-8') as f:\n"
+    "        json.load(f)\n"
+    "for language in recipes.LANGUAGES:\n"
+    "    recipes.translations[language]\n"
+    "print(time.perf_counter() - start)\n"
+)
+
+# Loading of the asset bundle
+BUNDLE_SCRIPT = COMMON_IMPORTS + (
+    "start = time.perf_counter()\n"
+    "import asset_utils\n"
+    "assert asset_utils.BUNDLE is not None\n"
+    "print(time.perf_counter() - start)\n"
+)
+
+# Import of the lambda function and first use of every asset
+SKILL_SCRIPT = (
+    "import time\n"
+    "start = time.perf_counter()\n"
+    "import lambda_function\n"
+    "import apl_utils\n"
+    "import recipe_utils\n"
+    "import resolver_utils\n"
+    "for name in apl_utils.APL_DOC_FILES:\n"
+    "    apl_utils.get_apl_document(name)\n"
+    "for language in recipe_utils.recipes.LANGUAGES:\n"
+    "    recipe_utils.CATALOG_BACKEND.count(language)\n"
+    "resolver_utils.get_sauce_index()\n"
+    "print(time.perf_counter() - start)\n"
+)
+
+
+def run(script, bundle_file):
+    """
+    Returns the time (ms) printed by a script run in a fresh interpreter from the lambda folder
+    """
+    env = dict(os.environ, ASSET_BUNDLE_FILE=bundle_file)
+    env.pop('RECIPE_CATALOG_FILE', None)
+    result = subprocess.run([sys.executable, '-c', script], cwd=envelopes.LAMBDA_DIR, env=env,
+                            capture_output=True, text=True, check=True)
+    return float(result.stdout.split()[-1]) * 1000
+
+
+def measure(script, bundle_file, runs):
+    # The first run fills the bytecode caches
+    run(script, bundle_file)
+    times = [run(script, bundle_file) for _ in range(runs)]
+    return {'median_ms': round(statistics.median(times), 3), 'min_ms': round(min(times), 3)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=20, help='fresh interpreters per measure')
+    parser.add_argument('--json', action='store_true', help='print the result as json')
+    args = parser.parse_args()
+
+    bundle_file = os.path.join(envelopes.LAMBDA_DIR, 'assets.bundle')
+    if not os.path.exists(bundle_file):
+        print("FAILED: {} not found, run python tools/build_asset_bundle.py".format(bundle_file))
+        return 1
+    result = {
+        'runs': args.runs,
+        'bundle_bytes': os.path.getsize(bundle_file),
+        'loading': {
+            'scattered': measure(SCATTERED_SCRIPT, '', args.runs),
+            'bundle': measure(BUNDLE_SCRIPT, 'assets.bundle', args.runs)
+        },
+        'skill': {
+            'scattered': measure(SKILL_SCRIPT, '', args.runs),
+            'bundle': measure(SKILL_SCRIPT, 'assets.bundle', args.runs)
+        }
+    }
+
+    if args.json:
+        print(json.dumps(result, indent=2, sort_keys=True))
+    else:
+        print("runs {runs}  bundle {bundle_bytes} bytes".format(**result))
+        print("{:<40} {:>12} {:>12} {:>8}".format('', 'scattered ms', 'bundle ms', 'speedup'))
+        for label, key in (('assets loading', 'loading'), ('lambda_function import + first use', 'skill')):
+            scattered, bundle = result[key]['scattered']['median_ms'], result[key]['bundle']['median_ms']
+            print("{:<40} {:>12.2f} {:>12.2f} {:>7.1f}x".format(label, scattered, bundle, scattered / bundle))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""
+Scaling benchmark of the recipe catalog backends
+
+Generates synthetic catalogs of growing sizes and measures, in a fresh
+interpreter for each backend and size, the time and memory to load the
+catalog and serve the first request, then the latency of random recipe
+picks through the recently used recipes cache.
+
+usage: python benchmarks/catalog_scaling.py [--sizes 11,1000,10000,100000] [--picks 2000]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import envelopes
+
+CHILD = r'''
+import json, random, sys, time, tracemalloc
+sys.path.insert(0, {lambda_dir!r})
+tracemalloc.start()
+start = time.perf_counter()
+import catalog_utils
+size = {size}
+images = {{'R%06d' % i: 'https://example.com/%06d.png' % i for i in range(0, size, 10)}}
+if {file_path!r}:
+    backend = catalog_utils.SqliteCatalogBackend({file_path!r})
+else:
+    # Recipes literals imported in memory, as in the recipes package
+    backend = catalog_utils.MemoryCatalogBackend({{'en': {{
+        'R%06d' % i: {{'name': 'Sauce %d' % i, 'instructions': {instructions!r} % i}}
+        for i in range(size)}}}}, images)
+cache = catalog_utils.LRUCache(512)
+
+def pick():
+    recipe_id = backend.get_id('en', random.randrange(backend.count('en')))
+    recipe = cache.get(recipe_id)
+    if recipe is None:
+        recipe = backend.get_recipe('en', recipe_id) + (backend.get_image(recipe_id),)
+        cache.put(recipe_id, recipe)
+    return recipe
+
+pick()
+first_ms = (time.perf_counter() - start) * 1000
+current, peak = tracemalloc.get_traced_memory()
+tracemalloc.stop()
+random.seed(0)
+latencies = []
+for _ in range({picks}):
+    start = time.perf_counter()
+    pick()
+    latencies.append((time.perf_counter() - start) * 1000000)
+latencies.sort()
+print(json.dumps({{'first_ms': first_ms, 'memory_kib': current / 1024.0, 'peak_kib': peak / 1024.0,
+                  'p50_us': latencies[len(latencies) // 2], 'p99_us': latencies[int(len(latencies) * 0.99)]}}))
+'''
+
+INSTRUCTIONS = ("To make sauce number %d, mix mayonnaise, ketchup, mustard, honey and lemon juice together "
+                "in a bowl. Season with salt and pepper, cover and chill in the refrigerator overnight.")
+
+
+def measure(size, file_path, picks):
+    code = CHILD.format(lambda_dir=envelopes.LAMBDA_DIR, size=size, file_path=file_path,
+                        instructions=INSTRUCTIONS, picks=picks)
+    output = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='11,1000,10000,100000', help='comma separated numbers of recipes')
+    parser.add_argument('--picks', type=int, default=2000, help='random recipe picks measured per run')
+    args = parser.parse_args()
+
+    sys.path.insert(0, envelopes.LAMBDA_DIR)
+    import catalog_utils
+
+    print("{:<8} {:>9} {:>12} {:>11} {:>11} {:>9} {:>9} {:>10}".format(
+        'backend', 'recipes', 'file KiB', 'first ms', 'memory KiB', 'peak KiB', 'p50 us', 'p99 us'))
+    with tempfile.TemporaryDirectory() as directory:
+        for size in [int(size) for size in args.sizes.split(',')]:
+            file_path = os.path.join(directory, 'recipes-{}.db'.format(size))
+            catalog_utils.write_sqlite_catalog(
+                file_path, ('en',),
+                lambda language: (('R%06d' % i, 'Sauce %d' % i, INSTRUCTIONS % i) for i in range(size)),
+                {'R%06d' % i: 'https://example.com/%06d.png' % i for i in range(0, size, 10)})
+            for backend, path in (('memory', ''), ('sqlite', file_path)):
+                result = measure(size, path, args.picks)
+                print("{:<8} {:>9} {:>12} {first_ms:>11.2f} {memory_kib:>11.1f} {peak_kib:>9.1f} "
+                      "{p50_us:>9.1f} {p99_us:>10.1f}".format(
+                          backend, size, os.path.getsize(file_path) // 1024 if path else '-', **result))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
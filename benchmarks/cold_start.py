@@ -0,0 +1,102 @@
+"""
+Cold start benchmark of the skill lambda package
+
+Imports lambda_function in fresh interpreters and reports the wall-clock
+import time and the slowest modules (python -X importtime).
+
+usage: python benchmarks/cold_start.py [--runs 10] [--top 15] [--max-ms 200] [--json]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+LAMBDA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lambda', 'py')
+
+IMPORT_SCRIPT = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    "import lambda_function\n"
+    "print(time.perf_counter() - start, len(sys.modules))\n"
+)
+
+
+def run_import(importtime=False):
+    """
+    Import lambda_function in a fresh interpreter
+    Returns the import time (ms), the number of loaded modules and the importtime report
+    """
+    command = [sys.executable]
+    if importtime:
+        command += ['-X', 'importtime']
+    command += ['-c', IMPORT_SCRIPT]
+    result = subprocess.run(command, cwd=LAMBDA_DIR, capture_output=True, text=True, check=True)
+    seconds, modules = result.stdout.split()
+    return float(seconds) * 1000, int(modules), result.stderr
+
+
+def parse_importtime(report):
+    """
+    Returns the cumulative import time (ms) of each module from a -X importtime report
+    """
+    modules = {}
+    lines = report.splitlines()
+    # Skip the modules imported by the interpreter startup (site)
+    for index, line in enumerate(lines):
+        if line.endswith('| site'):
+            lines = lines[index + 1:]
+            break
+    for line in lines:
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        fields = line[len('import time:'):].split('|')
+        cumulative_us = int(fields[1])
+        name = fields[2].strip()
+        modules[name] = max(modules.get(name, 0), cumulative_us / 1000.0)
+    return modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=10, help='number of fresh interpreters')
+    parser.add_argument('--top', type=int, default=15, help='number of slowest modules to report')
+    parser.add_argument('--max-ms', type=float, default=None, help='fail if the median import time is above')
+    parser.add_argument('--json', action='store_true', help='print the report as json')
+    args = parser.parse_args()
+
+    timings = []
+    modules_count = 0
+    for _ in range(args.runs):
+        elapsed_ms, modules_count, _ = run_import()
+        timings.append(elapsed_ms)
+    _, _, report = run_import(importtime=True)
+    slowest = sorted(parse_importtime(report).items(), key=lambda item: -item[1])[:args.top]
+
+    result = {
+        'python': sys.version.split()[0],
+        'runs': args.runs,
+        'median_ms': round(statistics.median(timings), 2),
+        'min_ms': round(min(timings), 2),
+        'max_ms': round(max(timings), 2),
+        'modules': modules_count,
+        'slowest_modules_ms': [[name, round(ms, 2)] for name, ms in slowest]
+    }
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print("python {python}  runs {runs}  modules {modules}".format(**result))
+        print("import lambda_function: median {median_ms} ms  min {min_ms} ms  max {max_ms} ms".format(**result))
+        print("slowest modules (cumulative, -X importtime):")
+        for name, ms in result['slowest_modules_ms']:
+            print("  {:>9.2f} ms  {}".format(ms, name))
+
+    if args.max_ms is not None and result['median_ms'] > args.max_ms:
+        print("FAILED: median import time {} ms is above {} ms".format(result['median_ms'], args.max_ms))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
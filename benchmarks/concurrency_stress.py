@@ -0,0 +1,309 @@
+"""
+Concurrency stress benchmark of the self-hosted endpoint (lambda/py/server.py)
+
+Serves the skill with the worker pool server in this process, and sends
+requests of every locale of models/ from client processes over parallel
+connections (recipes, ingredients, help, launch, repeat, stop, APL and
+voice-only devices, shuffled). Every response is checked against the
+response of the same request handled serially, so that a state shared
+between threads (caches, strings of another locale) shows up as a failure.
+Reports the requests per second, per core and per CPU second of the server.
+
+usage: python benchmarks/concurrency_stress.py [--requests 4000] [--concurrency 16] [--workers 8]
+                                               [--clients 2] [--locales en-US,fr-FR] [--seed 0]
+                                               [--min-rps-per-core 0] [--json]
+"""
+import argparse
+import http.client
+import json
+import multiprocessing
+import os
+import platform
+import random
+import sys
+import threading
+import time
+
+import envelopes
+
+# Entry points whose speech has a random sauce name: names are masked before comparing
+# The random sauce names of the APL hints are masked in every response
+RANDOM_CASES = frozenset(('LaunchRequest', 'HelpIntent'))
+
+
+def build_cases(lambda_function, locales, models):
+    """
+    Returns the list of (case name, locale, request body) to send
+    """
+    cases = []
+    for locale in locales:
+        sauces = envelopes.get_slot_values(models[locale])
+        for apl in (True, False):
+            def body(request, new=False, attributes=None):
+                return json.dumps(envelopes.envelope(
+                    request, locale, apl=apl, new=new, attributes=attributes,
+                    request_id='amzn1.echo-api.request.STRESS')).encode('utf-8')
+
+            launch = lambda_function.sb.invoke(body(envelopes.launch_request(), new=True).decode('utf-8'))
+            sauce_id, value, _ = sauces[0]
+            recipe = lambda_function.sb.invoke(body(
+                envelopes.recipe_intent_request(value, sauce_id),
+                attributes=launch['sessionAttributes']).decode('utf-8'))
+
+            cases.append(('LaunchRequest', locale, body(envelopes.launch_request(), new=True)))
+            for sauce_id, value, _ in sauces:
+                cases.append(('RecipeIntent match', locale, body(
+                    envelopes.recipe_intent_request(value, sauce_id), attributes=launch['sessionAttributes'])))
+            cases.append(('RecipeIntent no match', locale, body(
+                envelopes.recipe_intent_request('chocolate'), attributes=launch['sessionAttributes'])))
+            cases.append(('IngredientIntent', locale, body(
+                envelopes.ingredient_intent_request(envelopes.SAMPLE_INGREDIENTS[locale[:2]]),
+                attributes=launch['sessionAttributes'])))
+            cases.append(('HelpIntent', locale, body(
+                envelopes.intent_request('AMAZON.HelpIntent'), attributes=launch['sessionAttributes'])))
+            cases.append(('RepeatIntent', locale, body(
+                envelopes.intent_request('AMAZON.RepeatIntent'), attributes=recipe['sessionAttributes'])))
+            cases.append(('StopIntent', locale, body(
+                envelopes.intent_request('AMAZON.StopIntent'), attributes=recipe['sessionAttributes'])))
+    return cases
+
+
+def get_sauce_names(recipe_utils, locale):
+    """
+    Returns the sauce names of a locale, longest first
+    """
+    catalog = recipe_utils.get_locale_specific_recipes(locale)
+    return sorted((catalog[recipe_id].name for recipe_id in catalog), key=len, reverse=True)
+
+
+def mask(text, sauce_names):
+    """
+    Returns a text with the sauce names replaced by a placeholder
+    """
+    for sauce_name in sauce_names:
+        text = text.replace(sauce_name, '<sauce>')
+    return text
+
+
+def mask_hints(value, sauce_names):
+    """
+    Masks the sauce names of the APL hints (random sauce) of a parsed response, in place
+    """
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key == 'hintText' and isinstance(item, str):
+                value[key] = mask(item, sauce_names)
+            else:
+                mask_hints(item, sauce_names)
+    elif isinstance(value, list):
+        for item in value:
+            mask_hints(item, sauce_names)
+
+
+def canonical(name, response_text, sauce_names):
+    """
+    Returns the response as compared with the serial response (random sauce names masked)
+    """
+    if name in RANDOM_CASES:
+        response_text = mask(response_text, sauce_names)
+    response = json.loads(response_text)
+    mask_hints(response, sauce_names)
+    return response
+
+
+def build_reference(locales):
+    """
+    Returns the cases, the sauce names and the canonical serial response of each case
+    """
+    lambda_function = envelopes.load_skill()
+    import recipe_utils
+    cases = build_cases(lambda_function, locales, envelopes.load_models())
+    sauce_names = {locale: get_sauce_names(recipe_utils, locale) for locale in locales}
+    expected = []
+    for name, locale, body in cases:
+        response_text = json.dumps(lambda_function.sb.invoke(body.decode('utf-8')), ensure_ascii=False)
+        expected.append(canonical(name, response_text, sauce_names[locale]))
+    return cases, sauce_names, expected
+
+
+def check(cases, sauce_names, expected, results, stats, failures):
+    """
+    Compares the responses of the client processes with the serial responses
+    Updates the statistics by locale and the failures, returns the sorted latencies
+    """
+    latencies = []
+    for client_results in results:
+        for index, status, data, latency in client_results:
+            name, locale, _ = cases[index]
+            stats[locale]['requests'] += 1
+            latencies.append(latency)
+            if status != 200 or canonical(name, data.decode('utf-8'), sauce_names[locale]) != expected[index]:
+                stats[locale]['failures'] += 1
+                failures.append((name, locale, status))
+    return sorted(latencies)
+
+
+# Client process state, set by _init_client
+_CLIENT = {}
+
+
+def _init_client(host, port, bodies):
+    _CLIENT.update(host=host, port=port, bodies=bodies)
+
+
+def _send(host, port, body):
+    """
+    Returns (status, response body, latency ms) of a request
+    """
+    start = time.perf_counter()
+    connection = http.client.HTTPConnection(host, port, timeout=60)
+    try:
+        connection.request('POST', '/', body=body, headers={'Content-Type': 'application/json'})
+        response = connection.getresponse()
+        data = response.read()
+        return response.status, data, (time.perf_counter() - start) * 1000
+    finally:
+        connection.close()
+
+
+def _run_client(job):
+    """
+    Sends the requests of the case indexes with parallel connections
+    Returns the list of (case index, status, response body, latency ms)
+    """
+    indexes, connections = job
+    host, port, bodies = _CLIENT['host'], _CLIENT['port'], _CLIENT['bodies']
+    results = []
+    lock = threading.Lock()
+    queue = iter(indexes)
+
+    def worker():
+        while True:
+            with lock:
+                index = next(queue, None)
+            if index is None:
+                return
+            status, data, latency = _send(host, port, bodies[index])
+            with lock:
+                results.append((index, status, data, latency))
+
+    threads = [threading.Thread(target=worker) for _ in range(connections)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def percentile(sorted_values, rate):
+    index = max(0, min(len(sorted_values) - 1, int(round(rate * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def get_cores():
+    """
+    Returns the number of cores available to this process
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=4000, help='total number of requests')
+    parser.add_argument('--concurrency', type=int, default=16, help='parallel client connections')
+    parser.add_argument('--workers', type=int, default=8, help='server worker threads')
+    parser.add_argument('--clients', type=int, default=2, help='client processes')
+    parser.add_argument('--locales', default=None, help='comma separated locales (default: every model)')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the requests order')
+    parser.add_argument('--min-rps-per-core', type=float, default=None, help='fail if the requests per second per core are below')
+    parser.add_argument('--json', action='store_true', help='print the result as json')
+    args = parser.parse_args()
+
+    models = envelopes.load_models()
+    locales = args.locales.split(',') if args.locales else sorted(models)
+    # Serial responses, the reference of the responses under load, handled in another
+    # process so that the server starts with cold caches
+    context = multiprocessing.get_context('spawn')
+    with context.Pool(1) as pool:
+        cases, sauce_names, expected = pool.apply(build_reference, (locales,))
+
+    envelopes.load_skill()
+    import server
+    # The requests are not signed, see request_verification.py for the verification cost
+    server.VERIFY_REQUESTS = False
+    httpd = server.create_server('127.0.0.1', 0, args.workers)
+    host, port = httpd.server_address[:2]
+    serving = threading.Thread(target=httpd.serve_forever, daemon=True)
+    serving.start()
+
+    rand = random.Random(args.seed)
+    cold_indexes = list(range(len(cases)))
+    rand.shuffle(cold_indexes)
+    indexes = [rand.randrange(len(cases)) for _ in range(args.requests)]
+    clients = max(1, min(args.clients, args.concurrency))
+    connections = max(1, args.concurrency // clients)
+    with context.Pool(clients, initializer=_init_client, initargs=(host, port, [body for _, _, body in cases])) as pool:
+        # Cold round: every case once, in parallel, while the caches are filled
+        cold_results = pool.map(_run_client, [(cold_indexes[number::clients], connections)
+                                              for number in range(clients)])
+        cpu_start = time.process_time()
+        start = time.perf_counter()
+        results = pool.map(_run_client, [(indexes[number::clients], connections) for number in range(clients)])
+        elapsed = time.perf_counter() - start
+        cpu_seconds = time.process_time() - cpu_start
+    httpd.shutdown()
+    httpd.server_close()
+
+    stats = {locale: {'requests': 0, 'failures': 0} for locale in locales}
+    failures = []
+    check(cases, sauce_names, expected, cold_results, stats, failures)
+    cold_failures = len(failures)
+    latencies = check(cases, sauce_names, expected, results, stats, failures)
+    cores = get_cores()
+    rps = len(latencies) / elapsed
+    result = {
+        'python': platform.python_version(),
+        'requests': len(latencies),
+        'concurrency': args.concurrency,
+        'workers': args.workers,
+        'cores': cores,
+        'elapsed_s': round(elapsed, 3),
+        'rps': round(rps, 1),
+        'rps_per_core': round(rps / cores, 1),
+        'server_cpu_s': round(cpu_seconds, 3),
+        'rps_per_cpu_second': round(len(latencies) / cpu_seconds, 1) if cpu_seconds else None,
+        'p50_ms': round(percentile(latencies, 0.50), 2),
+        'p99_ms': round(percentile(latencies, 0.99), 2),
+        'cold_failures': cold_failures,
+        'failures': len(failures),
+        'locales': stats
+    }
+
+    if args.json:
+        print(json.dumps(result, indent=2, sort_keys=True))
+    else:
+        print("python {python}  cores {cores}  workers {workers}  concurrency {concurrency}".format(**result))
+        print("requests {requests} in {elapsed_s:.3f} s  {rps:.1f} req/s  {rps_per_core:.1f} req/s per core".format(
+            **result))
+        print("server cpu {server_cpu_s:.3f} s  {rps_per_cpu_second} req per cpu second".format(**result))
+        print("latency p50 {p50_ms:.2f} ms  p99 {p99_ms:.2f} ms".format(**result))
+        print("failures {failures} (cold caches {cold_failures})".format(**result))
+        print("{:<8} {:>9} {:>9}".format('locale', 'requests', 'failures'))
+        for locale, locale_stats in sorted(stats.items()):
+            print("{:<8} {requests:>9} {failures:>9}".format(locale, **locale_stats))
+
+    failed = False
+    if failures:
+        for name, locale, status in failures[:10]:
+            print("FAILED: {} {} (HTTP {}) differs from the serial response".format(name, locale, status))
+        failed = True
+    if args.min_rps_per_core is not None and result['rps_per_core'] < args.min_rps_per_core:
+        print("FAILED: {} req/s per core is below {}".format(result['rps_per_core'], args.min_rps_per_core))
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,229 @@
+"""
+Realistic Alexa request envelopes for the skill entry points, built from the
+interaction models in models/, and helpers to load the skill in-process.
+"""
+import glob
+import json
+import logging
+import os
+import sys
+import uuid
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+LAMBDA_DIR = os.path.join(ROOT_DIR, 'lambda', 'py')
+MODELS_DIR = os.path.join(ROOT_DIR, 'models')
+
+APPLICATION_ID = 'amzn1.ask.skill.00000000-0000-0000-0000-000000000000'
+USER_ID = 'amzn1.ask.account.BENCHMARK'
+DEVICE_ID = 'amzn1.ask.device.BENCHMARK'
+TIMESTAMP = '2026-10-18T12:00:00Z'
+
+# Ingredients spoken in IngredientIntent requests, by language
+SAMPLE_INGREDIENTS = {
+    'en': 'mayonnaise and ketchup',
+    'fr': 'mayonnaise et ketchup',
+    'es': 'mayonesa y ketchup',
+    'pt': 'maionese e ketchup',
+    'de': 'Mayonaise und Ketchup',
+    'it': 'maionese e ketchup',
+    'hi': 'मयोनीस और केचप',
+    'ja': 'マヨネーズとケチャップ'
+}
+
+# Ingredients spoken in IngredientIntent requests which no recipe contains together, by language
+SAMPLE_UNMATCHED_INGREDIENTS = {
+    'en': 'chocolate and ketchup',
+    'fr': 'chocolat et ketchup',
+    'es': 'chocolate y ketchup',
+    'pt': 'chocolate e ketchup',
+    'de': 'Schokolade und Ketchup',
+    'it': 'cioccolato e ketchup',
+    'hi': 'चॉकलेट और केचप',
+    'ja': 'チョコレートとケチャップ'
+}
+
+# Viewport of an Echo Show 5 (hubLandscapeSmall)
+APL_VIEWPORT = {
+    'experiences': [{'arcMinuteWidth': 221, 'arcMinuteHeight': 162, 'canRotate': False, 'canResize': False}],
+    'mode': 'HUB',
+    'shape': 'RECTANGLE',
+    'pixelWidth': 960,
+    'pixelHeight': 480,
+    'dpi': 160,
+    'currentPixelWidth': 960,
+    'currentPixelHeight': 480,
+    'touch': ['SINGLE'],
+    'keyboard': [],
+    'video': {'codecs': ['H_264_42', 'H_264_41']}
+}
+
+
+def viewport(pixel_width, pixel_height, dpi, shape='RECTANGLE', mode='HUB'):
+    """
+    Returns the viewport state of a device, with APL_VIEWPORT experiences and inputs
+    """
+    state = dict(APL_VIEWPORT)
+    state.update(shape=shape, mode=mode, pixelWidth=pixel_width, pixelHeight=pixel_height, dpi=dpi,
+                 currentPixelWidth=pixel_width, currentPixelHeight=pixel_height)
+    return state
+
+
+# Viewports of APL devices, by APL viewport profile
+APL_VIEWPORTS = {
+    'hubRoundSmall': viewport(480, 480, 160, shape='ROUND'),
+    'hubLandscapeSmall': APL_VIEWPORT,
+    'hubLandscapeMedium': viewport(1024, 600, 160),
+    'hubLandscapeLarge': viewport(1280, 800, 160),
+    'hubLandscapeXLarge': viewport(1920, 1080, 160),
+    'tvLandscapeXLarge': viewport(1920, 1080, 320, mode='TV'),
+    'mobileLandscapeMedium': viewport(1280, 800, 213, mode='MOBILE')
+}
+
+
+class _FormattingHandler(logging.Handler):
+    """
+    Logging handler which formats the records without writing them anywhere
+    Keeps the formatting cost of the emitted records in the measures
+    Counts the error records, logged when the skill fails to handle a request
+    """
+    errors = 0
+
+    def emit(self, record):
+        self.format(record)
+        if record.levelno >= logging.ERROR:
+            _FormattingHandler.errors += 1
+
+
+def logged_errors():
+    """
+    Returns the number of error records logged by the skill since it was loaded quietly
+    """
+    return _FormattingHandler.errors
+
+
+def load_skill(quiet=True):
+    """
+    Imports lambda_function from the lambda folder and returns the module
+    The working directory is changed to the lambda folder, as the skill loads its files from it
+    When quiet, the skill logs are formatted but not written
+    """
+    os.chdir(LAMBDA_DIR)
+    if LAMBDA_DIR not in sys.path:
+        sys.path.insert(0, LAMBDA_DIR)
+    import lambda_function
+    if quiet:
+        logger = logging.getLogger("main")
+        logger.handlers = [_FormattingHandler()]
+        logger.propagate = False
+    return lambda_function
+
+
+def load_models():
+    """
+    Returns the interaction models by locale (ex: 'en-US')
+    """
+    models = {}
+    for file_path in sorted(glob.glob(os.path.join(MODELS_DIR, '*.json'))):
+        locale = os.path.splitext(os.path.basename(file_path))[0]
+        with open(file_path, encoding='utf-8') as f:
+            models[locale] = json.load(f)['interactionModel']['languageModel']
+    return models
+
+
+def get_slot_values(model, slot_type='LIST_OF_ITEMS'):
+    """
+    Returns the (id, value, synonyms) of a slot type of an interaction model
+    """
+    for model_type in model['types']:
+        if model_type['name'] == slot_type:
+            return [(value['id'], value['name']['value'], value['name'].get('synonyms', []))
+                    for value in model_type['values']]
+    return []
+
+
+def envelope(request, locale, apl=True, new=False, attributes=None, request_id=None, viewport=None):
+    """
+    Returns a request envelope for a request, from an APL or voice-only device
+    The viewport of APL devices is APL_VIEWPORT (Echo Show 5) unless given (see APL_VIEWPORTS)
+    """
+    request = dict(request)
+    request['requestId'] = request_id or 'amzn1.echo-api.request.' + str(uuid.uuid4())
+    request['timestamp'] = TIMESTAMP
+    request['locale'] = locale
+    supported_interfaces = {}
+    if apl:
+        supported_interfaces['Alexa.Presentation.APL'] = {'runtime': {'maxVersion': '1.1'}}
+    system = {
+        'application': {'applicationId': APPLICATION_ID},
+        'user': {'userId': USER_ID},
+        'device': {'deviceId': DEVICE_ID, 'supportedInterfaces': supported_interfaces},
+        'apiEndpoint': 'https://api.amazonalexa.com',
+        'apiAccessToken': 'BENCHMARK'
+    }
+    context = {'System': system}
+    if apl:
+        context['Viewport'] = viewport or APL_VIEWPORT
+    return {
+        'version': '1.0',
+        'session': {
+            'new': new,
+            'sessionId': 'amzn1.echo-api.session.BENCHMARK',
+            'application': {'applicationId': APPLICATION_ID},
+            'user': {'userId': USER_ID},
+            'attributes': attributes or {}
+        },
+        'context': context,
+        'request': request
+    }
+
+
+def launch_request():
+    return {'type': 'LaunchRequest'}
+
+
+def session_ended_request(reason='USER_INITIATED'):
+    return {'type': 'SessionEndedRequest', 'reason': reason}
+
+
+def intent_request(intent_name, slots=None):
+    return {
+        'type': 'IntentRequest',
+        'dialogState': 'COMPLETED',
+        'intent': {'name': intent_name, 'confirmationStatus': 'NONE', 'slots': slots or {}}
+    }
+
+
+def recipe_intent_request(spoken, sauce_id=None, value_name=None):
+    """
+    Returns a RecipeIntent request for a spoken value
+    The entity resolution matches sauce_id if any, otherwise there is no match
+    """
+    slot = {'name': 'Item', 'value': spoken, 'confirmationStatus': 'NONE', 'source': 'USER'}
+    authority = 'amzn1.er-authority.echo-sdk.{}.LIST_OF_ITEMS'.format(APPLICATION_ID)
+    if sauce_id:
+        resolution = {
+            'authority': authority,
+            'status': {'code': 'ER_SUCCESS_MATCH'},
+            'values': [{'value': {'name': value_name or spoken, 'id': sauce_id}}]
+        }
+    else:
+        resolution = {'authority': authority, 'status': {'code': 'ER_SUCCESS_NO_MATCH'}}
+    slot['resolutions'] = {'resolutionsPerAuthority': [resolution]}
+    return intent_request('RecipeIntent', {'Item': slot})
+
+
+def ingredient_intent_request(ingredients):
+    """
+    Returns an IngredientIntent request for spoken ingredients (ex: "mayonnaise and ketchup")
+    """
+    slot = {'name': 'Ingredients', 'value': ingredients, 'confirmationStatus': 'NONE', 'source': 'USER'}
+    return intent_request('IngredientIntent', {'Ingredients': slot})
+
+
+def apl_user_event_request(*arguments):
+    return {
+        'type': 'Alexa.Presentation.APL.UserEvent',
+        'token': 'launchToken',
+        'arguments': list(arguments),
+        'source': {'type': 'TouchWrapper', 'handler': 'Press', 'id': 'sauceTouchWrapper'}
+    }
@@ -0,0 +1,169 @@
+"""
+Accuracy and latency benchmark of the offline sauce name resolver
+
+Generates a seeded corpus of misspelled sauce names (deleted, inserted,
+substituted and swapped letters, spacing, plurals, accents and case) from
+the sauce names of every locale, plus spoken values which are not sauces,
+and resolves them with resolver_utils without the resolve cache.
+Reports the resolution rates by locale and the lookup latency.
+
+usage: python benchmarks/fuzzy_resolution.py [--variants 20] [--seed 0]
+                                             [--max-p99-us 1000] [--min-accuracy 0.8] [--json]
+"""
+import argparse
+import json
+import random
+import sys
+import time
+import unicodedata
+
+import envelopes
+
+# Spoken values which must not be resolved to a sauce
+NOT_SAUCES = (
+    'chocolate', 'ketchup', 'mayonnaise', 'salsa', 'guacamole', 'hummus', 'gravy', 'aioli',
+    'teriyaki', 'sriracha', 'hollandaise', 'béchamel', 'vinaigrette', 'curry', 'wasabi', 'pasta',
+    'apple', 'custard', 'caramel', 'mole', 'chimichurri', 'tzatziki', 'ponzu', 'tahini',
+    'mousseline', 'rouille', 'sauerbraten', 'raita', 'चटनी', 'カレー', 'しょうゆ', 'わさび'
+)
+
+
+def _strip_accents(text):
+    return ''.join(char for char in unicodedata.normalize('NFD', text)
+                   if unicodedata.category(char) != 'Mn')
+
+
+def misspell(name, rand):
+    """
+    Returns a misspelled variant of a sauce name, with one or two typing or hearing mistakes
+    """
+    letters = [char for char in name if char.isalpha()] or list(name)
+    variant = name
+    for _ in range(rand.choice((1, 1, 2))):
+        kind = rand.choice(('delete', 'insert', 'substitute', 'transpose', 'space',
+                            'plural', 'accents', 'case'))
+        position = rand.randrange(len(variant)) if variant else 0
+        if kind == 'delete' and len(variant) > 3:
+            variant = variant[:position] + variant[position + 1:]
+        elif kind == 'insert':
+            variant = variant[:position] + rand.choice(letters) + variant[position:]
+        elif kind == 'substitute':
+            variant = variant[:position] + rand.choice(letters) + variant[position + 1:]
+        elif kind == 'transpose' and len(variant) > 1:
+            position = min(position, len(variant) - 2)
+            variant = variant[:position] + variant[position + 1] + variant[position] + variant[position + 2:]
+        elif kind == 'space':
+            if ' ' in variant:
+                variant = variant.replace(' ', '', 1)
+            else:
+                variant = variant[:position] + ' ' + variant[position:]
+        elif kind == 'plural':
+            variant = variant + 's'
+        elif kind == 'accents':
+            variant = _strip_accents(variant)
+        elif kind == 'case':
+            variant = variant.title() if rand.random() < 0.5 else variant.upper()
+    return variant
+
+
+def build_corpus(sauce_names, variants, seed):
+    """
+    Returns the list of (locale, spoken value, expected sauce id or None)
+    """
+    rand = random.Random(seed)
+    corpus = []
+    for locale in sorted(sauce_names):
+        for sauce_id, names in sorted(sauce_names[locale].items()):
+            for _ in range(variants):
+                corpus.append((locale, misspell(rand.choice(names), rand), sauce_id))
+        for value in NOT_SAUCES:
+            corpus.append((locale, value, None))
+    return corpus
+
+
+def percentile(sorted_values, rate):
+    index = max(0, min(len(sorted_values) - 1, int(round(rate * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def run(index, corpus):
+    """
+    Returns the statistics by locale and the sorted lookup latencies (microseconds)
+    """
+    stats = {}
+    latencies = []
+    for locale, spoken, expected in corpus:
+        start = time.perf_counter()
+        sauce_id = index.resolve(spoken, locale)
+        latencies.append((time.perf_counter() - start) * 1000000)
+        locale_stats = stats.setdefault(locale, {
+            'misspelled': 0, 'resolved': 0, 'wrong': 0, 'not_sauces': 0, 'false_positives': 0})
+        if expected is None:
+            locale_stats['not_sauces'] += 1
+            locale_stats['false_positives'] += sauce_id is not None
+        else:
+            locale_stats['misspelled'] += 1
+            locale_stats['resolved'] += sauce_id == expected
+            locale_stats['wrong'] += sauce_id is not None and sauce_id != expected
+    return stats, sorted(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--variants', type=int, default=20, help='misspelled variants per sauce and locale')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the misspelling corpus')
+    parser.add_argument('--max-p99-us', type=float, default=None, help='fail if the p99 lookup latency is above')
+    parser.add_argument('--min-accuracy', type=float, default=None, help='fail if the resolved rate is below')
+    parser.add_argument('--json', action='store_true', help='print the result as json')
+    args = parser.parse_args()
+
+    envelopes.load_skill()
+    import resolver_utils
+    with open(resolver_utils.SAUCE_NAMES_FILE, encoding='utf-8') as f:
+        sauce_names = json.load(f)
+    start = time.perf_counter()
+    index = resolver_utils.SauceIndex(sauce_names)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    corpus = build_corpus(sauce_names, args.variants, args.seed)
+    stats, latencies = run(index, corpus)
+    misspelled = sum(locale_stats['misspelled'] for locale_stats in stats.values())
+    result = {
+        'index_names': len(index.names),
+        'index_build_ms': round(build_ms, 3),
+        'lookups': len(corpus),
+        'p50_us': round(percentile(latencies, 0.50), 1),
+        'p99_us': round(percentile(latencies, 0.99), 1),
+        'max_us': round(latencies[-1], 1),
+        'resolved_rate': round(sum(s['resolved'] for s in stats.values()) / misspelled, 4),
+        'wrong_rate': round(sum(s['wrong'] for s in stats.values()) / misspelled, 4),
+        'false_positive_rate': round(sum(s['false_positives'] for s in stats.values()) /
+                                     sum(s['not_sauces'] for s in stats.values()), 4),
+        'locales': stats
+    }
+
+    if args.json:
+        print(json.dumps(result, indent=2, sort_keys=True, ensure_ascii=False))
+    else:
+        print("index: {index_names} names built in {index_build_ms:.3f} ms".format(**result))
+        print("lookups: {lookups}  p50 {p50_us:.1f} us  p99 {p99_us:.1f} us  max {max_us:.1f} us".format(**result))
+        print("{:<8} {:>10} {:>9} {:>7} {:>11} {:>10}".format(
+            'locale', 'misspelled', 'resolved', 'wrong', 'not sauces', 'false pos.'))
+        for locale, locale_stats in sorted(stats.items()):
+            print("{:<8} {misspelled:>10} {resolved:>9} {wrong:>7} {not_sauces:>11} {false_positives:>10}".format(
+                locale, **locale_stats))
+        print("resolved {resolved_rate:.1%}  wrong {wrong_rate:.1%}  false positives {false_positive_rate:.1%}".format(
+            **result))
+
+    failed = False
+    if args.max_p99_us is not None and result['p99_us'] > args.max_p99_us:
+        print("FAILED: p99 lookup latency {} us is above {} us".format(result['p99_us'], args.max_p99_us))
+        failed = True
+    if args.min_accuracy is not None and result['resolved_rate'] < args.min_accuracy:
+        print("FAILED: resolved rate {} is below {}".format(result['resolved_rate'], args.min_accuracy))
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""
+Per-turn payload benchmark of the guided recipes (GUIDED_RECIPES)
+
+Reads every recipe of every locale of models/ on APL and voice-only devices,
+in one response (GUIDED_RECIPES=false) and step by step (RecipeIntent then
+AMAZON.NextIntent until the last step, GUIDED_RECIPES=true), each mode in a
+fresh process. Reports the response bytes and the characters spoken before
+the user can answer (the whole recipe, or the first step and its prompt) per
+mode, and checks that the steps read in guided mode make the whole recipe,
+and that step_utils.split_steps segments SEGMENTATION_CASES (abbreviations
+of several words, CJK punctuation) as expected.
+
+usage: python benchmarks/guided_recipes.py [--locales en-US,fr-FR] [--json]
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+import envelopes
+
+# SSML tags, left out of the spoken characters
+SSML_TAG = re.compile(r'<[^>]+>')
+
+# (language, instructions, expected steps) checked against step_utils.split_steps
+SEGMENTATION_CASES = [
+    ('en', 'Mix the spices, e.g. cumin and paprika. Serve cold.',
+     ('Mix the spices, e.g. cumin and paprika.', 'Serve cold.')),
+    ('es', 'Mezcle las especias, p. ej. comino y pimentón. Sirva frío.',
+     ('Mezcle las especias, p. ej. comino y pimentón.', 'Sirva frío.')),
+    ('es', 'Añada una especia, p.ej. comino. Sirva frío.', ('Añada una especia, p.ej. comino.', 'Sirva frío.')),
+    ('pt', 'Misture os temperos, p. ex. cominho e páprica. Sirva frio.',
+     ('Misture os temperos, p. ex. cominho e páprica.', 'Sirva frio.')),
+    ('pt', 'Misture com a colher p. Ex. de uso. Sirva frio.',
+     ('Misture com a colher p. Ex. de uso.', 'Sirva frio.')),
+    ('ja', '鍋に入れます。「煮沸します。」よく混ぜます！', ('鍋に入れます。', '「煮沸します。」', 'よく混ぜます！'))
+]
+
+
+def get_speech(response_envelope):
+    """
+    Returns the text spoken by a response: the SSML of the APL SpeakItem datasource, or the output speech
+    """
+    response = response_envelope['response']
+    for directive in response.get('directives', []):
+        if directive['type'] == 'Alexa.Presentation.APL.RenderDocument':
+            return SSML_TAG.sub('', directive['datasources']['sauceBossData']['properties']['sauceSsml'])
+    return SSML_TAG.sub('', response.get('outputSpeech', {}).get('ssml', ''))
+
+
+def run_child(locales):
+    """
+    Reads every recipe with the GUIDED_RECIPES setting of the environment
+    Returns the turns of each recipe: [locale, device, sauce id, [[bytes, spoken characters]...], complete]
+    In guided mode, complete is whether the steps make the whole instructions and each turn speaks its step
+    """
+    lambda_function = envelopes.load_skill()
+    import recipe_utils
+    import step_utils
+    recipes = []
+    for locale in locales:
+        catalog = recipe_utils.get_locale_specific_recipes(locale)
+        for apl in (True, False):
+            launch = lambda_function.lambda_handler(
+                envelopes.envelope(envelopes.launch_request(), locale, apl=apl, new=True), None)
+            for sauce_id in catalog:
+                recipe = catalog[sauce_id]
+                turns = []
+                complete = ''.join(''.join(recipe.steps).split()) == ''.join(recipe.instructions.split())
+                response = lambda_function.lambda_handler(envelopes.envelope(
+                    envelopes.recipe_intent_request(sauce_id, sauce_id), locale, apl=apl,
+                    attributes=launch['sessionAttributes']), None)
+                while True:
+                    speech = get_speech(response)
+                    turns.append([len(json.dumps(response, separators=(',', ':'), ensure_ascii=False).encode('utf-8')),
+                                  len(speech)])
+                    if not step_utils.GUIDED_RECIPES:
+                        break
+                    complete = complete and speech.startswith(recipe.steps[len(turns) - 1])
+                    if len(turns) == len(recipe.steps):
+                        break
+                    response = lambda_function.lambda_handler(envelopes.envelope(
+                        envelopes.intent_request('AMAZON.NextIntent'), locale, apl=apl,
+                        attributes=response['sessionAttributes']), None)
+                recipes.append([locale, 'apl' if apl else 'voice', sauce_id, turns, complete])
+    return {'guided': step_utils.GUIDED_RECIPES, 'recipes': recipes, 'errors': envelopes.logged_errors()}
+
+
+def check_segmentation():
+    """
+    Returns the SEGMENTATION_CASES segmented differently than expected: (language, instructions, steps)
+    """
+    if envelopes.LAMBDA_DIR not in sys.path:
+        sys.path.insert(0, envelopes.LAMBDA_DIR)
+    import step_utils
+    return [(language, instructions, step_utils.split_steps(instructions, language))
+            for language, instructions, expected in SEGMENTATION_CASES
+            if step_utils.split_steps(instructions, language) != expected]
+
+
+def spawn(guided, locales):
+    env = dict(os.environ, GUIDED_RECIPES='true' if guided else 'false')
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', '--locales', ','.join(locales)],
+                            env=env, capture_output=True, text=True, check=True)
+    return json.loads(output.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--locales', default=None, help='comma separated locales (default: every model)')
+    parser.add_argument('--json', action='store_true', help='print the result as json')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    locales = args.locales.split(',') if args.locales else sorted(envelopes.load_models())
+    if args.child:
+        print(json.dumps(run_child(locales), ensure_ascii=False))
+        return 0
+
+    whole = spawn(False, locales)
+    guided = spawn(True, locales)
+    result = {}
+    incomplete = []
+    for (locale, device, sauce_id, whole_turns, _), (_, _, _, guided_turns, complete) in zip(
+            whole['recipes'], guided['recipes']):
+        entry = result.setdefault(device, {'recipes': 0, 'whole_bytes': [], 'whole_chars': [], 'steps': [],
+                                           'first_step_bytes': [], 'first_step_chars': [], 'step_bytes': []})
+        entry['recipes'] += 1
+        entry['whole_bytes'].append(whole_turns[0][0])
+        entry['whole_chars'].append(whole_turns[0][1])
+        entry['steps'].append(len(guided_turns))
+        entry['first_step_bytes'].append(guided_turns[0][0])
+        entry['first_step_chars'].append(guided_turns[0][1])
+        entry['step_bytes'].extend(turn[0] for turn in guided_turns[1:])
+        if not complete:
+            incomplete.append('{} {} {}'.format(locale, device, sauce_id))
+    summary = {device: {
+        'recipes': entry['recipes'],
+        'mean_steps': round(statistics.mean(entry['steps']), 2),
+        'whole_bytes': round(statistics.mean(entry['whole_bytes'])),
+        'whole_spoken_chars': round(statistics.mean(entry['whole_chars'])),
+        'first_step_bytes': round(statistics.mean(entry['first_step_bytes'])),
+        'first_step_spoken_chars': round(statistics.mean(entry['first_step_chars'])),
+        'next_step_bytes': round(statistics.mean(entry['step_bytes'])) if entry['step_bytes'] else None,
+        'max_step_bytes': max(entry['first_step_bytes'] + entry['step_bytes'])
+    } for device, entry in result.items()}
+    summary_result = {'devices': summary, 'errors': whole['errors'] + guided['errors'], 'incomplete': incomplete}
+
+    if args.json:
+        print(json.dumps(summary_result, indent=2, sort_keys=True))
+    else:
+        print("{:<6} {:>8} {:>6} {:>12} {:>12} {:>12} {:>12} {:>12}".format(
+            'device', 'recipes', 'steps', 'whole B', 'whole chars', 'step 1 B', 'step 1 chars', 'next step B'))
+        for device, entry in summary.items():
+            print("{:<6} {recipes:>8} {mean_steps:>6.2f} {whole_bytes:>12} {whole_spoken_chars:>12} "
+                  "{first_step_bytes:>12} {first_step_spoken_chars:>12} {next_step_bytes:>12}".format(device, **entry))
+
+    failed = False
+    for language, instructions, steps in check_segmentation():
+        print("FAILED: {} {!r} is segmented as {!r}".format(language, instructions, steps))
+        failed = True
+    if summary_result['errors']:
+        print("FAILED: {} errors logged by the skill".format(summary_result['errors']))
+        failed = True
+    for recipe in incomplete:
+        print("FAILED: {} steps do not read the whole recipe".format(recipe))
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,197 @@
+"""
+Latency benchmark of the skill lambda handler
+
+Drives lambda_function.lambda_handler in-process with realistic request
+envelopes for every entry point, every locale of models/ and both APL and
+voice-only devices. Reports p50/p95/p99 latency, throughput and peak memory
+per entry point.
+
+usage: python benchmarks/handler_latency.py [--iterations 20] [--locales en-US,fr-FR]
+                                            [--output result.json] [--compare baseline.json]
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+import envelopes
+
+
+def _run(lambda_handler, event):
+    return lambda_handler(event, None)
+
+
+def build_cases(lambda_handler, locales, models):
+    """
+    Returns the list of (case name, locale, apl, event) to benchmark
+    Session attributes of the follow-up requests (Repeat, Previous, goBack)
+    come from a real conversation through the lambda handler
+    """
+    cases = []
+    for locale in locales:
+        sauces = envelopes.get_slot_values(models[locale])
+        for apl in (True, False):
+            def event(request, new=False, attributes=None):
+                return envelopes.envelope(request, locale, apl=apl, new=new, attributes=attributes)
+
+            # Conversation: launch, recipe, help to get realistic session attributes
+            launch = _run(lambda_handler, event(envelopes.launch_request(), new=True))
+            sauce_id, value, _ = sauces[0]
+            recipe = _run(lambda_handler, event(
+                envelopes.recipe_intent_request(value, sauce_id), attributes=launch['sessionAttributes']))
+            help = _run(lambda_handler, event(
+                envelopes.intent_request('AMAZON.HelpIntent'), attributes=recipe['sessionAttributes']))
+
+            cases.append(('LaunchRequest', locale, apl, event(envelopes.launch_request(), new=True)))
+            for sauce_id, value, _ in sauces:
+                cases.append(('RecipeIntent match', locale, apl, event(
+                    envelopes.recipe_intent_request(value, sauce_id), attributes=launch['sessionAttributes'])))
+            cases.append(('RecipeIntent no match', locale, apl, event(
+                envelopes.recipe_intent_request('chocolate'), attributes=launch['sessionAttributes'])))
+            cases.append(('IngredientIntent', locale, apl, event(
+                envelopes.ingredient_intent_request(envelopes.SAMPLE_INGREDIENTS[locale[:2]]),
+                attributes=launch['sessionAttributes'])))
+            cases.append(('HelpIntent', locale, apl, event(
+                envelopes.intent_request('AMAZON.HelpIntent'), attributes=launch['sessionAttributes'])))
+            cases.append(('RepeatIntent', locale, apl, event(
+                envelopes.intent_request('AMAZON.RepeatIntent'), attributes=recipe['sessionAttributes'])))
+            cases.append(('PreviousIntent', locale, apl, event(
+                envelopes.intent_request('AMAZON.PreviousIntent'), attributes=help['sessionAttributes'])))
+            cases.append(('StopIntent', locale, apl, event(
+                envelopes.intent_request('AMAZON.StopIntent'), attributes=recipe['sessionAttributes'])))
+            cases.append(('SessionEndedRequest', locale, apl, event(
+                envelopes.session_ended_request(), attributes=recipe['sessionAttributes'])))
+            if apl:
+                for sauce_id, _, _ in sauces:
+                    cases.append(('UserEvent sauceInstructions', locale, apl, event(
+                        envelopes.apl_user_event_request('sauceInstructions', sauce_id),
+                        attributes=launch['sessionAttributes'])))
+                cases.append(('UserEvent goBack', locale, apl, event(
+                    envelopes.apl_user_event_request('goBack'), attributes=help['sessionAttributes'])))
+    return cases
+
+
+def percentile(sorted_values, rate):
+    """
+    Returns the percentile (nearest rank) of sorted values
+    """
+    index = max(0, min(len(sorted_values) - 1, int(round(rate * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def measure_latency(lambda_handler, cases, iterations):
+    """
+    Returns the latencies (ms) of each case name
+    """
+    latencies = {}
+    for _ in range(iterations):
+        for name, _, _, event in cases:
+            start = time.perf_counter()
+            lambda_handler(event, None)
+            latencies.setdefault(name, []).append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def measure_memory(lambda_handler, cases):
+    """
+    Returns the peak memory (KiB) allocated by a request of each case name
+    """
+    peaks = {}
+    tracemalloc.start()
+    try:
+        for name, _, _, event in cases:
+            tracemalloc.reset_peak()
+            current, _ = tracemalloc.get_traced_memory()
+            lambda_handler(event, None)
+            _, peak = tracemalloc.get_traced_memory()
+            peaks[name] = max(peaks.get(name, 0), (peak - current) / 1024.0)
+    finally:
+        tracemalloc.stop()
+    return peaks
+
+
+def summarize(latencies, peaks):
+    """
+    Returns the statistics of each case name
+    """
+    summary = {}
+    for name in sorted(latencies):
+        values = sorted(latencies[name])
+        summary[name] = {
+            'requests': len(values),
+            'p50_ms': round(percentile(values, 0.50), 4),
+            'p95_ms': round(percentile(values, 0.95), 4),
+            'p99_ms': round(percentile(values, 0.99), 4),
+            'throughput_rps': round(len(values) / (sum(values) / 1000), 1),
+            'peak_kib': round(peaks.get(name, 0), 1)
+        }
+    return summary
+
+
+def print_summary(summary, baseline=None):
+    """
+    Prints the statistics table, with the p50/p95 change against a baseline if any
+    """
+    header = "{:<30} {:>8} {:>9} {:>9} {:>9} {:>10} {:>9}".format(
+        'entry point', 'requests', 'p50 ms', 'p95 ms', 'p99 ms', 'req/s', 'peak KiB')
+    if baseline:
+        header += "  {:>8} {:>8}".format('p50 chg', 'p95 chg')
+    print(header)
+    for name, stats in summary.items():
+        line = "{:<30} {requests:>8} {p50_ms:>9.3f} {p95_ms:>9.3f} {p99_ms:>9.3f} {throughput_rps:>10.1f} {peak_kib:>9.1f}".format(
+            name, **stats)
+        if baseline and name in baseline:
+            line += "  {:>+7.1f}% {:>+7.1f}%".format(
+                (stats['p50_ms'] / baseline[name]['p50_ms'] - 1) * 100,
+                (stats['p95_ms'] / baseline[name]['p95_ms'] - 1) * 100)
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=20, help='requests per entry point, locale and device')
+    parser.add_argument('--locales', default=None, help='comma separated locales (default: every model)')
+    parser.add_argument('--output', default=None, help='write the result as json to this file')
+    parser.add_argument('--compare', default=None, help='json result of a previous run to compare with')
+    args = parser.parse_args()
+
+    compare_path = os.path.abspath(args.compare) if args.compare else None
+    output_path = os.path.abspath(args.output) if args.output else None
+    random.seed(0)
+    lambda_function = envelopes.load_skill()
+    models = envelopes.load_models()
+    locales = args.locales.split(',') if args.locales else sorted(models)
+
+    cases = build_cases(lambda_function.lambda_handler, locales, models)
+    # Warm up: first use caches (documents, datasources, recipes)
+    measure_latency(lambda_function.lambda_handler, cases, 1)
+    latencies = measure_latency(lambda_function.lambda_handler, cases, args.iterations)
+    peaks = measure_memory(lambda_function.lambda_handler, cases)
+    summary = summarize(latencies, peaks)
+
+    baseline = None
+    if compare_path:
+        with open(compare_path) as f:
+            baseline = json.load(f)['entry_points']
+    print("python {}  locales {}  iterations {}".format(platform.python_version(), len(locales), args.iterations))
+    print_summary(summary, baseline)
+    errors = envelopes.logged_errors()
+    if errors:
+        print("FAILED: {} requests were not handled successfully".format(errors))
+    if output_path:
+        with open(output_path, 'w') as f:
+            json.dump({
+                'python': platform.python_version(),
+                'locales': locales,
+                'iterations': args.iterations,
+                'entry_points': summary
+            }, f, indent=2, sort_keys=True)
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""
+Benchmark of the S3 presigned URLs of utils.py
+
+Signs the launch screen grid images offline (fake credentials, no network
+call is made to sign a URL) and compares a new S3 client per URL, as before,
+with the container S3 client and the presigned URL cache, the whole grid
+signed in one create_presigned_urls call. Checks that the batch returns the
+URLs of create_presigned_url, and that the cache does not serve the URLs of
+another bucket. Use --stub to replace the S3 client with a stubbed signer.
+
+usage: python benchmarks/presigned_urls.py [--iterations 200] [--stub]
+"""
+import argparse
+import os
+import sys
+import time
+
+import envelopes
+
+# Object names of the launch screen grid images in the skill bucket
+GRID_IMAGES = ['images/{}-sauce-500x500.png'.format(name) for name in (
+    'honey mustard', 'barbecue', 'thousand island', 'pesto', 'tartar', 'pizza', 'cranberry', 'secret')]
+
+
+def stub_signer(bucket_name, object_name, expiration):
+    return 'https://{}.s3.local/{}?X-Amz-Expires={}&X-Amz-Signature=stub'.format(bucket_name, object_name, expiration)
+
+
+def legacy_presigned_url(object_name):
+    """
+    Presigned URL with a new S3 client per call, as create_presigned_url did
+    """
+    import boto3
+    s3_client = boto3.client('s3', config=boto3.session.Config(signature_version='s3v4', s3={'addressing_style': 'path'}))
+    return s3_client.generate_presigned_url('get_object', Params={
+        'Bucket': os.environ.get('S3_PERSISTENCE_BUCKET'), 'Key': object_name}, ExpiresIn=60)
+
+
+def measure(name, function, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        function()
+    elapsed_ms = (time.perf_counter() - start) * 1000 / iterations
+    print("{:<45} {:>10.3f} ms".format(name, elapsed_ms))
+    return elapsed_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=200, help='launch screens signed per measure')
+    parser.add_argument('--stub', action='store_true', help='sign with a stub instead of the S3 client')
+    args = parser.parse_args()
+
+    # Offline signing: boto3 signs locally with any credentials
+    os.environ.setdefault('AWS_ACCESS_KEY_ID', 'BENCHMARK')
+    os.environ.setdefault('AWS_SECRET_ACCESS_KEY', 'BENCHMARK')
+    os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+    os.environ.setdefault('S3_PERSISTENCE_BUCKET', 'sauce-boss-benchmark')
+    envelopes.load_skill()
+    import utils
+
+    signed = []
+
+    def counting_signer(bucket_name, object_name, expiration):
+        signed.append(object_name)
+        if args.stub:
+            return stub_signer(bucket_name, object_name, expiration)
+        return utils.sign_with_s3_client(bucket_name, object_name, expiration)
+    utils.set_url_signer(counting_signer)
+
+    print("grid of {} images, {}".format(len(GRID_IMAGES), 'stubbed signer' if args.stub else 'S3 client'))
+    start = time.perf_counter()
+    urls = utils.create_presigned_urls(GRID_IMAGES)
+    print("{:<45} {:>10.3f} ms".format('first grid (client creation)', (time.perf_counter() - start) * 1000))
+    if not all(urls.values()):
+        print("FAILED: some URLs were not signed")
+        return 1
+    if [utils.create_presigned_url(name) for name in GRID_IMAGES] != [urls[name] for name in GRID_IMAGES]:
+        print("FAILED: create_presigned_url does not return the URLs of the batch")
+        return 1
+
+    if not args.stub:
+        measure('new client per URL (before)', lambda: [legacy_presigned_url(name) for name in GRID_IMAGES],
+                max(1, args.iterations // 20))
+
+    def sign_uncached():
+        utils.PRESIGNED_URLS.clear()
+        return utils.create_presigned_urls(GRID_IMAGES)
+    measure('container client, uncached', sign_uncached, args.iterations)
+
+    del signed[:]
+    measure('cached URLs', lambda: utils.create_presigned_urls(GRID_IMAGES), args.iterations)
+    if signed:
+        print("FAILED: {} URLs were signed again before their expiry".format(len(signed)))
+        return 1
+
+    bucket_name = os.environ['S3_PERSISTENCE_BUCKET']
+    os.environ['S3_PERSISTENCE_BUCKET'] = bucket_name + '-other'
+    try:
+        other_urls = utils.create_presigned_urls(GRID_IMAGES)
+    finally:
+        os.environ['S3_PERSISTENCE_BUCKET'] = bucket_name
+    if len(signed) != len(GRID_IMAGES) or set(other_urls.values()) & set(urls.values()):
+        print("FAILED: URLs of another bucket were served from the cache")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,283 @@
+"""
+Latency benchmark and checks of the request verification of the self-hosted endpoint
+
+Generates a local certificate chain (root, intermediate and an echo-api.amazon.com
+signing certificate), plugs it in verifier_utils with a fetcher simulating the
+download latency, and signs request envelopes with it, without network.
+Checks that forged, stale and wrongly signed requests are rejected, that the
+chain is downloaded once by concurrent requests and again once it expires,
+that a slow download does not hold back the requests of other chain URLs, and
+reports the verification latency with and without the certificate chain cache.
+
+usage: python benchmarks/request_verification.py [--iterations 200] [--fetch-ms 50] [--threads 16] [--json]
+"""
+import argparse
+import base64
+import datetime
+import io
+import json
+import sys
+import threading
+import time
+
+import envelopes
+
+CERT_CHAIN_URL = 'https://s3.amazonaws.com/echo.api/echo-api-cert-benchmark.pem'
+
+
+def _name(common_name):
+    from cryptography import x509
+    from cryptography.x509.oid import NameOID
+    return x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, common_name)])
+
+
+def _certificate(subject, issuer, public_key, issuer_key, not_before, not_after, ca, dns_name=None):
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.x509.oid import ExtendedKeyUsageOID
+    builder = (x509.CertificateBuilder()
+               .subject_name(_name(subject)).issuer_name(_name(issuer))
+               .public_key(public_key).serial_number(x509.random_serial_number())
+               .not_valid_before(not_before).not_valid_after(not_after)
+               .add_extension(x509.BasicConstraints(ca=ca, path_length=None), critical=True)
+               .add_extension(x509.SubjectKeyIdentifier.from_public_key(public_key), critical=False)
+               .add_extension(x509.AuthorityKeyIdentifier.from_issuer_public_key(issuer_key.public_key()),
+                              critical=False)
+               .add_extension(x509.KeyUsage(
+                   digital_signature=not ca, content_commitment=False, key_encipherment=not ca,
+                   data_encipherment=False, key_agreement=False, key_cert_sign=ca, crl_sign=ca,
+                   encipher_only=False, decipher_only=False), critical=True))
+    if dns_name:
+        builder = (builder
+                   .add_extension(x509.SubjectAlternativeName([x509.DNSName(dns_name)]), critical=False)
+                   .add_extension(x509.ExtendedKeyUsage([ExtendedKeyUsageOID.SERVER_AUTH]), critical=False))
+    return builder.sign(issuer_key, hashes.SHA256())
+
+
+def create_chain(now, days=30, dns_name='echo-api.amazon.com'):
+    """
+    Returns (signing private key, PEM chain: signing and intermediate certificates, PEM root)
+    The signing certificate is valid from one day before now for the number of days
+    """
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    start = datetime.datetime.fromtimestamp(now, datetime.timezone.utc) - datetime.timedelta(days=1)
+    root_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    intermediate_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    signing_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    root = _certificate('Benchmark Root', 'Benchmark Root', root_key.public_key(), root_key,
+                        start, start + datetime.timedelta(days=3650), True)
+    intermediate = _certificate('Benchmark Intermediate', 'Benchmark Root', intermediate_key.public_key(), root_key,
+                                start, start + datetime.timedelta(days=365), True)
+    signing = _certificate(dns_name, 'Benchmark Intermediate', signing_key.public_key(), intermediate_key,
+                           start, start + datetime.timedelta(days=days), False, dns_name)
+    pem = b''.join(certificate.public_bytes(serialization.Encoding.PEM) for certificate in (signing, intermediate))
+    return signing_key, pem, root.public_bytes(serialization.Encoding.PEM)
+
+
+def sign(signing_key, body):
+    """
+    Returns the Signature-256 header value of a request body
+    """
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import padding
+    return base64.b64encode(signing_key.sign(body, padding.PKCS1v15(), hashes.SHA256())).decode('ascii')
+
+
+class Fetcher(object):
+    """
+    Certificate chain fetcher returning a PEM chain after a simulated download latency
+    """
+
+    def __init__(self, pem, fetch_ms):
+        self.pem = pem
+        self.fetch_ms = fetch_ms
+        self.fetches = 0
+
+    def __call__(self, url):
+        self.fetches += 1
+        time.sleep(self.fetch_ms / 1000.0)
+        return self.pem
+
+
+def signed_body(locale='en-US', timestamp=None):
+    """
+    Returns a LaunchRequest envelope body with a timestamp (now by default)
+    """
+    event = envelopes.envelope(envelopes.launch_request(), locale, new=True)
+    event['request']['timestamp'] = (timestamp or datetime.datetime.now(datetime.timezone.utc)).strftime(
+        '%Y-%m-%dT%H:%M:%SZ')
+    return json.dumps(event).encode('utf-8')
+
+
+def call_application(server, body, headers):
+    """
+    Returns the HTTP status of a request handled by the WSGI application of the server module
+    """
+    environ = {'REQUEST_METHOD': 'POST', 'CONTENT_LENGTH': str(len(body)), 'wsgi.input': io.BytesIO(body)}
+    for name, value in headers.items():
+        environ['HTTP_' + name.upper().replace('-', '_')] = value
+    statuses = []
+    server.application(environ, lambda status, response_headers: statuses.append(status))
+    return int(statuses[0].split()[0])
+
+
+def measure(function, iterations):
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        function()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return sorted(latencies)
+
+
+def percentile(sorted_values, rate):
+    index = max(0, min(len(sorted_values) - 1, int(round(rate * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def run_checks(verifier_utils, server, signing_key, pem, root, fetch_ms, threads):
+    """
+    Returns the list of (check name, passed)
+    """
+    checks = []
+    now = time.time()
+    body = signed_body()
+    headers = {'SignatureCertChainUrl': CERT_CHAIN_URL, 'Signature-256': sign(signing_key, body)}
+
+    def rejected(function):
+        try:
+            function()
+        except verifier_utils.VerificationError:
+            return True
+        return False
+
+    fetcher = Fetcher(pem, fetch_ms)
+    verifier_utils.set_cert_chain_fetcher(fetcher, trusted_roots=root)
+    checks.append(('signed request accepted', call_application(server, body, headers) == 200))
+    checks.append(('unsigned request rejected', call_application(server, body, {}) == 400))
+    checks.append(('tampered body rejected', call_application(server, body.replace(b'en-US', b'fr-FR'), headers) == 400))
+    stale = signed_body(timestamp=datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(minutes=5))
+    checks.append(('stale timestamp rejected', call_application(
+        server, stale, dict(headers, **{'Signature-256': sign(signing_key, stale)})) == 400))
+    for url in ('http://s3.amazonaws.com/echo.api/echo-api-cert.pem',
+                'https://notamazon.com/echo.api/echo-api-cert.pem',
+                'https://s3.amazonaws.com/EcHo.aPi/echo-api-cert.pem',
+                'https://s3.amazonaws.com:563/echo.api/echo-api-cert.pem',
+                'https://s3.amazonaws.com/invalid/../echo.api/../echo-api-cert.pem'):
+        checks.append(('certificate chain URL rejected: ' + url,
+                       rejected(lambda: verifier_utils.normalize_cert_chain_url(url))))
+    checks.append(('normalized certificate chain URL accepted', verifier_utils.normalize_cert_chain_url(
+        'HTTPS://s3.AmazonAWS.com:443/echo.api/../echo.api/echo-api-cert.pem') ==
+        'https://s3.amazonaws.com/echo.api/echo-api-cert.pem'))
+
+    # Chains signed by an untrusted root, for another domain, or expired
+    other_key, other_pem, _ = create_chain(now)
+    verifier_utils.set_cert_chain_fetcher(Fetcher(other_pem, 0), trusted_roots=root)
+    checks.append(('untrusted root rejected', rejected(lambda: verifier_utils.verify_signature(
+        {'SignatureCertChainUrl': CERT_CHAIN_URL, 'Signature-256': sign(other_key, body)}, body))))
+    domain_key, domain_pem, domain_root = create_chain(now, dns_name='example.com')
+    verifier_utils.set_cert_chain_fetcher(Fetcher(domain_pem, 0), trusted_roots=domain_root)
+    checks.append(('other domain rejected', rejected(lambda: verifier_utils.verify_signature(
+        {'SignatureCertChainUrl': CERT_CHAIN_URL, 'Signature-256': sign(domain_key, body)}, body))))
+    verifier_utils.set_cert_chain_fetcher(Fetcher(pem, 0), trusted_roots=root)
+    checks.append(('expired chain rejected', rejected(lambda: verifier_utils.verify_signature(
+        headers, body, now=now + 31 * 24 * 3600))))
+
+    # Concurrent requests on a cold cache: one download
+    fetcher = Fetcher(pem, fetch_ms)
+    verifier_utils.set_cert_chain_fetcher(fetcher, trusted_roots=root)
+    errors = []
+
+    def verify():
+        try:
+            verifier_utils.verify_signature(headers, body)
+        except Exception as e:
+            errors.append(e)
+
+    workers = [threading.Thread(target=verify) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    checks.append(('concurrent requests verified', not errors))
+    checks.append(('chain downloaded once by concurrent requests', fetcher.fetches == 1))
+
+    # A slow download does not hold back the requests of the other chain URLs
+    slow_url = CERT_CHAIN_URL.replace('.pem', '-slow.pem')
+    slow_fetcher = Fetcher(pem, max(fetch_ms, 50) * 4)
+    verifier_utils.set_cert_chain_fetcher(
+        lambda url: slow_fetcher(url) if url == slow_url else pem, trusted_roots=root)
+    verifier_utils.verify_signature(headers, body)
+    download = threading.Thread(target=verifier_utils.get_signing_key, args=(slow_url, now))
+    download.start()
+    while not slow_fetcher.fetches:
+        time.sleep(0.001)
+    start = time.perf_counter()
+    verifier_utils.verify_signature(headers, body)
+    verifier_utils.get_signing_key(CERT_CHAIN_URL.replace('.pem', '-other.pem'), now)
+    waited_ms = (time.perf_counter() - start) * 1000
+    download.join()
+    checks.append(('other chain URLs verified during a slow download', waited_ms < slow_fetcher.fetch_ms / 2))
+
+    # Short-lived chain: downloaded again once expired
+    short_key, short_pem, short_root = create_chain(now, days=2)
+    fetcher = Fetcher(short_pem, 0)
+    verifier_utils.set_cert_chain_fetcher(fetcher, trusted_roots=short_root)
+    short_headers = {'SignatureCertChainUrl': CERT_CHAIN_URL, 'Signature-256': sign(short_key, body)}
+    verifier_utils.verify_signature(short_headers, body, now=now)
+    verifier_utils.verify_signature(short_headers, body, now=now + 3600)
+    cached = fetcher.fetches == 1
+    expired = rejected(lambda: verifier_utils.verify_signature(short_headers, body, now=now + 2 * 24 * 3600))
+    checks.append(('expired chain evicted and downloaded again', cached and expired and fetcher.fetches == 2))
+    return checks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=200, help='verifications per measure')
+    parser.add_argument('--fetch-ms', type=float, default=50, help='simulated certificate chain download latency')
+    parser.add_argument('--threads', type=int, default=16, help='concurrent requests on a cold cache')
+    parser.add_argument('--json', action='store_true', help='print the result as json')
+    args = parser.parse_args()
+
+    envelopes.load_skill()
+    import server
+    import verifier_utils
+    server.VERIFY_REQUESTS = True
+
+    signing_key, pem, root = create_chain(time.time())
+    checks = run_checks(verifier_utils, server, signing_key, pem, root, args.fetch_ms, args.threads)
+
+    body = signed_body()
+    headers = {'SignatureCertChainUrl': CERT_CHAIN_URL, 'Signature-256': sign(signing_key, body)}
+    verifier_utils.set_cert_chain_fetcher(Fetcher(pem, args.fetch_ms), trusted_roots=root)
+
+    def uncached():
+        verifier_utils.CERT_CHAINS.clear()
+        verifier_utils.verify_signature(headers, body)
+
+    uncached_ms = measure(uncached, max(1, args.iterations // 10))
+    cached_ms = measure(lambda: verifier_utils.verify_signature(headers, body), args.iterations)
+    result = {
+        'fetch_ms': args.fetch_ms,
+        'uncached_p50_ms': round(percentile(uncached_ms, 0.50), 3),
+        'uncached_p99_ms': round(percentile(uncached_ms, 0.99), 3),
+        'cached_p50_ms': round(percentile(cached_ms, 0.50), 3),
+        'cached_p99_ms': round(percentile(cached_ms, 0.99), 3),
+        'checks': {name: passed for name, passed in checks}
+    }
+
+    if args.json:
+        print(json.dumps(result, indent=2, sort_keys=True))
+    else:
+        print("simulated download {fetch_ms} ms".format(**result))
+        print("uncached chain: p50 {uncached_p50_ms:.3f} ms  p99 {uncached_p99_ms:.3f} ms".format(**result))
+        print("cached chain:   p50 {cached_p50_ms:.3f} ms  p99 {cached_p99_ms:.3f} ms".format(**result))
+        for name, passed in checks:
+            print("{:<6} {}".format('ok' if passed else 'FAILED', name))
+    return 0 if all(passed for _, passed in checks) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
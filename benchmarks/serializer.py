@@ -0,0 +1,144 @@
+"""
+Response serialization benchmark: skill serializer against the SDK default serializer
+
+Builds the response envelopes of every entry point, every locale of models/
+and both APL and voice-only devices with the response builder (templates
+disabled, so that every response is a model graph), then serializes each one
+with serializer_utils.SkillSerializer and ask_sdk_core DefaultSerializer.
+Checks that both produce the same JSON (and that serializer_utils.dumps, which
+splices the serialized documents, produces the same compact JSON text), and
+reports the serialization time, the peak memory and the memory blocks
+allocated per response.
+
+usage: python benchmarks/serializer.py [--iterations 50] [--locales en-US,fr-FR] [--json]
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+import envelopes
+import handler_latency
+
+
+def build_responses(lambda_function, locales, models):
+    """
+    Returns the list of (case name, response envelope model) of the skill
+    """
+    from ask_sdk_model import RequestEnvelope
+    skill = lambda_function.sb.get_skill()
+    responses = []
+    for name, _, _, event in handler_latency.build_cases(lambda_function.lambda_handler, locales, models):
+        request_envelope = skill.serializer.deserialize(json.dumps(event), RequestEnvelope)
+        responses.append((name, skill.invoke(request_envelope, None)))
+    return responses
+
+
+def measure_time(serializer, responses, iterations):
+    """
+    Returns the serialization times (ms) of each case name
+    """
+    times = {}
+    for _ in range(iterations):
+        for name, response_envelope in responses:
+            start = time.perf_counter()
+            serializer.serialize(response_envelope)
+            times.setdefault(name, []).append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def measure_memory(serializer, responses):
+    """
+    Returns the (peak KiB, allocated blocks) of the serialization of each case name
+    The blocks are the ones still allocated after the serialization (the serialized response)
+    """
+    memory = {}
+    tracemalloc.start()
+    try:
+        for name, response_envelope in responses:
+            before = tracemalloc.take_snapshot()
+            tracemalloc.reset_peak()
+            current, _ = tracemalloc.get_traced_memory()
+            serialized = serializer.serialize(response_envelope)
+            _, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+            blocks = sum(stat.count_diff for stat in after.compare_to(before, 'filename'))
+            del serialized
+            peak_kib, max_blocks = memory.get(name, (0, 0))
+            memory[name] = (max(peak_kib, (peak - current) / 1024.0), max(max_blocks, blocks))
+    finally:
+        tracemalloc.stop()
+    return memory
+
+
+def summarize(times, memory):
+    summary = {}
+    for name in sorted(times):
+        values = sorted(times[name])
+        summary[name] = {
+            'p50_ms': round(handler_latency.percentile(values, 0.50), 4),
+            'mean_ms': round(sum(values) / len(values), 4),
+            'peak_kib': round(memory[name][0], 1),
+            'blocks': memory[name][1]
+        }
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=50, help='serializations per entry point, locale and device')
+    parser.add_argument('--locales', default=None, help='comma separated locales (default: every model)')
+    parser.add_argument('--json', action='store_true', help='print the result as json')
+    args = parser.parse_args()
+
+    random.seed(0)
+    lambda_function = envelopes.load_skill()
+    import template_utils
+    import serializer_utils
+    from ask_sdk_core.serialize import DefaultSerializer
+    template_utils.TEMPLATES_ENABLED = False
+    models = envelopes.load_models()
+    locales = args.locales.split(',') if args.locales else sorted(models)
+    responses = build_responses(lambda_function, locales, models)
+
+    serializers = {'default': DefaultSerializer(), 'skill': serializer_utils.SkillSerializer()}
+    mismatches = []
+    for name, response_envelope in responses:
+        expected = json.dumps(serializers['default'].serialize(response_envelope), ensure_ascii=False)
+        serialized = serializers['skill'].serialize(response_envelope)
+        if json.dumps(serialized, ensure_ascii=False) != expected:
+            mismatches.append(name)
+        # Serialized documents spliced as is by the self-hosted endpoint
+        if serializer_utils.dumps(serialized) != json.dumps(serialized, separators=(',', ':'), ensure_ascii=False):
+            mismatches.append(name)
+
+    result = {'python': platform.python_version(), 'responses': len(responses), 'iterations': args.iterations,
+              'mismatches': len(mismatches), 'serializers': {}}
+    for serializer_name, serializer in serializers.items():
+        # Warm up: first use of the fields tables
+        measure_time(serializer, responses, 1)
+        result['serializers'][serializer_name] = summarize(
+            measure_time(serializer, responses, args.iterations), measure_memory(serializer, responses))
+
+    if args.json:
+        print(json.dumps(result, indent=2, sort_keys=True))
+    else:
+        print("python {python}  responses {responses}  iterations {iterations}".format(**result))
+        default, skill = result['serializers']['default'], result['serializers']['skill']
+        print("{:<30} {:>10} {:>10} {:>8} {:>10} {:>10} {:>8} {:>8}".format(
+            'entry point', 'default ms', 'skill ms', 'speedup', 'def KiB', 'skill KiB', 'def blk', 'skl blk'))
+        for name in default:
+            print("{:<30} {:>10.4f} {:>10.4f} {:>7.1f}x {:>10.1f} {:>10.1f} {:>8} {:>8}".format(
+                name, default[name]['p50_ms'], skill[name]['p50_ms'],
+                default[name]['p50_ms'] / skill[name]['p50_ms'] if skill[name]['p50_ms'] else 0,
+                default[name]['peak_kib'], skill[name]['peak_kib'], default[name]['blocks'], skill[name]['blocks']))
+    for name in sorted(set(mismatches)):
+        print("FAILED: {} skill serializer output differs from the default serializer".format(name))
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
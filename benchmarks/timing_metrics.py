@@ -0,0 +1,132 @@
+"""
+Overhead benchmark of the timing metrics (TIMING_METRICS)
+
+Runs the lambda handler on the requests of handler_latency.py (every entry
+point, APL and voice-only devices) in two fresh processes, with the timing
+metrics disabled and enabled, and reports the mean latency per request and
+the overhead of the metrics. With the metrics enabled, checks that every
+invocation writes one Embedded Metric Format line with the Device dimension,
+its handler and interceptor timings, and prints the mean time of each metric.
+
+usage: python benchmarks/timing_metrics.py [--iterations 20] [--locales en-US,fr-FR] [--json]
+"""
+import argparse
+import io
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+import envelopes
+import handler_latency
+
+# Stages recorded for every invocation
+REQUIRED_METRICS = ('Deserialization', 'RequestLogger', 'LocalizationInterceptor', 'Dispatch', 'ResponseLogger',
+                    'Serialization', 'Invocation')
+
+
+def run_child(iterations, locales):
+    """
+    Measures the handler in this process, with the TIMING_METRICS setting of the environment
+    Returns the mean latency (ms), and the EMF lines checks and metric means when enabled
+    """
+    random.seed(0)
+    lambda_function = envelopes.load_skill()
+    import metrics_utils
+    stream = io.StringIO()
+    metrics_utils.METRICS_STREAM[0] = stream
+    models = envelopes.load_models()
+    cases = handler_latency.build_cases(lambda_function.lambda_handler, locales, models)
+    handler_latency.measure_latency(lambda_function.lambda_handler, cases, 1)
+    stream.seek(0)
+    stream.truncate()
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for _, _, _, event in cases:
+            lambda_function.lambda_handler(event, None)
+    elapsed = time.perf_counter() - start
+    requests = iterations * len(cases)
+    result = {'enabled': metrics_utils.METRICS_ENABLED, 'requests': requests,
+              'mean_ms': round(elapsed * 1000 / requests, 4)}
+    if metrics_utils.METRICS_ENABLED:
+        lines = stream.getvalue().splitlines()
+        invalid = 0
+        sums = {}
+        for line in lines:
+            record = json.loads(line)
+            definitions = record['_aws']['CloudWatchMetrics'][0]
+            names = [metric['Name'] for metric in definitions['Metrics']]
+            if (definitions['Dimensions'] != [['Device']] or record['Device'] not in ('apl', 'voice')
+                    or any(name not in names for name in REQUIRED_METRICS) or not names[-1] == 'Invocation'):
+                invalid += 1
+            for name in names:
+                value = record[name]
+                if not isinstance(value, dict):
+                    value = {'Sum': value, 'Count': 1}
+                sums.setdefault(name, [0.0, 0])
+                sums[name][0] += value['Sum']
+                sums[name][1] += value['Count']
+        result.update(lines=len(lines), invalid_lines=invalid,
+                      metrics={name: round(total / count, 4) for name, (total, count) in sums.items()})
+    return result
+
+
+def spawn(enabled, iterations, locales):
+    env = dict(os.environ, TIMING_METRICS='true' if enabled else 'false')
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', '--iterations', str(iterations),
+                             '--locales', ','.join(locales)], env=env, capture_output=True, text=True, check=True)
+    return json.loads(output.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=20, help='requests per entry point, locale and device')
+    parser.add_argument('--locales', default=None, help='comma separated locales (default: every model)')
+    parser.add_argument('--json', action='store_true', help='print the result as json')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    locales = args.locales.split(',') if args.locales else sorted(envelopes.load_models())
+    if args.child:
+        print(json.dumps(run_child(args.iterations, locales)))
+        return 0
+
+    disabled = spawn(False, args.iterations, locales)
+    enabled = spawn(True, args.iterations, locales)
+    result = {
+        'requests': disabled['requests'],
+        'disabled_mean_ms': disabled['mean_ms'],
+        'enabled_mean_ms': enabled['mean_ms'],
+        'overhead_ms': round(enabled['mean_ms'] - disabled['mean_ms'], 4),
+        'overhead_rate': round(enabled['mean_ms'] / disabled['mean_ms'] - 1, 4),
+        'emf_lines': enabled['lines'],
+        'invalid_emf_lines': enabled['invalid_lines'],
+        'metrics_mean_ms': enabled['metrics']
+    }
+
+    if args.json:
+        print(json.dumps(result, indent=2, sort_keys=True))
+    else:
+        print("requests {requests}  disabled {disabled_mean_ms:.4f} ms  enabled {enabled_mean_ms:.4f} ms  "
+              "overhead {overhead_ms:+.4f} ms ({0:+.1f}%)".format(result['overhead_rate'] * 100, **result))
+        print("EMF lines {emf_lines}  invalid {invalid_emf_lines}".format(**result))
+        print("{:<40} {:>10}".format('metric', 'mean ms'))
+        for name, mean in result['metrics_mean_ms'].items():
+            print("{:<40} {:>10.4f}".format(name, mean))
+
+    failed = False
+    if result['emf_lines'] != result['requests']:
+        print("FAILED: {} EMF lines for {} invocations".format(result['emf_lines'], result['requests']))
+        failed = True
+    if result['invalid_emf_lines']:
+        print("FAILED: {} EMF lines without the Device dimension or the stage metrics".format(
+            result['invalid_emf_lines']))
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,271 @@
+"""
+Locale-wide throughput test on a corpus generated from the interaction models
+
+Expands every sample utterance of models/ (intent and slot elicitation
+samples) with every value and synonym of its LIST_OF_ITEMS slots, resolved
+to their sauce id as Alexa entity resolution does (AMAZON.SearchQuery slots
+get the sample ingredients of the language), plus one launch request and one
+request per built-in intent. Each utterance is sent from a voice-only device
+and from an APL device, the viewport cycling through envelopes.APL_VIEWPORTS,
+in new and ongoing sessions alternately. Request envelopes do not carry the
+utterance: the corpus weights each request as often as the utterances
+which trigger it.
+
+The envelopes are generated lazily, one at a time, while the lambda handler
+handles them. A request fails when the skill logs an error, answers without
+speech, or answers a matched sauce without the recipe card or, on an APL
+device, without the recipe document. Reports the throughput and the failure
+rate per locale, and the failing intents. Fails when the skill logs an error
+or raises an exception on any request, and when the failure rate of a locale
+is higher than --max-failure-rate. --dump writes the corpus as json lines
+instead (locale, device, intent, utterance and envelope).
+
+usage: python benchmarks/utterance_corpus.py [--locales en-US,fr-FR] [--devices apl,voice]
+                                             [--max-failure-rate 0.01] [--dump corpus.jsonl] [--json]
+"""
+import argparse
+import itertools
+import json
+import re
+import sys
+import time
+
+import envelopes
+
+# Slot placeholder of a sample utterance (ex: "how about {Item}")
+SLOT_PATTERN = re.compile(r'\{(\w+)\}')
+
+# Device of the requests without APL
+VOICE_DEVICE = 'voice'
+
+# APL viewport profiles of the APL requests, by request index
+APL_DEVICES = tuple(envelopes.APL_VIEWPORTS)
+
+
+def get_slot_fillers(model, slot_type, language):
+    """
+    Returns the (spoken value, sauce id, resolved value) spoken for a slot type
+    Values of the custom slot types are resolved to their id, AMAZON.SearchQuery is not resolved
+    """
+    if slot_type == 'AMAZON.SearchQuery':
+        return [(envelopes.SAMPLE_INGREDIENTS[language], None, None)]
+    fillers = []
+    for value_id, value, synonyms in envelopes.get_slot_values(model, slot_type):
+        fillers.append((value, value_id, value))
+        fillers.extend((synonym, value_id, value) for synonym in synonyms)
+    return fillers
+
+
+def slot(name, slot_type, filler=None):
+    """
+    Returns the slot of an intent request, with the entity resolution block of custom slot types
+    """
+    result = {'name': name, 'confirmationStatus': 'NONE'}
+    if filler is None:
+        return result
+    spoken, value_id, value = filler
+    result.update(value=spoken, source='USER')
+    if not slot_type.startswith('AMAZON.'):
+        authority = 'amzn1.er-authority.echo-sdk.{}.{}'.format(envelopes.APPLICATION_ID, slot_type)
+        if value_id:
+            resolution = {
+                'authority': authority,
+                'status': {'code': 'ER_SUCCESS_MATCH'},
+                'values': [{'value': {'name': value, 'id': value_id}}]
+            }
+        else:
+            resolution = {'authority': authority, 'status': {'code': 'ER_SUCCESS_NO_MATCH'}}
+        result['resolutions'] = {'resolutionsPerAuthority': [resolution]}
+    return result
+
+
+def iter_utterances(model, language):
+    """
+    Yields the (request, intent name, utterance, filled slots) of an interaction model
+    The filled slots are the (spoken value, sauce id, resolved value) by slot name
+    """
+    yield envelopes.launch_request(), 'LaunchRequest', 'open ' + model['invocationName'], {}
+    fillers = {}
+    for intent in model['intents']:
+        slot_types = {intent_slot['name']: intent_slot['type'] for intent_slot in intent.get('slots', [])}
+        samples = list(intent.get('samples', []))
+        for intent_slot in intent.get('slots', []):
+            samples.extend(intent_slot.get('samples', []))
+        if not samples:
+            # Built-in intents have the utterances of Alexa
+            yield envelopes.intent_request(intent['name']), intent['name'], intent['name'], {}
+            continue
+        for sample in samples:
+            names = SLOT_PATTERN.findall(sample)
+            for slot_type in set(slot_types[name] for name in names):
+                if slot_type not in fillers:
+                    fillers[slot_type] = get_slot_fillers(model, slot_type, language)
+            for values in itertools.product(*(fillers[slot_types[name]] for name in names)):
+                filled = dict(zip(names, values))
+                utterance = SLOT_PATTERN.sub(lambda match: filled[match.group(1)][0], sample)
+                slots = {name: slot(name, slot_type, filled.get(name)) for name, slot_type in slot_types.items()}
+                yield envelopes.intent_request(intent['name'], slots), intent['name'], utterance, filled
+
+
+def iter_corpus(models, locales, devices=('apl', 'voice')):
+    """
+    Yields the (locale, device, intent name, utterance, filled slots, event) of the corpus, one at a time
+    The device is VOICE_DEVICE or the APL viewport profile
+    """
+    index = 0
+    for locale in locales:
+        for request, intent_name, utterance, filled in iter_utterances(models[locale], locale[:2]):
+            for device in devices:
+                apl = device == 'apl'
+                device_name = APL_DEVICES[index % len(APL_DEVICES)] if apl else VOICE_DEVICE
+                event = envelopes.envelope(request, locale, apl=apl, new=index % 2 == 0,
+                                           viewport=envelopes.APL_VIEWPORTS[device_name] if apl else None)
+                yield locale, device_name, intent_name, utterance, filled, event
+                index += 1
+
+
+def check_response(device, intent_name, filled, response_envelope):
+    """
+    Returns why a response is wrong, None if it is right
+    Recipes are spoken by the APL document (SpeakItem command) on APL devices
+    """
+    response = response_envelope['response']
+    if intent_name == 'RecipeIntent' and any(value_id for _, value_id, _ in filled.values()):
+        if 'card' not in response:
+            return 'recipe not found'
+        if device != VOICE_DEVICE:
+            directives = set(directive['type'] for directive in response.get('directives', []))
+            if 'Alexa.Presentation.APL.RenderDocument' not in directives:
+                return 'no recipe document'
+            if 'Alexa.Presentation.APL.ExecuteCommands' not in directives:
+                return 'no speech'
+            return None
+    if 'outputSpeech' not in response:
+        return 'no speech'
+    return None
+
+
+def run(lambda_handler, corpus):
+    """
+    Handles the corpus with the lambda handler
+    Returns the results by locale: requests, handler time, failures, errors (logged or raised),
+    failures by reason and intent, failure examples
+    """
+    results = {}
+    for locale, device, intent_name, utterance, filled, event in corpus:
+        result = results.get(locale)
+        if result is None:
+            result = results[locale] = {'requests': 0, 'seconds': 0.0, 'failures': 0, 'errors': 0,
+                                        'reasons': {}, 'examples': []}
+        errors = envelopes.logged_errors()
+        start = time.perf_counter()
+        try:
+            response_envelope = lambda_handler(event, None)
+        except Exception as e:
+            response_envelope = None
+            reason = 'exception {}'.format(type(e).__name__)
+            result['errors'] += 1
+        result['seconds'] += time.perf_counter() - start
+        result['requests'] += 1
+        if response_envelope is not None:
+            if envelopes.logged_errors() != errors:
+                reason = 'error logged'
+                result['errors'] += 1
+            else:
+                reason = check_response(device, intent_name, filled, response_envelope)
+        if reason:
+            result['failures'] += 1
+            key = '{} {}'.format(intent_name, reason)
+            result['reasons'][key] = result['reasons'].get(key, 0) + 1
+            if len(result['examples']) < 3:
+                result['examples'].append('{} ({}): {}'.format(utterance, device, reason))
+    return results
+
+
+def summarize(results):
+    summary = {}
+    for locale, result in results.items():
+        summary[locale] = {
+            'requests': result['requests'],
+            'requests_per_second': round(result['requests'] / result['seconds'], 1),
+            'mean_ms': round(result['seconds'] * 1000 / result['requests'], 4),
+            'failures': result['failures'],
+            'errors': result['errors'],
+            'failure_rate': round(result['failures'] / result['requests'], 4),
+            'failing': result['reasons'],
+            'examples': result['examples']
+        }
+    requests = sum(result['requests'] for result in results.values())
+    seconds = sum(result['seconds'] for result in results.values())
+    failures = sum(result['failures'] for result in results.values())
+    errors = sum(result['errors'] for result in results.values())
+    summary['all'] = {
+        'requests': requests,
+        'requests_per_second': round(requests / seconds, 1),
+        'mean_ms': round(seconds * 1000 / requests, 4),
+        'failures': failures,
+        'errors': errors,
+        'failure_rate': round(failures / requests, 4)
+    }
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--locales', default=None, help='comma separated locales (default: every model)')
+    parser.add_argument('--devices', default='apl,voice', help='comma separated devices: apl, voice')
+    parser.add_argument('--max-failure-rate', type=float, default=None,
+                        help='fail if the failure rate of a locale is higher')
+    parser.add_argument('--dump', default=None, help='write the corpus to a json lines file instead of running it')
+    parser.add_argument('--json', action='store_true', help='print the result as json')
+    args = parser.parse_args()
+
+    models = envelopes.load_models()
+    locales = args.locales.split(',') if args.locales else sorted(models)
+    devices = tuple(args.devices.split(','))
+    corpus = iter_corpus(models, locales, devices)
+
+    if args.dump:
+        count = 0
+        with open(args.dump, 'w', encoding='utf-8') as f:
+            for locale, device, intent_name, utterance, _, event in corpus:
+                f.write(json.dumps({'locale': locale, 'device': device, 'intent': intent_name,
+                                    'utterance': utterance, 'envelope': event}, ensure_ascii=False) + '\n')
+                count += 1
+        print("{} envelopes written to {}".format(count, args.dump))
+        return 0
+
+    lambda_function = envelopes.load_skill()
+    summary = summarize(run(lambda_function.lambda_handler, corpus))
+
+    if args.json:
+        print(json.dumps(summary, indent=2, sort_keys=True, ensure_ascii=False))
+    else:
+        print("{:<8} {:>9} {:>10} {:>9} {:>9} {:>8}".format('locale', 'requests', 'req/s', 'mean ms', 'failures',
+                                                            'rate'))
+        for locale, result in summary.items():
+            print("{:<8} {requests:>9} {requests_per_second:>10.1f} {mean_ms:>9.4f} {failures:>9} "
+                  "{failure_rate:>8.2%}".format(locale, **result))
+        for locale in locales:
+            for reason, count in sorted(summary[locale]['failing'].items()):
+                print("{:<8} {:>6} x {}".format(locale, count, reason))
+            for example in summary[locale]['examples']:
+                print("{:<8}   ex: {}".format(locale, example))
+
+    failed = False
+    for locale in locales:
+        if summary[locale]['errors']:
+            print("FAILED: {} {} requests logged an error or raised an exception".format(
+                locale, summary[locale]['errors']))
+            failed = True
+    if args.max_failure_rate is not None:
+        for locale in locales:
+            if summary[locale]['failure_rate'] > args.max_failure_rate:
+                print("FAILED: {} failure rate {:.2%} > {:.2%}".format(
+                    locale, summary[locale]['failure_rate'], args.max_failure_rate))
+                failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,13 +1,16 @@
+import os
+import re
 import json
-import recipes
 import prompts
 import recipe_utils
+import asset_utils
+import language_utils
+import metrics_utils
+import serializer_utils
+import session_utils
 
-import ask_sdk_core as Alexa
-from ask_sdk_model.interfaces.alexa.presentation.apl import (
-    RenderDocumentDirective, ExecuteCommandsDirective, SpeakItemCommand, HighlightMode
-)
-from ask_sdk_core.utils import (get_supported_interfaces)
+from ask_sdk_core.exceptions import AskSdkException
+from ask_sdk_core.utils import (get_supported_interfaces, viewport)
 
 
 def _load_apl_document(file_path):
@@ -18,12 +21,213 @@ def _load_apl_document(file_path):
         return json.load(f)
 
 
-APL_DOCS = {
-    'launch': _load_apl_document('./documents/launchRequest.json'),
-    'recipe': _load_apl_document('./documents/recipeIntent.json'),
-    'help': _load_apl_document('./documents/helpIntent.json')
+APL_DOC_FILES = {
+    'launch': './documents/launchRequest.json',
+    'recipe': './documents/recipeIntent.json',
+    'help': './documents/helpIntent.json'
 }
 
+# APL documents, loaded on first use
+APL_DOCS = {}
+
+
+def get_apl_document(name):
+    """
+    Returns the apl document dict object, loading it on first use (from the asset bundle if any)
+    """
+    document = APL_DOCS.get(name)
+    if document is None:
+        document = asset_utils.get_asset('apl_documents', name)
+        if document is None:
+            document = _load_apl_document(APL_DOC_FILES[name])
+        APL_DOCS[name] = document
+    return document
+
+# APL documents delivery modes
+#   - inline: the document is embedded and serialized again in every response
+#   - serialized: the document is embedded, but serialized only once per container
+#   - link: the response references the document saved in the APL authoring tool
+#           (Developer Console) under its versioned name
+APL_DOC_DELIVERY_INLINE = 'inline'
+APL_DOC_DELIVERY_SERIALIZED = 'serialized'
+APL_DOC_DELIVERY_LINK = 'link'
+
+# Versioned names of the documents saved in the APL authoring tool
+# Save a new version under a new name when the document changes
+APL_DOC_LINK_NAMES = {
+    'launch': 'sauceBossLaunch_v1',
+    'recipe': 'sauceBossRecipe_v1',
+    'help': 'sauceBossHelp_v1'
+}
+
+
+def _load_apl_doc_delivery(setting):
+    """
+    Returns the delivery mode of each APL document
+    Modes can be selected per document with the APL_DOC_DELIVERY environment variable
+    example: "launch=link,help=inline" (documents not listed are serialized once)
+    """
+    delivery = {name: APL_DOC_DELIVERY_SERIALIZED for name in APL_DOC_FILES.keys()}
+    for entry in setting.split(','):
+        if not entry.strip():
+            continue
+        name, _, mode = entry.partition('=')
+        name, mode = name.strip(), mode.strip()
+        if name not in delivery or mode not in (
+                APL_DOC_DELIVERY_INLINE, APL_DOC_DELIVERY_SERIALIZED, APL_DOC_DELIVERY_LINK):
+            raise ValueError("Invalid APL document delivery: {}".format(entry))
+        delivery[name] = mode
+    return delivery
+
+
+def _get_apl_doc_reference(name, mode, viewport_profile=None):
+    """
+    Returns the value of the document property of RenderDocumentDirective
+    """
+    if mode == APL_DOC_DELIVERY_LINK:
+        return {
+            'type': 'Link',
+            'src': 'doc://alexa/apl/documents/{}'.format(APL_DOC_LINK_NAMES[name])
+        }
+    document = get_apl_document(name)
+    if viewport_profile is not None:
+        document = prune_apl_document(document, viewport_profile)
+    if mode == APL_DOC_DELIVERY_SERIALIZED:
+        return serializer_utils.SerializedDocument(document)
+    return document
+
+
+APL_DOC_DELIVERY = _load_apl_doc_delivery(os.environ.get('APL_DOC_DELIVERY', ''))
+
+# Values of the document property of RenderDocumentDirective, keyed by (document name, viewport profile)
+# Computed on first use
+APL_DOC_REFERENCES = {}
+
+
+def get_apl_document_reference(name, viewport_profile=None):
+    """
+    Returns the document to add to RenderDocumentDirective, in its delivery mode
+    The embedded documents are pruned for the viewport profile, if any (see get_viewport_profile)
+    """
+    if APL_DOC_DELIVERY[name] == APL_DOC_DELIVERY_LINK:
+        viewport_profile = None
+    key = (name, viewport_profile)
+    reference = APL_DOC_REFERENCES.get(key)
+    if reference is None:
+        reference = _get_apl_doc_reference(name, APL_DOC_DELIVERY[name], viewport_profile)
+        APL_DOC_REFERENCES[key] = reference
+    return reference
+
+# APL viewport profiles the documents are pruned for, by SDK viewport profile
+# The other devices (mobiles, TVs other than XLarge, unknown viewports) get the full documents,
+# as the SDK profile of their viewport may differ from the one of the alexa-viewport-profiles package
+PRUNED_VIEWPORT_PROFILES = {
+    'HUB_ROUND_SMALL': 'hubRoundSmall',
+    'HUB_LANDSCAPE_SMALL': 'hubLandscapeSmall',
+    'HUB_LANDSCAPE_MEDIUM': 'hubLandscapeMedium',
+    'HUB_LANDSCAPE_LARGE': 'hubLandscapeLarge',
+    'TV_LANDSCAPE_XLARGE': 'tvLandscapeXLarge'
+}
+
+# Closed ranges of the viewport width and height (dp) of the APL viewport profiles the documents are pruned for
+# Some SDK profiles have no upper bound (ex: a 1920x1080 hub, as the Echo Show 15, is HUB_LANDSCAPE_LARGE for
+# the SDK and hubLandscapeXLarge for APL): viewports out of the ranges of their profile get the full documents
+VIEWPORT_PROFILE_RANGES = {
+    'hubRoundSmall': ((100, 599), (100, 599)),
+    'hubLandscapeSmall': ((960, 1279), (100, 599)),
+    'hubLandscapeMedium': ((960, 1279), (600, 959)),
+    'hubLandscapeLarge': ((1280, 1919), (600, 959)),
+    'tvLandscapeXLarge': ((960, 960), (540, 540))
+}
+
+
+def _load_apl_doc_pruning(setting):
+    """
+    Returns whether the APL documents are pruned for the viewport of the device
+    """
+    return setting.strip().lower() not in ('0', 'false', 'no', 'off')
+
+
+# Set with the APL_DOC_PRUNING environment variable ("false" sends the full documents to every device)
+APL_DOC_PRUNING = _load_apl_doc_pruning(os.environ.get('APL_DOC_PRUNING', 'true'))
+
+
+def get_viewport_profile(handler_input):
+    """
+    Returns the APL viewport profile of the User's device (ex: "hubLandscapeSmall") the documents
+    are pruned for, None to send the full documents
+    """
+    if not APL_DOC_PRUNING:
+        return None
+    try:
+        profile = viewport.get_viewport_profile(handler_input.request_envelope)
+        viewport_state = handler_input.request_envelope.context.viewport
+        # Size of the viewport in dp, as the when conditions are evaluated by the device
+        width = int(viewport_state.current_pixel_width) * 160 / int(viewport_state.dpi)
+        height = int(viewport_state.current_pixel_height) * 160 / int(viewport_state.dpi)
+    except (TypeError, ValueError, ZeroDivisionError, AskSdkException):
+        # Incomplete viewport state
+        return None
+    viewport_profile = PRUNED_VIEWPORT_PROFILES.get(profile.name)
+    if viewport_profile is None:
+        return None
+    (min_width, max_width), (min_height, max_height) = VIEWPORT_PROFILE_RANGES[viewport_profile]
+    if not (min_width <= width <= max_width and min_height <= height <= max_height):
+        return None
+    return viewport_profile
+
+
+# Conditions resolved when pruning: comparisons of the viewport profile, joined by || or &&
+# example: "${@viewportProfile == @hubLandscapeSmall || @viewportProfile == @hubLandscapeMedium}"
+_VIEWPORT_PROFILE_TERM = re.compile(r'^@viewportProfile\s*(==|!=)\s*@(\w+)$')
+
+
+def resolve_viewport_condition(condition, viewport_profile):
+    """
+    Returns the value of a when condition for the viewport profile,
+    None if the condition does not only depend on the viewport profile
+    """
+    if not isinstance(condition, str):
+        return None
+    condition = condition.strip()
+    if not (condition.startswith('${') and condition.endswith('}')):
+        return None
+    expression = condition[2:-1]
+    if '||' in expression and '&&' in expression:
+        return None
+    operator = '&&' if '&&' in expression else '||'
+    values = []
+    for term in expression.split(operator):
+        match = _VIEWPORT_PROFILE_TERM.match(term.strip())
+        if match is None:
+            return None
+        values.append((viewport_profile == match.group(2)) == (match.group(1) == '=='))
+    return all(values) if operator == '&&' else any(values)
+
+
+def prune_apl_document(value, viewport_profile):
+    """
+    Returns a copy of an APL document without the parts whose when condition is false for the
+    viewport profile: array items (resources, components, commands, style values) are removed,
+    and the conditions found true are dropped. Other conditions are kept as is
+    """
+    if isinstance(value, dict):
+        pruned = {}
+        for key, item in value.items():
+            if key == 'when' and resolve_viewport_condition(item, viewport_profile):
+                continue
+            pruned[key] = prune_apl_document(item, viewport_profile)
+        return pruned
+    if isinstance(value, list):
+        return [prune_apl_document(item, viewport_profile) for item in value
+                if not (isinstance(item, dict)
+                        and resolve_viewport_condition(item.get('when'), viewport_profile) is False)]
+    return value
+
+# Sauces displayed on the Launch and Help Screens, in display order
+SAUCES_IDS_TO_DISPLAY = ("HON", "BBQ", "THO", "PES",
+                         "TAR", "PIZ", "CRA", "SEC")
+
 
 def supports_apl(handler_input):
     """
@@ -41,12 +245,23 @@ def launch_screen(handler_input):
     # Only add APL directive if User's device supports APL
     if(supports_apl(handler_input)):
         handler_input.response_builder.add_directive(
-            RenderDocumentDirective(
-                token="launchToken",
-                document=APL_DOCS['launch'],
-                datasources=generateLaunchScreenDatasource(handler_input)
-            )
-        )
+            launch_screen_directive(handler_input.request_envelope.request.locale,
+                                    handler_input.attributes_manager.request_attributes["_"],
+                                    get_hint_text(handler_input),
+                                    get_viewport_profile(handler_input)))
+
+
+def launch_screen_directive(locale, data, hint_text, viewport_profile=None):
+    """
+    Returns the RenderDocumentDirective of the Launch Screen (APL Template)
+    """
+    # APL models are only imported when the device supports APL
+    from ask_sdk_model.interfaces.alexa.presentation.apl import RenderDocumentDirective
+    return RenderDocumentDirective(
+        token="launchToken",
+        document=get_apl_document_reference('launch', viewport_profile),
+        datasources=generateLaunchScreenDatasource(locale, data, hint_text)
+    )
 
 
 def helpScreen(handler_input):
@@ -56,12 +271,32 @@ def helpScreen(handler_input):
     # Only add APL directive if User's device supports APL
     if(supports_apl(handler_input)):
         handler_input.response_builder.add_directive(
-            RenderDocumentDirective(
-                token="helpScreen",
-                document=APL_DOCS['help'],
-                datasources=generateHelpScreenDatasource(handler_input)
-            )
-        )
+            help_screen_directive(handler_input.request_envelope.request.locale,
+                                  handler_input.attributes_manager.request_attributes["_"],
+                                  handler_input.request_envelope.session.new,
+                                  get_viewport_profile(handler_input)))
+
+
+def help_screen_directive(locale, data, session_new, viewport_profile=None):
+    """
+    Returns the RenderDocumentDirective of the Help Screen (APL Template)
+    """
+    # APL models are only imported when the device supports APL
+    from ask_sdk_model.interfaces.alexa.presentation.apl import RenderDocumentDirective
+    return RenderDocumentDirective(
+        token="helpScreen",
+        document=get_apl_document_reference('help', viewport_profile),
+        datasources=generateHelpScreenDatasource(locale, data, session_new)
+    )
+
+
+def get_hint_text(handler_input):
+    """
+    Returns the hint of the screens, with a random sauce name
+    """
+    data = handler_input.attributes_manager.request_attributes["_"]
+    random_sauce = recipe_utils.get_random_recipe(handler_input)
+    return data[prompts.HINT_TEMPLATE].format(random_sauce.name)
 
 
 def recipeScreen(handler_input, sauce_item, selected_recipe):
@@ -71,14 +306,18 @@ def recipeScreen(handler_input, sauce_item, selected_recipe):
     data = handler_input.attributes_manager.request_attributes["_"]
     # Get prompt and reprompt speech
     reprompt_output = data[prompts.RECIPE_REPEAT_MESSAGE]
-    speak_output = selected_recipe['instructions'] + " " + data[prompts.RECIPE_NOT_FOUND_REPROMPT]
+    speak_output = selected_recipe.instructions + " " + data[prompts.RECIPE_NOT_FOUND_REPROMPT]
     # Only add APL directive if User's device supports APL
     if(supports_apl(handler_input)):
+        # APL models are only imported when the device supports APL
+        from ask_sdk_model.interfaces.alexa.presentation.apl import (
+            RenderDocumentDirective, ExecuteCommandsDirective, SpeakItemCommand, HighlightMode
+        )
         # Add APL Template amd Command (Speak Item to sync. Voice/Text)
         handler_input.response_builder.add_directive(
             RenderDocumentDirective(
                 token="sauce-boss",
-                document=APL_DOCS['recipe'],
+                document=get_apl_document_reference('recipe', get_viewport_profile(handler_input)),
                 datasources=generateRecipeScreenDatasource(
                     handler_input, sauce_item, selected_recipe)
             )).add_directive(
@@ -91,29 +330,85 @@ def recipeScreen(handler_input, sauce_item, selected_recipe):
                     ]
                 )
         )
-        # As speech will be done by APL Command (SpeakItem) Voice/Text sync
-        # Save prompt and reprompt for repeat
-        session_attributes = handler_input.attributes_manager.session_attributes
-        session_attributes['speak_output'] = speak_output
-        session_attributes['reprompt_output'] = reprompt_output
     else:
         # As APL is not supported by device
         # Provide prompt & reprompt instead of APL Karaoke
         handler_input.response_builder.speak(speak_output).ask(reprompt_output)
+    # Save prompt and reprompt for repeat, as speech may be done by APL Command (SpeakItem)
+    session_utils.set_last_utterance(
+        handler_input,
+        [[session_utils.RECIPE_INSTRUCTIONS_MESSAGE, sauce_item['id']], [prompts.RECIPE_NOT_FOUND_REPROMPT]],
+        [[prompts.RECIPE_NOT_FOUND_REPROMPT]])
 
 
-def generateRecipeScreenDatasource(handler_input, sauce_item, selected_recipe):
+def recipeStepScreen(handler_input, sauce_item, selected_recipe, step):
+    """
+    Adds a step of the Recipe Screen (APL Template) to Response, or its speech if the device does not support APL
+    The step is followed by the next step prompt, or the last step message
+    The step cursor is kept in session for AMAZON.NextIntent and AMAZON.PreviousIntent
+    """
+    data = handler_input.attributes_manager.request_attributes["_"]
+    step = min(step, len(selected_recipe.steps) - 1)
+    if(step == len(selected_recipe.steps) - 1):
+        prompt_messages = [[prompts.RECIPE_LAST_STEP_MESSAGE], [prompts.RECIPE_NOT_FOUND_REPROMPT]]
+        reprompt_messages = [[prompts.RECIPE_NOT_FOUND_REPROMPT]]
+    else:
+        prompt_messages = [[prompts.RECIPE_NEXT_STEP_PROMPT]]
+        reprompt_messages = [[prompts.RECIPE_NEXT_STEP_PROMPT]]
+    prompt_output = " ".join(data[message[0]] for message in prompt_messages)
+    reprompt_output = data[reprompt_messages[0][0]]
+    if(supports_apl(handler_input)):
+        from ask_sdk_model.interfaces.alexa.presentation.apl import (
+            RenderDocumentDirective, ExecuteCommandsDirective, SpeakItemCommand, HighlightMode
+        )
+        # Only the step is displayed and read (Speak Item), followed by the prompt
+        handler_input.response_builder.add_directive(
+            RenderDocumentDirective(
+                token="sauce-boss",
+                document=get_apl_document_reference('recipe', get_viewport_profile(handler_input)),
+                datasources=generateRecipeScreenDatasource(
+                    handler_input, sauce_item, selected_recipe, step, prompt_output)
+            )).add_directive(
+                ExecuteCommandsDirective(
+                    token="sauce-boss",
+                    commands=[
+                        SpeakItemCommand(
+                            component_id="recipeText",
+                            highlight_mode=HighlightMode.line)
+                    ]
+                )
+        )
+    else:
+        handler_input.response_builder.speak(
+            selected_recipe.steps[step] + " " + prompt_output).ask(reprompt_output)
+    session_state = session_utils.get_session_state(handler_input)
+    session_state.step = [sauce_item['id'], step]
+    # Save prompt and reprompt for repeat, as speech may be done by APL Command (SpeakItem)
+    session_utils.set_last_utterance(
+        handler_input,
+        [[session_utils.RECIPE_STEP_MESSAGE, sauce_item['id'], step]] + prompt_messages,
+        reprompt_messages)
+    return handler_input.response_builder.response
+
+
+@metrics_utils.timed()
+def generateRecipeScreenDatasource(handler_input, sauce_item, selected_recipe, step=None, prompt_output=None):
     """
     Compute the JSON Datasource associated to APL Recipe Screen
+    With a step, only the step is displayed, and read followed by the prompt
     """
     data = handler_input.attributes_manager.request_attributes["_"]
     # Get a random sauce name for hint
-    random_sauce = recipe_utils.get_random_recipe(handler_input)
-    # Define header title and hint
+    hint_text = get_hint_text(handler_input)
+    # Define header title
     header_title = data[prompts.RECIPE_HEADER_TITLE].format(
-        selected_recipe['name'])
-    hint_text = data[prompts.HINT_TEMPLATE].format(random_sauce['name'])
-    sauce_ssml = "<speak>{}</speak>".format(selected_recipe['instructions'])
+        selected_recipe.name)
+    sauce_text = selected_recipe.instructions
+    sauce_ssml = selected_recipe.ssml
+    if(step is not None):
+        header_title = "{} {}/{}".format(header_title, step + 1, len(selected_recipe.steps))
+        sauce_text = selected_recipe.steps[step]
+        sauce_ssml = "<speak>{} {}</speak>".format(sauce_text, prompt_output)
     # Generate JSON Datasource
     return {
         'sauceBossData': {
@@ -123,7 +418,7 @@ def generateRecipeScreenDatasource(handler_input, sauce_item, selected_recipe):
                 'headerBackButton': (not handler_input.request_envelope.session.new),
                 'hintText': hint_text,
                 'sauceImg': sauce_item['image'],
-                'sauceText': selected_recipe['instructions'],
+                'sauceText': sauce_text,
                 'sauceSsml': sauce_ssml
             },
             'transformers': [
@@ -141,76 +436,115 @@ def generateRecipeScreenDatasource(handler_input, sauce_item, selected_recipe):
     }
 
 
-def generateLaunchScreenDatasource(handler_input):
+@metrics_utils.timed()
+def generateLaunchScreenDatasource(locale, data, hint_text):
     """
     Compute the JSON Datasource associated to APL Launch Screen
     """
-    data = handler_input.attributes_manager.request_attributes["_"]
-    print(str(data))
-    # Get random recipe name for hint
-    random_recipe = recipe_utils.get_random_recipe(handler_input)
-    # Define header title nad hint
-    header_title = data[prompts.HEADER_TITLE].format(data[prompts.SKILL_NAME])
-    hint_text = data[prompts.HINT_TEMPLATE].format(random_recipe['name'])
-    # Define sauces to be displayed
-    saucesIdsToDisplay = ["BBQ", "CRA", "HON",
-                          "PES", "PIZ", "TAR", "THO", "SEC"]
-    locale = handler_input.request_envelope.request.locale
-    all_recipes = recipe_utils.get_locale_specific_recipes(locale)
-    sauces = []
-    for k in all_recipes.keys():
-        if(k in saucesIdsToDisplay):
-            sauces.append({
-                'id': k,
-                'image': recipe_utils.get_sauce_image(k),
-                'text': all_recipes[k]['name']
-            })
+    # Get the static part of the datasource
+    skeleton = _get_datasource_skeleton(locale, 'launch', data)
     # Generate JSON Datasource
     return {
         'sauceBossData': {
             'type': 'object',
             'properties': {
-                'headerTitle': header_title,
+                'headerTitle': skeleton['headerTitle'],
                 'hintText': hint_text,
-                'items': sauces
+                'items': skeleton['items']
             },
-            'transformers': [
-                {
-                    'inputPath': 'hintText',
-                    'transformer': 'textToHint'
-                }
-            ]
+            'transformers': skeleton['transformers']
         }
     }
 
 
-def generateHelpScreenDatasource(handler_input):
+@metrics_utils.timed()
+def generateHelpScreenDatasource(locale, data, session_new):
     """
     Compute the JSON Datasource associated to APL Help Screen
     """
-    data = handler_input.attributes_manager.request_attributes["_"]
+    # Get the static part of the datasource
+    skeleton = _get_datasource_skeleton(locale, 'help', data)
+    # Generate JSON Datasource
+    return {
+        'sauceBossData': {
+            'headerTitle': skeleton['headerTitle'],
+            'headerSubtitle': skeleton['headerSubtitle'],
+            'headerBackButton': (not session_new),
+            'items': skeleton['items']
+        }
+    }
+
+
+def _get_datasource_skeleton(locale, screen, data):
+    """
+    Returns the static part of a screen datasource for a locale
+    Skeletons are computed on first use and cached for the container lifetime, by registry locale
+    They are shared between requests and must not be mutated
+    """
+    registry_locale = language_utils.get_registry_locale(locale)
+    key = (registry_locale, screen)
+    skeleton = _DATASOURCE_SKELETONS.get(key)
+    if skeleton is None:
+        skeleton = _DATASOURCE_BUILDERS[screen](registry_locale, data)
+        _DATASOURCE_SKELETONS[key] = skeleton
+    return skeleton
+
+
+def _build_launch_screen_skeleton(locale, data):
+    """
+    Compute the static part of the APL Launch Screen datasource
+    """
+    # Define header title
+    header_title = data[prompts.HEADER_TITLE].format(data[prompts.SKILL_NAME])
+    all_recipes = recipe_utils.get_locale_specific_recipes(locale)
+    sauces = []
+    for sauce_id in SAUCES_IDS_TO_DISPLAY:
+        if(sauce_id in all_recipes):
+            recipe = all_recipes[sauce_id]
+            sauces.append({
+                'id': recipe.id,
+                'image': recipe.image,
+                'text': recipe.name
+            })
+    return {
+        'headerTitle': header_title,
+        'items': sauces,
+        'transformers': [
+            {
+                'inputPath': 'hintText',
+                'transformer': 'textToHint'
+            }
+        ]
+    }
+
+
+def _build_help_screen_skeleton(locale, data):
+    """
+    Compute the static part of the APL Help Screen datasource
+    """
     # Define header and sub titles
     header_title = data[prompts.HELP_HEADER_TITLE]
     header_subtitle = data[prompts.HELP_HEADER_SUBTITLE]
-    # Define sauces to be displayed
-    saucesIdsToDisplay = ["BBQ", "CRA", "HON",
-                          "PES", "PIZ", "TAR", "THO", "SEC"]
-    locale = handler_input.request_envelope.request.locale
-    # Get recipes
     all_recipes = recipe_utils.get_locale_specific_recipes(locale)
     sauces = []
-    for k in all_recipes.keys():
-        if(k in saucesIdsToDisplay):
+    for sauce_id in SAUCES_IDS_TO_DISPLAY:
+        if(sauce_id in all_recipes):
+            recipe = all_recipes[sauce_id]
             sauces.append({
-                'id': k,
-                'primaryText': data[prompts.HINT_TEMPLATE].format(all_recipes[k]['name'])
+                'id': recipe.id,
+                'primaryText': data[prompts.HINT_TEMPLATE].format(recipe.name)
             })
-    # Generate JSON Datasource
     return {
-        'sauceBossData': {
-            'headerTitle': header_title,
-            'headerSubtitle': header_subtitle,
-            'headerBackButton': (not handler_input.request_envelope.session.new),
-            'items': sauces
-        }
+        'headerTitle': header_title,
+        'headerSubtitle': header_subtitle,
+        'items': sauces
     }
+
+
+_DATASOURCE_BUILDERS = {
+    'launch': _build_launch_screen_skeleton,
+    'help': _build_help_screen_skeleton
+}
+
+# Datasource skeletons cache, keyed by (registry locale, screen): one entry per strings table and screen
+_DATASOURCE_SKELETONS = {}
@@ -0,0 +1,94 @@
+import os
+import sys
+import marshal
+import hashlib
+import logging
+
+logger = logging.getLogger("main")
+logger.setLevel(logging.INFO)
+
+# Version of the bundle content layout, checked when the bundle is loaded
+BUNDLE_FORMAT_VERSION = 2
+
+# Bundle header: magic, format version, marshal version and sha256 of the content, on the first line
+BUNDLE_MAGIC = b'sauce-boss-assets'
+
+# Sections of the bundle
+#   - language_strings: language_strings.json
+#   - recipes: recipes dictionaries by language (recipes package)
+#   - recipe_steps: steps of the recipes by language and recipe id (step_utils.split_steps)
+#   - recipe_images: image urls by recipe id (recipe_utils.RECIPE_IMAGES)
+#   - apl_documents: APL documents by name (apl_utils.APL_DOC_FILES)
+#   - sauce_names: sauce_names.json
+BUNDLE_SECTIONS = ('language_strings', 'recipes', 'recipe_steps', 'recipe_images', 'apl_documents', 'sauce_names')
+
+
+def dumps_bundle(assets):
+    """
+    Returns the bundle bytes of the assets: a header line and the marshal data of the sections
+    Only JSON compatible values (dict, list, str, int, float, bool, None) are bundled
+    """
+    content = marshal.dumps({section: assets[section] for section in BUNDLE_SECTIONS})
+    header = b' '.join((BUNDLE_MAGIC, str(BUNDLE_FORMAT_VERSION).encode(), str(marshal.version).encode(),
+                        hashlib.sha256(content).hexdigest().encode()))
+    return header + b'\n' + content
+
+
+def loads_bundle(data):
+    """
+    Returns the (sections dictionary, content sha256) of bundle bytes
+    Raises a ValueError if the bundle is corrupted, or built with another format or marshal version
+    """
+    header, _, content = data.partition(b'\n')
+    fields = header.split(b' ')
+    if len(fields) != 4 or fields[0] != BUNDLE_MAGIC:
+        raise ValueError("Not an asset bundle")
+    if fields[1] != str(BUNDLE_FORMAT_VERSION).encode() or fields[2] != str(marshal.version).encode():
+        raise ValueError("Unsupported asset bundle version: {}".format(header.decode('ascii', 'replace')))
+    digest = hashlib.sha256(content).hexdigest()
+    if fields[3] != digest.encode():
+        raise ValueError("Corrupted asset bundle")
+    return marshal.loads(content), digest
+
+
+def load_bundle(file_path):
+    """
+    Returns the sections of the bundle file read in one go, None if there is none or it cannot be used
+    (the assets are then loaded from their source files)
+    """
+    if not file_path:
+        return None
+    try:
+        with open(file_path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    try:
+        bundle, digest = loads_bundle(data)
+    except (ValueError, EOFError, TypeError) as e:
+        logger.warning("Ignoring asset bundle %s: %s", file_path, e)
+        return None
+    logger.debug("Loaded asset bundle %s (%s, python %s)", file_path, digest[:12], sys.version.split()[0])
+    return bundle
+
+
+# Built with tools/build_asset_bundle.py, set with the ASSET_BUNDLE_FILE environment variable
+# (ex: "assets.bundle"). Empty by default: the assets are loaded from their source files, so
+# the content edited and deployed without rebuilding the bundle is the one served
+ASSET_BUNDLE_FILE = os.environ.get('ASSET_BUNDLE_FILE', '')
+
+# Loaded once per container (cold start)
+BUNDLE = load_bundle(ASSET_BUNDLE_FILE)
+
+
+def get_asset(section, key=None):
+    """
+    Returns a bundled asset (a section, or one of its entries), None if there is no bundle
+    Bundled assets are shared by every request and must not be mutated
+    """
+    if BUNDLE is None:
+        return None
+    assets = BUNDLE[section]
+    if key is None:
+        return assets
+    return assets.get(key)
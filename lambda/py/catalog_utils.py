@@ -0,0 +1,210 @@
+import os
+import logging
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger("main")
+logger.setLevel(logging.INFO)
+
+# Version of the SQLite catalog schema, checked when the catalog file is opened
+SQLITE_SCHEMA_VERSION = 1
+
+SQLITE_SCHEMA = (
+    "CREATE TABLE metadata (key TEXT PRIMARY KEY, value TEXT NOT NULL) WITHOUT ROWID",
+    "CREATE TABLE languages (language TEXT PRIMARY KEY, count INTEGER NOT NULL) WITHOUT ROWID",
+    "CREATE TABLE recipes (language TEXT NOT NULL, id TEXT NOT NULL, position INTEGER NOT NULL, "
+    "name TEXT NOT NULL, instructions TEXT NOT NULL, PRIMARY KEY (language, id)) WITHOUT ROWID",
+    "CREATE UNIQUE INDEX recipes_position ON recipes (language, position)",
+    "CREATE TABLE images (id TEXT PRIMARY KEY, url TEXT NOT NULL) WITHOUT ROWID"
+)
+
+
+class MemoryCatalogBackend(object):
+    """
+    Catalog backend reading the recipes dictionaries by language (ex: recipes.translations)
+    and the image urls by recipe id, held in memory
+    """
+
+    def __init__(self, translations, images):
+        self.translations = translations
+        self.images = images
+        self._ids = {}
+
+    def _get_ids(self, language):
+        ids = self._ids.get(language)
+        if ids is None:
+            ids = tuple(self.translations[language])
+            self._ids[language] = ids
+        return ids
+
+    def count(self, language):
+        """
+        Returns the number of recipes of a language
+        """
+        return len(self._get_ids(language))
+
+    def get_id(self, language, position):
+        """
+        Returns the id of the recipe at a position (0 to count - 1) of a language
+        """
+        return self._get_ids(language)[position]
+
+    def iter_ids(self, language):
+        """
+        Returns an iterator on the recipe ids of a language, in the catalog order
+        """
+        return iter(self._get_ids(language))
+
+    def get_recipe(self, language, recipe_id):
+        """
+        Returns the (name, instructions) of a recipe of a language, None if it does not exist
+        """
+        recipe = self.translations[language].get(recipe_id)
+        if recipe is None:
+            return None
+        return recipe['name'], recipe['instructions']
+
+    def iter_recipes(self, language):
+        """
+        Returns an iterator on the (id, name, instructions) of the recipes of a language
+        """
+        for recipe_id, recipe in self.translations[language].items():
+            yield recipe_id, recipe['name'], recipe['instructions']
+
+    def get_image(self, recipe_id):
+        """
+        Returns the image url of a recipe, None if it has none
+        """
+        return self.images.get(recipe_id)
+
+
+class SqliteCatalogBackend(object):
+    """
+    Catalog backend reading a read-only SQLite catalog file (see write_sqlite_catalog)
+    Only the counts of the languages in use are kept in memory, recipes are read on demand
+    Each thread reads the file with its own connection, opened on first use
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self._local = threading.local()
+        self._counts = {}
+
+    def _connect(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            # sqlite3 is only imported when the catalog is stored in a file
+            import sqlite3
+            from urllib.parse import quote
+            uri = 'file:{}?mode=ro&immutable=1'.format(quote(self.file_path))
+            connection = sqlite3.connect(uri, uri=True)
+            version = connection.execute("SELECT value FROM metadata WHERE key = 'version'").fetchone()
+            if version is None or int(version[0]) != SQLITE_SCHEMA_VERSION:
+                connection.close()
+                raise ValueError("Unsupported recipe catalog schema in {}".format(self.file_path))
+            self._local.connection = connection
+        return connection
+
+    def count(self, language):
+        count = self._counts.get(language)
+        if count is None:
+            row = self._connect().execute(
+                "SELECT count FROM languages WHERE language = ?", (language,)).fetchone()
+            if row is None:
+                raise KeyError(language)
+            count = row[0]
+            self._counts[language] = count
+        return count
+
+    def get_id(self, language, position):
+        row = self._connect().execute(
+            "SELECT id FROM recipes WHERE language = ? AND position = ?", (language, position)).fetchone()
+        if row is None:
+            raise IndexError(position)
+        return row[0]
+
+    def iter_ids(self, language):
+        rows = self._connect().execute(
+            "SELECT id FROM recipes WHERE language = ? ORDER BY position", (language,))
+        return (row[0] for row in rows)
+
+    def get_recipe(self, language, recipe_id):
+        return self._connect().execute(
+            "SELECT name, instructions FROM recipes WHERE language = ? AND id = ?", (language, recipe_id)).fetchone()
+
+    def iter_recipes(self, language):
+        return self._connect().execute(
+            "SELECT id, name, instructions FROM recipes WHERE language = ? ORDER BY position", (language,))
+
+    def get_image(self, recipe_id):
+        row = self._connect().execute("SELECT url FROM images WHERE id = ?", (recipe_id,)).fetchone()
+        return row[0] if row else None
+
+
+def write_sqlite_catalog(file_path, languages, iter_recipes, images):
+    """
+    Writes a SQLite catalog file, replacing any existing one
+        - languages: language codes (ex: 'en')
+        - iter_recipes: function returning the (id, name, instructions) of the recipes of a language
+        - images: image url by recipe id
+    """
+    import sqlite3
+    if os.path.exists(file_path):
+        os.remove(file_path)
+    connection = sqlite3.connect(file_path)
+    try:
+        with connection:
+            for statement in SQLITE_SCHEMA:
+                connection.execute(statement)
+            connection.execute("INSERT INTO metadata VALUES ('version', ?)", (str(SQLITE_SCHEMA_VERSION),))
+            for language in languages:
+                count = 0
+                for position, (recipe_id, name, instructions) in enumerate(iter_recipes(language)):
+                    connection.execute("INSERT INTO recipes VALUES (?, ?, ?, ?, ?)",
+                                       (language, recipe_id, position, name, instructions))
+                    count += 1
+                connection.execute("INSERT INTO languages VALUES (?, ?)", (language, count))
+            connection.executemany("INSERT INTO images VALUES (?, ?)", sorted(images.items()))
+        connection.execute("VACUUM")
+    finally:
+        connection.close()
+
+
+class LRUCache(object):
+    """
+    Dictionary keeping the most recently used values, up to max_size
+    It can be shared by threads, the values order is updated under a lock
+    """
+    __slots__ = ('max_size', '_values', '_lock')
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._values = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._values.get(key)
+            if value is not None:
+                self._values.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._values[key] = value
+            self._values.move_to_end(key)
+            if len(self._values) > self.max_size:
+                self._values.popitem(last=False)
+
+    def __len__(self):
+        return len(self._values)
+
+
+def create_backend(file_path, translations, images):
+    """
+    Returns the SQLite backend of a catalog file if any, otherwise the in-memory backend
+    """
+    if file_path:
+        logger.debug("Recipe catalog file: %s", file_path)
+        return SqliteCatalogBackend(file_path)
+    return MemoryCatalogBackend(translations, images)
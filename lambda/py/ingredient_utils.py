@@ -0,0 +1,196 @@
+import logging
+import unicodedata
+import recipe_utils
+import resolver_utils
+
+logger = logging.getLogger("main")
+logger.setLevel(logging.INFO)
+
+# Max number of sauces suggested for a list of ingredients
+MAX_SEARCH_RESULTS = 3
+
+# Words which are not ingredients, removed from the recipes and the spoken ingredients (normalized)
+STOP_WORDS = {
+    'en': frozenset(('a', 'an', 'and', 'the', 'with', 'or', 'in', 'of', 'to', 'for', 'some', 'plus', 'sauce')),
+    'fr': frozenset(('et', 'ou', 'avec', 'de', 'du', 'des', 'la', 'le', 'les', 'l', 'd', 'un', 'une', 'au', 'aux',
+                     'en', 'a', 'sauce')),
+    'es': frozenset(('y', 'e', 'o', 'con', 'de', 'del', 'la', 'el', 'los', 'las', 'un', 'una', 'en', 'a', 'al',
+                     'salsa')),
+    'pt': frozenset(('e', 'ou', 'com', 'de', 'do', 'da', 'dos', 'das', 'o', 'a', 'os', 'as', 'um', 'uma', 'em',
+                     'no', 'na', 'molho')),
+    'de': frozenset(('und', 'oder', 'mit', 'der', 'die', 'das', 'den', 'dem', 'des', 'ein', 'eine', 'einer',
+                     'einem', 'einen', 'etwas', 'sauce', 'sosse')),
+    'it': frozenset(('e', 'ed', 'o', 'con', 'di', 'del', 'della', 'dei', 'delle', 'il', 'lo', 'la', 'i', 'gli',
+                     'le', 'l', 'un', 'una', 'uno', 'in', 'salsa')),
+    'hi': frozenset(('और', 'या', 'के', 'की', 'का', 'को', 'में', 'मैं', 'से', 'एक', 'साथ', 'सॉस'))
+}
+
+# Languages written without spaces: words are runs of a script, indexed by character bigrams
+UNSEGMENTED_LANGUAGES = frozenset(('ja',))
+
+# Languages whose plural is mostly a final "s", removed from the words
+PLURAL_S_LANGUAGES = frozenset(('en', 'fr', 'es', 'pt'))
+
+
+def _split_words(text):
+    """
+    Returns the words of a text separated by spaces and punctuation, letters and marks are kept
+    """
+    words = []
+    start = None
+    for position, char in enumerate(text):
+        if unicodedata.category(char)[0] in 'LMN':
+            if start is None:
+                start = position
+        elif start is not None:
+            words.append(text[start:position])
+            start = None
+    if start is not None:
+        words.append(text[start:])
+    return words
+
+
+def _get_script(char):
+    """
+    Returns the script class of a japanese character: katakana, kanji or other letters
+    Hiragana (particles and verb endings), punctuation and spaces have no class
+    """
+    if '\u30a1' <= char <= '\u30ff':
+        return 'katakana'
+    if '\u4e00' <= char <= '\u9fff' or char == '\u3005':
+        return 'kanji'
+    if '\u3040' <= char <= '\u309f':
+        return None
+    if unicodedata.category(char)[0] in 'LN':
+        return 'other'
+    return None
+
+
+def _split_script_runs(text):
+    """
+    Returns the runs of characters of the same script class of a japanese text
+    (ex: "レモン汁と塩" -> ["レモン", "汁", "塩"])
+    """
+    runs = []
+    start = None
+    script = None
+    for position, char in enumerate(text):
+        char_script = _get_script(char)
+        if char_script != script:
+            if script is not None:
+                runs.append(text[start:position])
+            start = position
+            script = char_script
+    if script is not None:
+        runs.append(text[start:])
+    return runs
+
+
+def tokenize(text, language):
+    """
+    Returns the normalized terms of a text (recipe instructions or spoken ingredients)
+    Stop words are removed, as well as the plural "s" of some languages
+    """
+    if language in UNSEGMENTED_LANGUAGES:
+        words = _split_script_runs(unicodedata.normalize('NFKC', text))
+    else:
+        words = _split_words(text)
+    stop_words = STOP_WORDS.get(language, frozenset())
+    terms = []
+    for word in words:
+        term = resolver_utils.normalize(word)
+        if not term or term in stop_words or term.isdigit():
+            continue
+        if language in PLURAL_S_LANGUAGES and len(term) > 3 and term[-1] == 's' and term[-2] != 's':
+            term = term[:-1]
+        terms.append(term)
+    return terms
+
+
+def get_term_grams(term, language):
+    """
+    Returns the index keys of a term: the term itself, or for unsegmented languages its
+    character bigrams and its characters (ex: "マスタード" is found in "イエローマスタード")
+    """
+    if language not in UNSEGMENTED_LANGUAGES:
+        return (term,)
+    grams = [term[i:i + 2] for i in range(len(term) - 1)]
+    if len(term) == 1 or _get_script(term[0]) == 'kanji':
+        grams.extend(term)
+    return grams
+
+
+class IngredientIndex(object):
+    """
+    Inverted index of the recipes of a language, built from their (id, name, instructions)
+        - ids: recipe ids, in the order of the recipes (recipe number)
+        - postings: bitset of the recipe numbers containing each index key
+    """
+    __slots__ = ('language', 'ids', 'postings')
+
+    def __init__(self, language, language_recipes):
+        self.language = language
+        ids = []
+        self.postings = {}
+        for number, (recipe_id, _, instructions) in enumerate(language_recipes):
+            ids.append(recipe_id)
+            bit = 1 << number
+            for term in tokenize(instructions, language):
+                for gram in get_term_grams(term, language):
+                    self.postings[gram] = self.postings.get(gram, 0) | bit
+        self.ids = tuple(ids)
+
+    def match(self, term):
+        """
+        Returns the bitset of the recipes containing a term (all of its index keys)
+        """
+        recipes_bitset = -1
+        for gram in get_term_grams(term, self.language):
+            recipes_bitset &= self.postings.get(gram, 0)
+            if not recipes_bitset:
+                return 0
+        return recipes_bitset if recipes_bitset != -1 else 0
+
+    def search(self, text, limit=MAX_SEARCH_RESULTS):
+        """
+        Returns the ids of the recipes containing every spoken ingredient, at most limit, in the recipes order
+        """
+        terms = set(tokenize(text, self.language))
+        if not terms:
+            return []
+        recipes_bitset = -1
+        for term in terms:
+            recipes_bitset &= self.match(term)
+            if not recipes_bitset:
+                return []
+        recipe_ids = []
+        while recipes_bitset and len(recipe_ids) < limit:
+            lowest = recipes_bitset & -recipes_bitset
+            recipe_ids.append(self.ids[lowest.bit_length() - 1])
+            recipes_bitset ^= lowest
+        return recipe_ids
+
+
+# Inverted indexes by language, built on first use
+INGREDIENT_INDEXES = {}
+
+
+def get_ingredient_index(locale):
+    """
+    Returns the IngredientIndex of the recipes of a locale
+    """
+    language = locale[:2]
+    index = INGREDIENT_INDEXES.get(language)
+    if index is None:
+        index = IngredientIndex(language, recipe_utils.CATALOG_BACKEND.iter_recipes(language))
+        INGREDIENT_INDEXES[language] = index
+    return index
+
+
+def search_recipes(locale, ingredients):
+    """
+    Returns the ids of the recipes of a locale containing every ingredient spoken by the user
+    """
+    recipe_ids = get_ingredient_index(locale).search(ingredients)
+    logger.debug("Recipes with %s: %s", ingredients, recipe_ids)
+    return recipe_ids
@@ -7,35 +7,36 @@
 # session persistence, api calls, and more.
 
 import logging
-import json
 import prompts
 import recipe_utils
+import ingredient_utils
 import apl_utils
+import template_utils
+import language_utils
+import serializer_utils
+import skill_utils
+import log_utils
+import session_utils
+import step_utils
 
-from ask_sdk_core.skill_builder import CustomSkillBuilder
-from ask_sdk_core.serialize import DefaultSerializer
 from ask_sdk_core.dispatch_components import (
-    AbstractRequestHandler, AbstractExceptionHandler,
+    AbstractExceptionHandler,
     AbstractResponseInterceptor, AbstractRequestInterceptor
 )
-from ask_sdk_core.utils import is_request_type, is_intent_name
 from ask_sdk_model.ui import StandardCard, Image
-from ask_sdk_model import Response
 
-sb = CustomSkillBuilder()
+sb = skill_utils.SkillBuilder(serializer=serializer_utils.SkillSerializer())
 
 logger = logging.getLogger("main")
 logger.setLevel(logging.INFO)
 
 
-class LaunchRequestIntentHandler(AbstractRequestHandler):
+class LaunchRequestIntentHandler(skill_utils.RoutedRequestHandler):
     """
     Handles LaunchRequest requests sent by Alexa
     Note: this type of request is sent when hte user invokes your skill without providing a specific intent
     """
-
-    def can_handle(self, handler_input):
-        return is_request_type("LaunchRequest")(handler_input)
+    routes = (skill_utils.request_route("LaunchRequest"), skill_utils.intent_route("AMAZON.NavigateHomeIntent"))
 
     def handle(self, handler_input):
         data = handler_input.attributes_manager.request_attributes["_"]
@@ -43,24 +44,24 @@ class LaunchRequestIntentHandler(AbstractRequestHandler):
         random_sauce = recipe_utils.get_random_recipe(handler_input)
         # Get prompt and reprompt speech
         speak_output = data[prompts.WELCOME_MESSAGE].format(
-            data[prompts.SKILL_NAME], random_sauce['name'])
+            data[prompts.SKILL_NAME], random_sauce.name)
         reprompt_output = data[prompts.WELCOME_REPROMPT]
+        # Render the pre-rendered response (with APL Template if device is compatible)
+        template = template_utils.get_template(handler_input, template_utils.LAUNCH)
+        if(template):
+            return template.render(handler_input, speak_output, reprompt_output)
         # Add APL Template if device is compatible
         apl_utils.launch_screen(handler_input)
         # Generate JSON Response
         return handler_input.response_builder.speak(speak_output).ask(reprompt_output).response
 
 
-class RecipeIntentHandler(AbstractRequestHandler):
+class RecipeIntentHandler(skill_utils.RoutedRequestHandler):
     """
     Handles RecipeIntent or APL Touch Event requests sent by Alexa
     """
-
-    def can_handle(self, handler_input):
-        return is_intent_name("RecipeIntent")(handler_input) or \
-            (is_request_type('Alexa.Presentation.APL.UserEvent')(handler_input) and
-                len(list(handler_input.request_envelope.request.arguments)) > 0 and
-                list(handler_input.request_envelope.request.arguments)[0] == 'sauceInstructions')
+    routes = (skill_utils.intent_route("RecipeIntent"),
+              skill_utils.apl_user_event_route("sauceInstructions"))
 
     def handle(self, handler_input):
         # Get slot item
@@ -69,23 +70,30 @@ class RecipeIntentHandler(AbstractRequestHandler):
         # Generate output to include a recipe with or without APL
         return self.generate_recipe_output(handler_input, sauce_item)
 
-    def generate_recipe_output(self, handler_input, sauce_item):
+    def generate_recipe_output(self, handler_input, sauce_item, step=None):
+        """
+        Returns the recipe response of a sauce item, or of one of its steps (guided mode)
+        """
         data = handler_input.attributes_manager.request_attributes["_"]
         locale = handler_input.request_envelope.request.locale
         # Sauce exists
         if(sauce_item['id']):
-            # Load i18n strings
+            # Load localized recipe
             recipes = recipe_utils.get_locale_specific_recipes(locale)
             selected_recipe = recipes[sauce_item['id']]
             # Add image
-            sauce_item['image'] = recipe_utils.get_sauce_image(
-                sauce_item['id'])
-            # Add a card (displayed in the Alexa app)
-            cardTitle = data[prompts.DISPLAY_CARD_TITLE].format(
-                data[prompts.SKILL_NAME], selected_recipe['name'])
-            handler_input.response_builder.set_card(
-                StandardCard(title=cardTitle, text=selected_recipe['instructions'], image=Image(
-                    small_image_url=sauce_item['image'], large_image_url=sauce_item['image'])))
+            sauce_item['image'] = selected_recipe.image
+            # Guided mode: the recipe is read one step per turn, from the first one
+            if(step is None and step_utils.GUIDED_RECIPES):
+                step = 0
+            # Add a card (displayed in the Alexa app), once per recipe in guided mode
+            if(not step):
+                handler_input.response_builder.set_card(
+                    StandardCard(title=selected_recipe.card_title, text=selected_recipe.instructions, image=Image(
+                        small_image_url=sauce_item['image'], large_image_url=sauce_item['image'])))
+            if(step is not None):
+                # Add the step with APL Template if device is compatible
+                return apl_utils.recipeStepScreen(handler_input, sauce_item, selected_recipe, step)
             # Add APL Template if device is compatible
             apl_utils.recipeScreen(handler_input, sauce_item, selected_recipe)
         else:
@@ -93,13 +101,15 @@ class RecipeIntentHandler(AbstractRequestHandler):
             # Add prompt : Is the item slot is filled with a value ?
             if(sauce_item['spoken']):
                 # Use spoken value to let user know no recipe exists for this value
-                handler_input.response_builder.speak(
-                    data[prompts.RECIPE_NOT_FOUND_WITH_ITEM_NAME].format(sauce_item['spoken']))
+                speak_output = data[prompts.RECIPE_NOT_FOUND_WITH_ITEM_NAME].format(sauce_item['spoken'])
             else:
                 # No spoken value
-                handler_input.response_builder.speak(
-                    data[prompts.RECIPE_NOT_FOUND_WITHOUT_ITEM_NAME]
-                )
+                speak_output = data[prompts.RECIPE_NOT_FOUND_WITHOUT_ITEM_NAME]
+            # Render the pre-rendered response
+            template = template_utils.get_template(handler_input, template_utils.PROMPT)
+            if(template):
+                return template.render(handler_input, speak_output, data[prompts.RECIPE_NOT_FOUND_REPROMPT])
+            handler_input.response_builder.speak(speak_output)
 
         # add reprompt
         handler_input.response_builder.ask(
@@ -110,7 +120,37 @@ class RecipeIntentHandler(AbstractRequestHandler):
         return handler_input.response_builder.response
 
 
-class PreviousHandler(AbstractRequestHandler):
+class IngredientIntentHandler(skill_utils.RoutedRequestHandler):
+    """
+    Handles IngredientIntent requests sent by Alexa
+    Suggests the sauces which contain every ingredient spoken by the user
+    """
+    routes = (skill_utils.intent_route("IngredientIntent"),)
+
+    def handle(self, handler_input):
+        data = handler_input.attributes_manager.request_attributes["_"]
+        request = handler_input.request_envelope.request
+        # Get spoken ingredients (ex: "mayonnaise and ketchup")
+        ingredients_slot = request.intent.slots.get("Ingredients") if request.intent.slots else None
+        ingredients = ingredients_slot.value if ingredients_slot else None
+        if(ingredients):
+            # Search the recipes containing every ingredient
+            recipe_ids = ingredient_utils.search_recipes(request.locale, ingredients)
+            if(recipe_ids):
+                recipes = recipe_utils.get_locale_specific_recipes(request.locale)
+                names = data[prompts.LIST_SEPARATOR].join(recipes[recipe_id].name for recipe_id in recipe_ids)
+                speak_output = data[prompts.INGREDIENT_RECIPES_FOUND].format(ingredients, names)
+            else:
+                speak_output = data[prompts.INGREDIENT_RECIPES_NOT_FOUND].format(ingredients)
+        else:
+            # No spoken ingredients
+            speak_output = data[prompts.RECIPE_NOT_FOUND_WITHOUT_ITEM_NAME]
+        reprompt_output = data[prompts.RECIPE_NOT_FOUND_REPROMPT]
+        # Generate JSON Response
+        return handler_input.response_builder.speak(speak_output).ask(reprompt_output).response
+
+
+class PreviousHandler(skill_utils.RoutedRequestHandler):
     """
     Handles AMAZON.PreviousIntent & Touch Interaction (Alexa.Presentation.APL.UserEvent - goBack) requests sent by Alexa
     to replay the previous actionnable request (voice and/or display)
@@ -120,65 +160,80 @@ class PreviousHandler(AbstractRequestHandler):
         - LaunchRequest
         - Alexa.Presentation.APL.UserEvent - sauceInstructions
     """
-
-    def can_handle(self, handler_input):
-        return is_intent_name("AMAZON.PreviousIntent")(handler_input) or \
-            (is_request_type('Alexa.Presentation.APL.UserEvent')(handler_input) and
-                len(list(handler_input.request_envelope.request.arguments)) > 0 and
-                list(handler_input.request_envelope.request.arguments)[0] == 'goBack')
+    routes = (skill_utils.intent_route("AMAZON.PreviousIntent"),
+              skill_utils.apl_user_event_route("goBack"))
 
     def handle(self, handler_input):
-        attributes_manager = handler_input.attributes_manager
-        # Get History from Session Attributes for replay
-        session_attr = attributes_manager.session_attributes
-        actionnable_history = list()
-        if('actionable_history' in session_attr.keys()):
-            actionnable_history = session_attr.actionnable_history
-        # First actionable request is the one that is currently displayed or heard
-        # So we need to track when that is found so we can go back to the previous one
-        found_actionnable_request_in_history = False
-        replay_request = None
-        while len(actionnable_history) > 0:
-            # Get previous action
-            replay_request = actionnable_history.pop()
-            # Check if the action can be replayed
-            if(replay_request and replay_request.actionable and found_actionnable_request_in_history):
-                if((replay_request['type'] == 'IntentRequest' and replay_request.intent['name'] == 'RecipeIntent') or (replay_request['type'] == 'Alexa.Presentation.APL.UserEvent')):
-                    # Re-Add the actionnable request in history to remember the latest displayed or heard
-                    actionnable_history.append(replay_request)
-                    # Get sauce item from the request history not current request
-                    sauce_item = recipe_utils.get_suace_item(replay_request)
-                    return RecipeIntentHandler().generate_recipe_output(handler_input, sauce_item)
-                if(replay_request['type'] == 'IntentRequest' and replay_request.intent['name'] == 'AMAZON.HelpIntent'):
-                    # Re-Add the actionnable request in history to remember the latest displayed or heard
-                    actionnable_history.append(replay_request)
-                    # Call AMAZON.HelpIntent handler
-                    return HelpIntentHandler().handle(handler_input)
-                # Note: we don't manage LaunchRequest here as it will be the default actionnable request
-                # We can break the iteration
-                break
-            # Update flag when an actionnable request is found
-            # Next actionnable request in history (if any) will be replayed
-            found_actionnable_request_in_history = replay_request.actionable
+        # Get History from Session State for replay
+        session_state = session_utils.get_session_state(handler_input)
+        actionnable_history = session_state.history
+        # Recipe read step by step (guided mode) currently displayed or heard: go back to its previous step
+        step = session_state.step
+        current_request = actionnable_history[-1] if actionnable_history else None
+        if(step and step[1] > 0 and current_request
+                and current_request[0] == session_utils.HISTORY_RECIPE and current_request[1] == step[0]):
+            sauce_item = {'id': step[0], 'spoken': current_request[2]}
+            return RecipeIntentHandler().generate_recipe_output(handler_input, sauce_item, step[1] - 1)
+        # Last actionable request is the one that is currently displayed or heard
+        # So we need to go back to the one before it (if any)
+        if len(actionnable_history) > 1:
+            actionnable_history.pop()
+            # The replayed request stays in history to remember the latest displayed or heard
+            replay_request = actionnable_history[-1]
+            if(replay_request[0] == session_utils.HISTORY_RECIPE):
+                # Get sauce item from the request history not current request
+                sauce_item = {'id': replay_request[1], 'spoken': replay_request[2]}
+                # A recipe read step by step is resumed at its current step
+                resume_step = step[1] if step and step[0] == sauce_item['id'] else None
+                return RecipeIntentHandler().generate_recipe_output(handler_input, sauce_item, resume_step)
+            if(replay_request[0] == session_utils.HISTORY_HELP):
+                # Call AMAZON.HelpIntent handler
+                return HelpIntentHandler().handle(handler_input)
+            # Note: we don't manage LaunchRequest here as it will be the default actionnable request
         # No actionable history ? so just go to launch
         return LaunchRequestIntentHandler().handle(handler_input)
 
 
-class HelpIntentHandler(AbstractRequestHandler):
+class NextStepHandler(skill_utils.RoutedRequestHandler):
     """
-    Handles AMAZON.HelpIntent requests sent by Alexa
+    Handles AMAZON.NextIntent requests sent by Alexa
+    to read the next step of the recipe read step by step (guided mode)
     """
+    routes = (skill_utils.intent_route("AMAZON.NextIntent"),)
+
+    def handle(self, handler_input):
+        step = session_utils.get_session_state(handler_input).step
+        # No recipe read step by step ? so just go to launch
+        if not step:
+            return LaunchRequestIntentHandler().handle(handler_input)
+        data = handler_input.attributes_manager.request_attributes["_"]
+        recipes = recipe_utils.get_locale_specific_recipes(handler_input.request_envelope.request.locale)
+        if(step[1] + 1 >= len(recipes[step[0]].steps)):
+            # Last step already read
+            speak_output = data[prompts.RECIPE_LAST_STEP_MESSAGE] + " " + data[prompts.RECIPE_NOT_FOUND_REPROMPT]
+            return handler_input.response_builder.speak(speak_output).ask(
+                data[prompts.RECIPE_NOT_FOUND_REPROMPT]).response
+        sauce_item = {'id': step[0], 'spoken': None}
+        return RecipeIntentHandler().generate_recipe_output(handler_input, sauce_item, step[1] + 1)
 
-    def can_handle(self, handler_input):
-        return is_intent_name("AMAZON.HelpIntent")(handler_input)
+
+class HelpIntentHandler(skill_utils.RoutedRequestHandler):
+    """
+    Handles AMAZON.HelpIntent requests sent by Alexa
+    """
+    routes = (skill_utils.intent_route("AMAZON.HelpIntent"),)
 
     def handle(self, handler_input):
         data = handler_input.attributes_manager.request_attributes["_"]
         # Get random sauce for speak_output
         random_sauce = recipe_utils.get_random_recipe(handler_input)
         # get prompt and reprompt speach
-        speak_output = data[prompts.HELP_MESSAGE].format(random_sauce['name'])
-        reprompt_output = data[prompts.HELP_REPROMPT].format(random_sauce['name'])
+        speak_output = data[prompts.HELP_MESSAGE].format(random_sauce.name)
+        reprompt_output = data[prompts.HELP_REPROMPT].format(random_sauce.name)
+        # Render the pre-rendered response (with APL if device is compatible)
+        template = template_utils.get_template(handler_input, template_utils.HELP)
+        if(template):
+            return template.render(handler_input, speak_output, reprompt_output)
         # Add APL if device is compatible
         apl_utils.helpScreen(handler_input)
         handler_input.response_builder.speak(
@@ -188,53 +243,55 @@ class HelpIntentHandler(AbstractRequestHandler):
         return handler_input.response_builder.response
 
 
-class RepeatIntentHandler(AbstractRequestHandler):
+class RepeatIntentHandler(skill_utils.RoutedRequestHandler):
     """
     Handles AMAZON.RepeatIntent requests sent by Alexa
     """
-
-    def can_handle(self, handler_input):
-        return is_intent_name("AMAZON.RepeatIntent")(handler_input)
+    routes = (skill_utils.intent_route("AMAZON.RepeatIntent"),)
 
     def handle(self, handler_input):
-        session_attr = handler_input.attributes_manager.session_attributes
-        logger.info("Session Attr: {}".format(session_attr))
-        # get the last response stored in session_attributes and return it
-        cached_response_str = json.dumps(session_attr["speech"])
-        cached_response = DefaultSerializer().deserialize(
-            cached_response_str, Response)
-        return cached_response
-
-class ExitIntentHandler(AbstractRequestHandler):
+        logger.debug("Session Attr: %s", handler_input.attributes_manager.session_attributes)
+        # get the last speech and reprompt stored in session state and repeat them
+        speak_output, reprompt_output = session_utils.render_last_utterance(handler_input)
+        if not speak_output:
+            # Nothing to repeat ? so just go to launch
+            return LaunchRequestIntentHandler().handle(handler_input)
+        handler_input.response_builder.speak(speak_output)
+        if reprompt_output:
+            handler_input.response_builder.ask(reprompt_output)
+        # Keep the recorded utterance as is for the next repeat
+        session_utils.get_session_state(handler_input).utterance_set = True
+        return handler_input.response_builder.response
+
+class ExitIntentHandler(skill_utils.RoutedRequestHandler):
     """
     Handler for AMAZON.CancelIntent and AMAZON.StopIntent
     Note: this request is sent when the user makes a request that corresponds to AMAZON.CancelIntent & AMAZON.StopIntent intents defined in your intent schema.
     """
-
-    def can_handle(self, handler_input):
-        return is_intent_name("AMAZON.CancelIntent")(handler_input) \
-            or is_intent_name("AMAZON.StopIntent")(handler_input)
+    routes = (skill_utils.intent_route("AMAZON.CancelIntent"),
+              skill_utils.intent_route("AMAZON.StopIntent"))
 
     def handle(self, handler_input):
         data = handler_input.attributes_manager.request_attributes["_"]
         speak_output = data[prompts.STOP_MESSAGE]
+        # Render the pre-rendered response
+        template = template_utils.get_template(handler_input, template_utils.SPEECH)
+        if(template):
+            return template.render(handler_input, speak_output)
         handler_input.response_builder.speak(speak_output)
         # Generate JSON response
         return handler_input.response_builder.response
 
 
-class SessionEndedRequestHandler(AbstractRequestHandler):
+class SessionEndedRequestHandler(skill_utils.RoutedRequestHandler):
     """
     Handler for SessionEndedRequest
     """
-
-    def can_handle(self, handler_input):
-        return is_request_type("SessionEndedRequest")(handler_input)
+    routes = (skill_utils.request_route("SessionEndedRequest"),)
 
     def handle(self, handler_input):
         # Any cleanup logic goes here
-        logger.info("~~~~ Session ended: {}".format(
-            str(handler_input.request_envelope)))
+        logger.debug("~~~~ Session ended: %s", handler_input.request_envelope)
         return handler_input.response_builder.response
 
 
@@ -249,6 +306,8 @@ class CatchAllExceptionHandler(AbstractExceptionHandler):
 
     def handle(self, handler_input, exception):
         logger.error(exception, exc_info=True)
+        log_utils.log_request(handler_input, logging.ERROR,
+                              handler=type(self).__name__, error=type(exception).__name__)
         data = handler_input.attributes_manager.request_attributes["_"]
         speak_output = data[prompts.ERROR_MESSAGE]
         handler_input.response_builder.speak(speak_output).ask(speak_output)
@@ -256,12 +315,14 @@ class CatchAllExceptionHandler(AbstractExceptionHandler):
 
 
 class RequestLogger(AbstractRequestInterceptor):
-    """Log the request envelope."""
+    """Start the request log record and log the request envelope when sampled."""
 
     def process(self, handler_input):
         # type: (HandlerInput) -> None
-        logger.info("Request Envelope: {}".format(
-            handler_input.request_envelope))
+        if log_utils.start_request(handler_input):
+            logger.info("Request Envelope: %s", handler_input.request_envelope)
+        else:
+            logger.debug("Request Envelope: %s", handler_input.request_envelope)
 
 
 class LocalizationInterceptor(AbstractRequestInterceptor):
@@ -271,18 +332,11 @@ class LocalizationInterceptor(AbstractRequestInterceptor):
 
     def process(self, handler_input):
         locale = handler_input.request_envelope.request.locale
-        logger.info("Locale is {}".format(locale[:2]))
-
-        # localized strings stored in language_strings.json
-        with open("language_strings.json") as language_prompts:
-            language_data = json.load(language_prompts)
-        # set default translation data to broader translation
-        data = language_data[locale[:2]]
-        # if a more specialized translation exists, then select it instead
-        # example: "fr-CA" will pick "fr" translations first, but if "fr-CA" translation exists,
-        #          then pick that instead
-        if locale in language_data:
-            data.update(language_data[locale])
+        logger.debug("Locale is %s", locale[:2])
+
+        # localized strings stored in language_strings.json are loaded once per container
+        # example: "fr-CA" picks "fr" translations first, overridden by "fr-CA" translations
+        data = language_utils.get_locale_strings(locale)
         handler_input.attributes_manager.request_attributes["_"] = data
 
 
@@ -299,42 +353,30 @@ class ResponseActionnableHistoryInterceptor(AbstractResponseInterceptor):
 
     def process(self, handler_input, response):
         max_history_size = 5
-        # Get Session Attributes
-        session_attr = handler_input.attributes_manager.session_attributes
-        actionnable_history = list()
-        if('actionable_history' in session_attr.keys()):
-            actionnable_history = session_attr.actionnable_history
-        # Init request record
+        # Get History from Session State
+        actionnable_history = session_utils.get_session_state(handler_input).history
+        # Compute the history entry of the request, only actionnable requests are recorded
         current_request = handler_input.request_envelope.request
-        record_request = {
-            'type': current_request,
-            'intent': {
-                'name': '',
-                'slots': {}
-            },
-            'arguments': list(),
-            'actionable': False
-        }
-        # Update request record with information needed for replay
+        record_request = None
         if(current_request.object_type == 'IntentRequest'):
-            record_request['intent']['name'] = current_request.intent.name
-            record_request['intent']['slots'] = current_request.intent.slots
-            if(record_request['intent']['name'] == "RecipeIntent" or record_request['intent']['name'] == "AMAZON.HelpIntent"):
-                record_request['actionable'] = True
+            if(current_request.intent.name == "RecipeIntent"):
+                record_request = session_utils.recipe_history_entry(
+                    recipe_utils.get_suace_item(current_request))
+            elif(current_request.intent.name == "AMAZON.HelpIntent"):
+                record_request = [session_utils.HISTORY_HELP]
         elif (current_request.object_type == 'Alexa.Presentation.APL.UserEvent'):
-            record_request['arguments'] = list(current_request.arguments)
-            if(list(record_request['arguments'])[0] == 'sauceInstructions'):
-                record_request['actionable'] = True
+            if(current_request.arguments and current_request.arguments[0] == 'sauceInstructions'):
+                record_request = session_utils.recipe_history_entry(
+                    recipe_utils.get_suace_item(current_request))
         elif (current_request.object_type == 'LaunchRequest'):
-            record_request['actionable'] = True
+            record_request = [session_utils.HISTORY_LAUNCH]
 
+        # Only record request which will be replayed
+        if(record_request):
             # Remove the first actionnable item if history limit is reached
-        if(len(actionnable_history) >= max_history_size):
-            actionnable_history.pop(0)
-        # Only record request which will be replaced
-        if(record_request['actionable']):
+            if(len(actionnable_history) >= max_history_size):
+                actionnable_history.pop(0)
             actionnable_history.append(record_request)
-        session_attr['actionnable_history'] = actionnable_history
 
 
 class CacheResponseForRepeatInterceptor(AbstractResponseInterceptor):
@@ -348,24 +390,45 @@ class CacheResponseForRepeatInterceptor(AbstractResponseInterceptor):
 
     def process(self, handler_input, response):
         # type: (HandlerInput, Response) -> None
-        session_attr = handler_input.attributes_manager.session_attributes
-        session_attr["speech"] = response.output_speech
-        session_attr["reprompt"] = response.reprompt
+        session_state = session_utils.get_session_state(handler_input)
+        # Keep the utterance recorded by the handler (ex: recipe read by APL)
+        if not session_state.utterance_set:
+            session_state.utterance = [
+                response.output_speech.ssml if response.output_speech else None,
+                response.reprompt.output_speech.ssml if response.reprompt else None
+            ]
+
+
+class SessionStateInterceptor(AbstractResponseInterceptor):
+    """Store the session state in session attributes.
+    The state is encoded in a compact form, trimmed to fit in the
+    session attributes budget.
+    """
+
+    def process(self, handler_input, response):
+        # type: (HandlerInput, Response) -> None
+        session_utils.save_session_state(handler_input)
 
 
 class ResponseLogger(AbstractResponseInterceptor):
-    """Log the response envelope."""
+    """Log the request record and the response when sampled."""
 
     def process(self, handler_input, response):
         # type: (HandlerInput, Response) -> None
-        logger.info("Response: {}".format(response))
+        if log_utils.is_request_sampled(handler_input):
+            logger.info("Response: %s", response)
+        else:
+            logger.debug("Response: %s", response)
+        log_utils.log_request(handler_input)
 
 
 # register request / intent handlers
 sb.add_request_handler(HelpIntentHandler())
 sb.add_request_handler(LaunchRequestIntentHandler())
 sb.add_request_handler(RecipeIntentHandler())
+sb.add_request_handler(IngredientIntentHandler())
 sb.add_request_handler(PreviousHandler())
+sb.add_request_handler(NextStepHandler())
 sb.add_request_handler(RepeatIntentHandler())
 sb.add_request_handler(ExitIntentHandler())
 sb.add_request_handler(SessionEndedRequestHandler())
@@ -374,10 +437,12 @@ sb.add_request_handler(SessionEndedRequestHandler())
 sb.add_exception_handler(CatchAllExceptionHandler())
 
 # register response interceptors
-sb.add_global_request_interceptor(LocalizationInterceptor())
+# Loggers are registered first and last to measure the whole request latency
 sb.add_global_request_interceptor(RequestLogger())
+sb.add_global_request_interceptor(LocalizationInterceptor())
 sb.add_global_response_interceptor(CacheResponseForRepeatInterceptor())
-sb.add_global_response_interceptor(ResponseLogger())
 sb.add_global_response_interceptor(ResponseActionnableHistoryInterceptor())
+sb.add_global_response_interceptor(SessionStateInterceptor())
+sb.add_global_response_interceptor(ResponseLogger())
 
 lambda_handler = sb.lambda_handler()
@@ -0,0 +1,100 @@
+import json
+import logging
+from types import MappingProxyType
+
+import recipes
+import asset_utils
+
+logger = logging.getLogger("main")
+logger.setLevel(logging.INFO)
+
+# Locales published in skill.json, which is not deployed with the function
+# (python tools/check_locales.py fails if both lists differ)
+SUPPORTED_LOCALES = (
+    "de-DE",
+    "en-AU", "en-CA", "en-GB", "en-IN", "en-US",
+    "es-ES", "es-MX", "es-US",
+    "fr-CA", "fr-FR",
+    "hi-IN",
+    "it-IT",
+    "ja-JP",
+    "pt-BR"
+)
+
+# Localized strings by language (ex: "fr") and locale (ex: "fr-CA")
+LANGUAGE_STRINGS_FILE = "language_strings.json"
+
+
+def _load_language_strings(file_path):
+    """
+    Load the localized strings json document at the path into a dict object
+    """
+    with open(file_path) as f:
+        return json.load(f)
+
+
+def _merge_locale_strings(language_data, locale):
+    """
+    Returns the merged strings for a locale or None if none can be resolved
+    The broader translation (ex: "fr") is used first, then overridden by
+    a more specialized translation (ex: "fr-CA") if it exists
+    """
+    if locale[:2] not in language_data and locale not in language_data:
+        return None
+    data = dict(language_data.get(locale[:2], {}))
+    data.update(language_data.get(locale, {}))
+    return MappingProxyType(data)
+
+
+def build_registry(language_data, locales):
+    """
+    Compute the immutable strings tables of every language and locale
+    Raises a ValueError if a locale has no resolvable strings or recipes
+    """
+    registry = {}
+    for key in set(language_data.keys()).union(locales):
+        table = _merge_locale_strings(language_data, key)
+        if table is not None:
+            registry[key] = table
+    for locale in locales:
+        if locale not in registry:
+            raise ValueError(
+                "No localized strings found for locale {}".format(locale))
+        if locale[:2] not in recipes.translations:
+            raise ValueError(
+                "No recipes found for locale {}".format(locale))
+    return registry
+
+
+def load_language_data():
+    """
+    Returns the localized strings of every language and locale, from the asset bundle if any
+    """
+    language_data = asset_utils.get_asset('language_strings')
+    if language_data is None:
+        language_data = _load_language_strings(LANGUAGE_STRINGS_FILE)
+    return language_data
+
+# Built once per container (cold start)
+LANGUAGE_STRINGS = build_registry(load_language_data(), SUPPORTED_LOCALES)
+
+
+def get_registry_locale(locale):
+    """
+    Returns the locale of the strings table of a locale, to key the per-locale caches
+    Unknown locales share the table of their language (ex: "en" for "en-NZ")
+    """
+    if locale in LANGUAGE_STRINGS:
+        return locale
+    return locale[:2]
+
+
+def get_locale_strings(locale):
+    """
+    Returns the immutable strings table for a specific locale
+    Falls back to the broader translation (ex: "en" for "en-NZ")
+    """
+    data = LANGUAGE_STRINGS.get(locale)
+    if data is None:
+        data = LANGUAGE_STRINGS[locale[:2]]
+    return data
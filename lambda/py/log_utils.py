@@ -0,0 +1,97 @@
+import os
+import json
+import time
+import random
+import logging
+import session_utils
+
+logger = logging.getLogger("main")
+logger.setLevel(logging.INFO)
+
+# Request attributes used to track the request being logged
+REQUEST_START_ATTRIBUTE = "_request_start"
+REQUEST_SAMPLED_ATTRIBUTE = "_request_sampled"
+REQUEST_HANDLER_ATTRIBUTE = "_request_handler"
+
+
+def _load_sample_rate(setting):
+    """
+    Returns the rate (0 to 1) of requests whose full envelope and response are logged
+    """
+    rate = float(setting)
+    if rate < 0 or rate > 1:
+        raise ValueError("Invalid log sample rate: {}".format(setting))
+    return rate
+
+
+# Rate of full request envelope and response dumps, set with the LOG_ENVELOPE_SAMPLE_RATE
+# environment variable (ex: 0.01 for 1% of the requests, 0 by default)
+ENVELOPE_SAMPLE_RATE = _load_sample_rate(os.environ.get('LOG_ENVELOPE_SAMPLE_RATE', '0'))
+
+
+class JsonMessage(object):
+    """
+    Log message formatted as compact json only when the log record is emitted
+    """
+    __slots__ = ('record',)
+
+    def __init__(self, record):
+        self.record = record
+
+    def __str__(self):
+        return json.dumps(self.record, separators=(',', ':'), ensure_ascii=False, default=str)
+
+
+def start_request(handler_input):
+    """
+    Records the request start time and whether its envelope is sampled for a full dump
+    Returns True if the request is sampled
+    """
+    request_attributes = handler_input.attributes_manager.request_attributes
+    request_attributes[REQUEST_START_ATTRIBUTE] = time.perf_counter()
+    sampled = ENVELOPE_SAMPLE_RATE > 0 and random.random() < ENVELOPE_SAMPLE_RATE
+    request_attributes[REQUEST_SAMPLED_ATTRIBUTE] = sampled
+    return sampled
+
+
+def is_request_sampled(handler_input):
+    """
+    Checks whether the request envelope and response are sampled for a full dump
+    """
+    return handler_input.attributes_manager.request_attributes.get(REQUEST_SAMPLED_ATTRIBUTE, False)
+
+
+def set_request_handler(handler_input, handler):
+    """
+    Records the name of the handler of the request
+    """
+    handler_input.attributes_manager.request_attributes[REQUEST_HANDLER_ATTRIBUTE] = type(handler).__name__
+
+
+def get_request_record(handler_input, **fields):
+    """
+    Returns the structured log record of a request
+    """
+    request = handler_input.request_envelope.request
+    request_attributes = handler_input.attributes_manager.request_attributes
+    start = request_attributes.get(REQUEST_START_ATTRIBUTE)
+    intent = getattr(request, 'intent', None)
+    record = {
+        'requestId': request.request_id,
+        'type': request.object_type,
+        'intent': intent.name if intent else None,
+        'locale': request.locale,
+        'handler': request_attributes.get(REQUEST_HANDLER_ATTRIBUTE),
+        'latencyMs': round((time.perf_counter() - start) * 1000, 3) if start is not None else None,
+        'sessionBytes': request_attributes.get(session_utils.SESSION_BYTES_ATTRIBUTE)
+    }
+    record.update(fields)
+    return record
+
+
+def log_request(handler_input, level=logging.INFO, **fields):
+    """
+    Logs the structured record of a request
+    """
+    if logger.isEnabledFor(level):
+        logger.log(level, "%s", JsonMessage(get_request_record(handler_input, **fields)))
@@ -0,0 +1,219 @@
+import os
+import sys
+import json
+import time
+import threading
+import functools
+
+# Metric of the whole invocation, and of its stages around the skill dispatch
+INVOCATION_METRIC = 'Invocation'
+DESERIALIZATION_METRIC = 'Deserialization'
+VERIFICATION_METRIC = 'Verification'
+DISPATCH_METRIC = 'Dispatch'
+SERIALIZATION_METRIC = 'Serialization'
+
+# Device dimension values
+DEVICE_APL = 'apl'
+DEVICE_VOICE = 'voice'
+DEVICE_UNKNOWN = 'unknown'
+
+
+def _load_metrics_enabled(setting):
+    """
+    Returns whether the timing metrics are recorded
+    """
+    return setting.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+# Set with the TIMING_METRICS environment variable ("true" records the timing metrics)
+# Components are only instrumented when enabled: disabled metrics cost one check per invocation
+METRICS_ENABLED = _load_metrics_enabled(os.environ.get('TIMING_METRICS', 'false'))
+
+# CloudWatch namespace of the metrics, set with the METRICS_NAMESPACE environment variable
+METRICS_NAMESPACE = os.environ.get('METRICS_NAMESPACE', 'SauceBoss')
+
+# Stream the Embedded Metric Format lines are written to (CloudWatch Logs on AWS Lambda)
+METRICS_STREAM = [sys.stdout]
+METRICS_STREAM_LOCK = threading.Lock()
+
+# Metrics of the invocation handled by each thread
+_local = threading.local()
+
+
+def bucket_value(value):
+    """
+    Returns the histogram bucket of a duration: the value rounded to 2 significant digits
+    example: 0.01234 -> 0.012, 1.56 -> 1.6
+    """
+    return float('{:.2g}'.format(value))
+
+
+class Histogram(object):
+    """
+    Durations of a metric (ms), counted by bucket, with their statistics
+    """
+    __slots__ = ('counts', 'count', 'sum', 'min', 'max')
+
+    def __init__(self):
+        self.counts = {}
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        bucket = bucket_value(value)
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def to_emf(self):
+        """
+        Returns the Embedded Metric Format histogram of the durations,
+        the duration itself if there is only one
+        """
+        if self.count == 1:
+            return round(self.sum, 4)
+        return {
+            'Values': list(self.counts),
+            'Counts': list(self.counts.values()),
+            'Max': round(self.max, 4),
+            'Min': round(self.min, 4),
+            'Count': self.count,
+            'Sum': round(self.sum, 4)
+        }
+
+
+class InvocationMetrics(object):
+    """
+    Timing histograms recorded during one invocation, by metric name
+        - device: device dimension (apl, voice or unknown)
+        - properties: searchable fields of the EMF line (ex: request type)
+    """
+    __slots__ = ('start', 'last', 'device', 'properties', 'histograms')
+
+    def __init__(self):
+        self.start = self.last = time.perf_counter()
+        self.device = DEVICE_UNKNOWN
+        self.properties = {}
+        self.histograms = {}
+
+    def add(self, name, duration):
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        histogram.add(duration)
+
+    def lap(self, name):
+        """
+        Records the time since the previous lap (or the start) under a metric name
+        """
+        now = time.perf_counter()
+        self.add(name, (now - self.last) * 1000)
+        self.last = now
+
+    def set_request(self, request_envelope):
+        """
+        Sets the device dimension and the properties of the request
+        """
+        device = getattr(getattr(getattr(request_envelope.context, 'system', None), 'device', None),
+                         'supported_interfaces', None)
+        self.device = DEVICE_APL if getattr(device, 'alexa_presentation_apl', None) is not None else DEVICE_VOICE
+        request = request_envelope.request
+        intent = getattr(request, 'intent', None)
+        self.properties = {
+            'requestId': request.request_id,
+            'requestType': request.object_type,
+            'intent': intent.name if intent else None
+        }
+
+    def to_emf(self, timestamp):
+        """
+        Returns the Embedded Metric Format record of the invocation, with the Device dimension
+        """
+        record = {
+            '_aws': {
+                'Timestamp': int(timestamp * 1000),
+                'CloudWatchMetrics': [{
+                    'Namespace': METRICS_NAMESPACE,
+                    'Dimensions': [['Device']],
+                    'Metrics': [{'Name': name, 'Unit': 'Milliseconds'} for name in self.histograms]
+                }]
+            },
+            'Device': self.device
+        }
+        record.update(self.properties)
+        for name, histogram in self.histograms.items():
+            record[name] = histogram.to_emf()
+        return record
+
+
+def start_invocation():
+    """
+    Starts recording the metrics of the invocation of the current thread
+    Returns the InvocationMetrics, None if the metrics are disabled
+    """
+    if not METRICS_ENABLED:
+        return None
+    metrics = InvocationMetrics()
+    _local.metrics = metrics
+    return metrics
+
+
+def flush_invocation(metrics):
+    """
+    Records the invocation time and writes the metrics of the invocation as one EMF json line
+    """
+    metrics.add(INVOCATION_METRIC, (time.perf_counter() - metrics.start) * 1000)
+    _local.metrics = None
+    line = json.dumps(metrics.to_emf(time.time()), separators=(',', ':'), ensure_ascii=False)
+    with METRICS_STREAM_LOCK:
+        METRICS_STREAM[0].write(line + '\n')
+        METRICS_STREAM[0].flush()
+
+
+def record(name, duration):
+    """
+    Records a duration (ms) in the metrics of the invocation of the current thread, if any
+    """
+    metrics = getattr(_local, 'metrics', None)
+    if metrics is not None:
+        metrics.add(name, duration)
+
+
+def timed(name=None):
+    """
+    Decorator recording the duration of each call under a metric name (default: the function name)
+    The function is returned as is when the metrics are disabled
+    """
+    def decorator(function):
+        if not METRICS_ENABLED:
+            return function
+        metric_name = name or function.__name__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record(metric_name, (time.perf_counter() - start) * 1000)
+        return wrapper
+    return decorator
+
+
+def instrument(component):
+    """
+    Times the handle (request and exception handlers) or process (interceptors) method
+    of a skill component under its class name, in place
+    Returns the component, left as is when the metrics are disabled
+    """
+    if METRICS_ENABLED:
+        name = type(component).__name__
+        for method_name in ('handle', 'process'):
+            method = getattr(component, method_name, None)
+            if method is not None:
+                setattr(component, method_name, timed(name)(method))
+    return component
@@ -0,0 +1,205 @@
+import os
+import sys
+import time
+import random
+import logging
+import threading
+import log_utils
+
+logger = logging.getLogger("main")
+logger.setLevel(logging.INFO)
+
+
+def _load_sample_rate(setting):
+    """
+    Returns the rate (0 to 1) of invocations profiled
+    """
+    rate = float(setting)
+    if rate < 0 or rate > 1:
+        raise ValueError("Invalid profile sample rate: {}".format(setting))
+    return rate
+
+
+def _load_names(setting):
+    """
+    Returns the set of names of a comma separated setting (ex: "RecipeIntent,LaunchRequest")
+    """
+    return frozenset(name.strip() for name in setting.split(',') if name.strip())
+
+
+# Invocations profiled, set with environment variables:
+#   - PROFILE_SAMPLE_RATE: rate of the invocations (ex: 0.001), 0 by default
+#   - PROFILE_INTENTS: intent names or request types (ex: "RecipeIntent,LaunchRequest")
+#   - PROFILE_LOCALES: locales (ex: "fr-FR,fr-CA")
+PROFILE_SAMPLE_RATE = _load_sample_rate(os.environ.get('PROFILE_SAMPLE_RATE', '0'))
+PROFILE_INTENTS = _load_names(os.environ.get('PROFILE_INTENTS', ''))
+PROFILE_LOCALES = _load_names(os.environ.get('PROFILE_LOCALES', ''))
+PROFILING_ENABLED = PROFILE_SAMPLE_RATE > 0 or bool(PROFILE_INTENTS) or bool(PROFILE_LOCALES)
+
+# Number of functions and allocation sites in a profile record, set with PROFILE_TOP
+PROFILE_TOP = int(os.environ.get('PROFILE_TOP', '15'))
+
+# tracemalloc traces the whole process: one invocation is profiled at a time
+# (the others run as usual while a profile is captured)
+PROFILE_LOCK = threading.Lock()
+
+
+def get_profile_reason(request_envelope):
+    """
+    Returns why an invocation is profiled ("intent", "locale" or "sample"), None if it is not
+    """
+    if not PROFILING_ENABLED:
+        return None
+    request = request_envelope.request
+    if PROFILE_INTENTS:
+        intent = getattr(request, 'intent', None)
+        if request.object_type in PROFILE_INTENTS or (intent is not None and intent.name in PROFILE_INTENTS):
+            return 'intent'
+    if PROFILE_LOCALES and request.locale in PROFILE_LOCALES:
+        return 'locale'
+    if PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE:
+        return 'sample'
+    return None
+
+
+def _short_path(file_path):
+    """
+    Returns the path of a source file relative to site-packages or the working directory
+    """
+    if not file_path or file_path == '~':
+        return file_path
+    file_path = os.path.normpath(file_path)
+    marker = os.sep + 'site-packages' + os.sep
+    if marker in file_path:
+        return file_path.split(marker, 1)[1]
+    cwd = os.getcwd() + os.sep
+    if file_path.startswith(cwd):
+        return file_path[len(cwd):]
+    return os.path.join(os.path.basename(os.path.dirname(file_path)), os.path.basename(file_path))
+
+
+class ProfileCapture(object):
+    """
+    Runs a function under cProfile and tracemalloc, and reports:
+        - the top functions by cumulative time
+        - the top allocation sites of the function: memory allocated while it runs and not freed
+          when it returns (snapshot after the call compared to the snapshot before it)
+        - the wall time and the peak of traced memory
+    """
+
+    def __init__(self, top=None):
+        self.top = PROFILE_TOP if top is None else top
+        self.profiler = None
+        self.before = None
+        self.after = None
+        self.wall_ms = None
+        self.peak_kib = None
+
+    def run(self, function, *args, **kwargs):
+        # Only imported when an invocation is profiled
+        import cProfile
+        import tracemalloc
+
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        self.before = self._take_snapshot(tracemalloc)
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        self.profiler = cProfile.Profile()
+        start = time.perf_counter()
+        try:
+            self.profiler.enable()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.profiler.disable()
+                self.wall_ms = (time.perf_counter() - start) * 1000
+                _, peak = tracemalloc.get_traced_memory()
+                self.peak_kib = (peak - base) / 1024.0
+                self.after = self._take_snapshot(tracemalloc)
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+
+    @staticmethod
+    def _take_snapshot(tracemalloc):
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap*>')))
+
+    def get_functions(self):
+        """
+        Returns the top functions by cumulative time: {function, calls, totalMs, cumulativeMs}
+        """
+        import pstats
+        stats = pstats.Stats(self.profiler).stats
+        functions = []
+        for (file_path, line, name), (_, calls, total, cumulative, _) in stats.items():
+            if name.startswith("<method 'disable' of '_lsprof"):
+                continue
+            functions.append({
+                'function': '{}:{}({})'.format(_short_path(file_path), line, name) if line else name,
+                'calls': calls,
+                'totalMs': round(total * 1000, 3),
+                'cumulativeMs': round(cumulative * 1000, 3)
+            })
+        functions.sort(key=lambda function: function['cumulativeMs'], reverse=True)
+        return functions[:self.top]
+
+    def get_allocations(self):
+        """
+        Returns the top allocation sites of the function by size: {site, kib, blocks}
+        The memory (KiB) and blocks allocated by each site during the call and still allocated after it,
+        the objects held before the call (ex: caches filled by earlier invocations) are not counted
+        """
+        statistics = [statistic for statistic in self.after.compare_to(self.before, 'lineno')
+                      if statistic.size_diff > 0]
+        statistics.sort(key=lambda statistic: statistic.size_diff, reverse=True)
+        return [{
+            'site': '{}:{}'.format(_short_path(statistic.traceback[0].filename), statistic.traceback[0].lineno),
+            'kib': round(statistic.size_diff / 1024.0, 2),
+            'blocks': statistic.count_diff
+        } for statistic in statistics[:self.top]]
+
+    def report(self):
+        return {
+            'wallMs': round(self.wall_ms, 3),
+            'peakKiB': round(self.peak_kib, 1),
+            'python': sys.version.split()[0],
+            'functions': self.get_functions(),
+            'allocations': self.get_allocations()
+        }
+
+
+def get_profile_record(request_envelope, reason, capture):
+    """
+    Returns the log record of a profiled invocation
+    """
+    request = request_envelope.request
+    intent = getattr(request, 'intent', None)
+    return {
+        'requestId': request.request_id,
+        'type': request.object_type,
+        'intent': intent.name if intent else None,
+        'locale': request.locale,
+        'profileReason': reason,
+        'profile': capture.report()
+    }
+
+
+def profile_dispatch(invoke, request_envelope, context, reason):
+    """
+    Runs the skill dispatch (invoke) of a request under the profiler and logs the profile record
+    Runs it as usual if another invocation is being profiled
+    """
+    if not PROFILE_LOCK.acquire(blocking=False):
+        return invoke(request_envelope=request_envelope, context=context)
+    try:
+        capture = ProfileCapture()
+        response_envelope = capture.run(invoke, request_envelope=request_envelope, context=context)
+        logger.info("%s", log_utils.JsonMessage(get_profile_record(request_envelope, reason, capture)))
+        return response_envelope
+    finally:
+        PROFILE_LOCK.release()
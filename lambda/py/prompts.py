@@ -14,5 +14,10 @@ RECIPE_REPEAT_MESSAGE = "RECIPE_REPEAT_MESSAGE"
 RECIPE_NOT_FOUND_WITH_ITEM_NAME = "RECIPE_NOT_FOUND_WITH_ITEM_NAME"
 RECIPE_NOT_FOUND_WITHOUT_ITEM_NAME = "RECIPE_NOT_FOUND_WITHOUT_ITEM_NAME"
 RECIPE_NOT_FOUND_REPROMPT = "RECIPE_NOT_FOUND_REPROMPT"
+RECIPE_NEXT_STEP_PROMPT = "RECIPE_NEXT_STEP_PROMPT"
+RECIPE_LAST_STEP_MESSAGE = "RECIPE_LAST_STEP_MESSAGE"
 ERROR_MESSAGE = "ERROR_MESSAGE"
 HINT_TEMPLATE = "HINT_TEMPLATE"
+INGREDIENT_RECIPES_FOUND = "INGREDIENT_RECIPES_FOUND"
+INGREDIENT_RECIPES_NOT_FOUND = "INGREDIENT_RECIPES_NOT_FOUND"
+LIST_SEPARATOR = "LIST_SEPARATOR"
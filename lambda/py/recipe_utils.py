@@ -1,6 +1,16 @@
+import os
 import logging
+import prompts
 import recipes
 import random
+import asset_utils
+import catalog_utils
+import language_utils
+import resolver_utils
+import step_utils
+
+from collections import namedtuple
+from collections.abc import Mapping
 
 logger = logging.getLogger("main")
 logger.setLevel(logging.INFO)
@@ -18,14 +28,30 @@ RECIPE_IMAGES = {
 
 RECIPE_DEFAULT_IMAGE = "https://s3.amazonaws.com/ask-samples-resources/images/sauce-boss/secret-sauce-500x500.png"
 
+# Recipes source: the SQLite catalog file set with the RECIPE_CATALOG_FILE environment variable
+# (built with tools/build_recipe_catalog.py), otherwise the recipes and images of the asset bundle,
+# or the recipes package and RECIPE_IMAGES without bundle
+CATALOG_BACKEND = catalog_utils.create_backend(
+    os.environ.get('RECIPE_CATALOG_FILE'),
+    asset_utils.get_asset('recipes') or recipes.translations,
+    asset_utils.get_asset('recipe_images') or RECIPE_IMAGES)
+
+# Steps of the recipes split ahead of time, by language and recipe id: the ones of the asset bundle
+# with its recipes, the recipes of the SQLite catalog or the recipes package are split when compiled
+RECIPE_STEPS = asset_utils.get_asset('recipe_steps') if not os.environ.get('RECIPE_CATALOG_FILE') else None
+
+# Recently used Recipe records, set with the RECIPE_CACHE_SIZE environment variable
+RECIPE_CACHE = catalog_utils.LRUCache(int(os.environ.get('RECIPE_CACHE_SIZE', '512')))
+
 
 def get_suace_item(request):
     """
     Returns an object containing the recipe (sauce) ID & spoken value by the User from the JSON request
     Values are computing from slot "Item" or from Alexa.Presentation.APL.UserEvent arguments
+    A spoken value without entity resolution match is resolved with the sauce names of the models
     """
     sauce_item = {'id': None, 'spoken': None}
-    logger.info("get_suace_item passed request: {}".format(request))
+    logger.debug("get_suace_item passed request: %s", request)
     if(request.object_type == 'Alexa.Presentation.APL.UserEvent'):
         sauce_item['id'] = request.arguments[1]
     else:
@@ -40,6 +66,9 @@ def get_suace_item(request):
                 itemSlot.resolutions.resolutions_per_authority[0].status and
                 str(itemSlot.resolutions.resolutions_per_authority[0].status.code) == 'StatusCode.ER_SUCCESS_MATCH'):
             sauce_item['id'] = itemSlot.resolutions.resolutions_per_authority[0].values[0].value.id
+        # No entity resolution match: look for a close sauce name (ex: misspelling, plural)
+        elif(sauce_item['spoken']):
+            sauce_item['id'] = resolver_utils.resolve_sauce_id(sauce_item['spoken'], request.locale)
 
     return sauce_item
 
@@ -48,25 +77,115 @@ def get_sauce_image(id):
     """
     Returns the image url of a specified recipe id
     """
-    url = RECIPE_IMAGES[id]
+    url = CATALOG_BACKEND.get_image(id)
     if(url):
         return url
     else:
         return RECIPE_DEFAULT_IMAGE
 
 
+class Recipe(namedtuple('Recipe', ('id', 'name', 'instructions', 'image', 'ssml', 'card_title', 'steps'))):
+    """
+    Immutable recipe record of a locale, with the values computed when it is compiled:
+        - image: image url of the sauce
+        - ssml: instructions wrapped in a speak tag (APL Karaoke)
+        - card_title: title of the card displayed in the Alexa app
+        - steps: instructions split in sentences, read one per turn in guided mode
+    """
+    __slots__ = ()
+
+
+class RecipeCatalog(Mapping):
+    """
+    Read-only dictionary of the Recipe records of a locale by recipe id, in the catalog order
+    Records are read from the catalog backend and compiled on first use, then kept
+    in the recently used recipes cache
+    """
+    __slots__ = ('locale', 'language')
+
+    def __init__(self, locale):
+        self.locale = locale
+        self.language = locale[:2]
+
+    def __getitem__(self, recipe_id):
+        key = (self.locale, recipe_id)
+        record = RECIPE_CACHE.get(key)
+        if record is None:
+            recipe = CATALOG_BACKEND.get_recipe(self.language, recipe_id)
+            if recipe is None:
+                raise KeyError(recipe_id)
+            record = compile_recipe(recipe_id, recipe[0], recipe[1], language_utils.get_locale_strings(self.locale),
+                                    get_recipe_steps(self.language, recipe_id, recipe[1]))
+            RECIPE_CACHE.put(key, record)
+        return record
+
+    def __iter__(self):
+        return CATALOG_BACKEND.iter_ids(self.language)
+
+    def __len__(self):
+        return CATALOG_BACKEND.count(self.language)
+
+    def at(self, position):
+        """
+        Returns the Recipe record at a position of the catalog order
+        """
+        return self[CATALOG_BACKEND.get_id(self.language, position)]
+
+
+# Catalogs by locale, created on first use
+CATALOGS = {}
+
+
+def get_recipe_steps(language, recipe_id, instructions):
+    """
+    Returns the steps of a recipe, split ahead of time if bundled
+    """
+    if RECIPE_STEPS is not None:
+        steps = RECIPE_STEPS.get(language, {}).get(recipe_id)
+        if steps:
+            return tuple(steps)
+    return step_utils.split_steps(instructions, language)
+
+
+def compile_recipe(recipe_id, name, instructions, data, steps):
+    """
+    Returns the Recipe record of a recipe for the locale strings
+    """
+    return Recipe(
+        id=recipe_id,
+        name=name,
+        instructions=instructions,
+        image=get_sauce_image(recipe_id),
+        ssml="<speak>{}</speak>".format(instructions),
+        card_title=data[prompts.DISPLAY_CARD_TITLE].format(data[prompts.SKILL_NAME], name),
+        steps=steps)
+
+
+def get_catalog(locale):
+    """
+    Returns the RecipeCatalog of a specific locale
+    Unknown locales share the catalog of their language (ex: "en" for "en-NZ")
+    """
+    catalog = CATALOGS.get(locale)
+    if catalog is None:
+        locale = language_utils.get_registry_locale(locale)
+        catalog = CATALOGS.get(locale)
+        if catalog is None:
+            catalog = RecipeCatalog(locale)
+            CATALOGS[locale] = catalog
+    return catalog
+
+
 def get_locale_specific_recipes(locale):
     """
-    Returns the recipe dictionary for a specific locale
+    Returns the Recipe records dictionary for a specific locale
     """
-    return recipes.translations[locale[:2]]
+    return get_catalog(locale)
 
 
 def get_random_recipe(handler_input):
     """
-    Returns a random localized recipe from the list of available recipes
+    Returns a random localized Recipe record from the list of available recipes
     """
-    locale = handler_input.request_envelope.request.locale
-    randRecipe = random.choice(
-        list(get_locale_specific_recipes(locale).items()))
-    return randRecipe[1]
+    catalog = get_catalog(handler_input.request_envelope.request.locale)
+    return catalog.at(random.randrange(len(catalog)))
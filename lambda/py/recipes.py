@@ -1,361 +0,0 @@
-# English
-
-en = {
-    'HON': {
-        'name': "Honey Mustard",
-        'instructions': "To make honey mustard, mix mayonnaise, yellow mustard, Dijon mustard, honey, and lemon juice together in a bowl. Cover and chill in the refrigerator overnight."
-    },
-    'BBQ': {
-        'name': 'BBQ',
-        'instructions': "To make BBQ sauce, combine brown sugar, ketchup, vinegar, and Worcestershire sauce in a blender. Season with salt, pepper, and cayenne pepper. Blend until smooth."
-    },
-    'RAN': {
-        'name': "Ranch",
-        'instructions': "For ranch dressing, whisk together mayonnaise, sour cream, chives, parsley, dill, garlic powder, onion powder, salt and pepper in a large bowl. Cover and refrigerate for 30 minutes before serving."
-    },
-    'CAE': {
-        'name': "Caesar",
-        'instructions': "For Caesar dressing, combine lemon juice, vinegar, water, shredded parmesan cheese, Dijon mustard, garlic powder and pepper in a jar. Cover with a lid and shake well. Refrigerate until ready to use."
-    },
-    'WOR': {
-        'name': "Worcestershire",
-        'instructions': "To make Worcestershire sauce, combine apple cider vinegar, water, soy sauce, brown sugar, mustard powder, onion powder, garlic powder, ground cinnamon, and a pinch of black pepper together in a saucepan \
-        bring to a boil and cook until fragrant, about 45 seconds, then cool to room temperature."
-    },
-    'THO': {
-        'name': "Thousand Island",
-        'instructions': "For Thousand Island dressing, mix together mayonnaise, ketchup, sweet pickle relish, salt and pepper in a small bowl until thoroughly combined. Chill and serve."
-    },
-    'PES': {
-        'name': "Pesto",
-        'instructions': "To make pesto, combine basil, garlic, Parmesan cheese, olive oil, and pine nuts in a food processor or blender. Blend to a smooth paste. Add parsley if desired."
-    },
-    'TAR': {
-        'name': "Tartar",
-        'instructions': "For tartar sauce, combine mayonnaise, chopped onion, sweet pickle relish, salt and pepper in a medium bowl. Mix well and let stand for at least 10 minutes before serving."
-    },
-    'PIZ': {
-        'name': "Pizza",
-        'instructions': "To make pizza sauce, mix together tomato sauce and tomato paste in a medium bowl until smooth. Stir in oregano, dried minced garlic and paprika."
-    },
-    'CRA': {
-        'name': "Cranberry",
-        'instructions': "For cranberry sauce, dissolve sugar in orange juice in a saucepan over medium heat. Stir in cranberries and cook until they start to pop. Remove from heat and transfer the sauce to a bowl before serving."
-    },
-    'SEC': {
-        'name': "Secret",
-        'instructions': "No need to butter me up, I can tell you're in a jam, but the secret sauce is safe with me."
-    }
-}
-
-# French
-fr = {
-    'HON': {
-        'name': "Moutarde au Miel",
-        'instructions': "Pour faire de la moutarde au miel, mélangez dans un bol la mayonnaise, la moutarde jaune, la moutarde de Dijon, le miel et le jus de citron. Couvrez et laissez au réfrigérateur pendant la nuit."
-    },
-    'BBQ': {
-        'name': "Barbecue",
-        'instructions': "Pour préparer une sauce barbecue, mélangez la cassonade, le ketchup, le vinaigre et la sauce Worcestershire dans un blender. Assaisonnez avec du sel, du poivre et du poivre de Cayenne. Mélangez jusqu'à obtenir une consistance lisse."
-    },
-    'RAN': {
-        'name': "Ranch",
-        'instructions': "Dans un grand bol, mélangez au fouet la mayonnaise, la crème fraîche, la ciboulette, le persil, l’aneth, la poudre d’ail, la poudre d’oignon, le sel et le poivre. Couvrir et réfrigérer 30 minutes avant de servir. Votre sauce ranch est prête à déguster!"
-    },
-    'CAE': {
-        'name': "César",
-        'instructions': "Mélanger le jus de citron, le vinaigre, l'eau, le parmesan râpé, la moutarde de Dijon, la poudre d'ail et le poivre dans un pot. Couvrir avec un couvercle et bien agiter. Réfrigérez jusqu'au moment de servir la sauce César."
-    },
-    'WOR': {
-        'name': "Worcestershire",
-        'instructions': "Pour préparer la sauce Worcestershire, combinez le vinaigre de cidre, l'eau, la sauce soja, la cassonade, la poudre de moutarde, la poudre d'oignon, la poudre d'ail, la cannelle en poudre et une pincée de poivre noir dans une casserole. Portez à ébullition et laissez cuire environ 45 secondes, puis laisser refroidir à température ambiante."
-    },
-    'THO': {
-        'name': "Vinaigrette aux Mille -îles",
-        'instructions': "Pour la vinaigrette aux mille -îles, mélangez la mayonnaise, le ketchup, la relish au cornichon, le sel et le poivre dans un petit bol jusqu'à obtenir un mélange homogène. Refroidissez et servez."
-    },
-    'PES': {
-        'name': "Pesto",
-        'instructions': "Pour faire un pesto, moudre le basilic, l'ail, le parmesan, l'huile d'olive et les pignons dans un mixeur. Mélangez jusqu'à obtention d'une pâte lisse. Ajoutez du persil selon votre goût."
-    },
-    'TAR': {
-        'name': "Tartare",
-        'instructions': "Pour la sauce tartare, ajoutez de la mayonnaise, de l'oignon haché, des cornichons, du sel et du poivre dans un bol de taille moyenne. Bien mélangez et laisser reposer au moins 10 minutes avant de servir."
-    },
-    'PIZ': {
-        'name': "Pizza",
-        'instructions': "Pour préparer une sauce de pizza, mélangez de la sauce tomate et de la pâte de tomates dans un bol de taille moyenne jusqu'à obtenir une consistance lisse. Puis, incorporez de l'origan, de l'ail sec préalablement haché et du paprika."
-    },
-    'CRA': {
-        'name': "Canneberges",
-        'instructions': "Pour la sauce aux canneberges, faire fondre du sucre dans du jus d’orange à feu moyen. Incorporez les canneberges et faites les cuire jusqu'à ce qu'elles commencent à apparaître. Retirez du feu et présentez la sauce dans un bol avant de servir."
-    },
-    'SEC': {
-        'name': "Secrete",
-        'instructions': "Bien essayez mais la recette secrète est bien gardée avec moi, inutile d'insister!"
-    }
-}
-
-# Espanol
-es = {
-    'HON': {
-        'name': "Mostaza y Miel",
-        'instructions': "Para preparar salsa de mostaza y miel, mezcla mayonesa, mostaza dulce, mostaza de dijon, miel, y zumo de limón en un cuenco. Cubre y enfría en la nevera durante toda la noche."
-    },
-    'BBQ': {
-        'name': "Barbacoa",
-        'instructions': "Para hacer salsa barbacoa, mezcla azúcar moreno, ketchup, vinagre, y salsa Worcestershire en una batidora. Sazona con sal, pimienta, y pimienta cayena. Báte hasta que quede una salsa homogénea."
-    },
-    'RAN': {
-        'name': "Ranchera",
-        'instructions': "Para la salsa ranchera, mezcle la mayonesa, la crema agria, las cebolletas, el perejil, el eneldo, el ajo en polvo, la cebolla en polvo, la sal y la pimienta en un tazón grande. Cubra y refrigere por 30 minutos antes de servir."
-    },
-    'CAE': {
-        'name': "César",
-        'instructions': "Para la salsa César, combine el zumo de limón, el vinagre, el agua, el queso parmesano rallado, la mostaza de Dijon, el ajo en polvo y la pimienta en un frasco. Cubrir con una tapa y agitar bien. Refrigere hasta que esté listo para su uso."
-    },
-    'WOR': {
-        'name': "Worcestershire",
-        'instructions': "Para hacer la salsa Worcestershire, combine el vinagre de manzana, el agua, la salsa de soya, el azúcar morena, la mostaza en polvo, la cebolla en polvo, el ajo en polvo, la canela molida y una pizca de pimienta negra en una cacerola. Llevar a ebullición y cocinar hasta que esté fragante, aproximadamente 45 segundos, luego enfriar a temperatura ambiente."
-    },
-    'THO': {
-        'name': "Mil Islas",
-        'instructions': "Para la salsa mil islas, mezcle la mayonesa, el ketchup, la salsa de pepinillos dulces, la sal y la pimienta en un tazón pequeño hasta que estén bien mezclados. Enfriar y servir."
-    },
-    'PES': {
-        'name': "Pesto",
-        'instructions': "Para peparar el pesto, combine la albahaca, el ajo, el queso parmesano, el aceite de oliva y los piñones en un robot de cocina o licuadora. Mezclar hasta obtener una pasta suave. Agrega el perejil si lo deseas."
-    },
-    'TAR': {
-        'name': "Tártara",
-        'instructions': "Para la salsa tártara, combine la mayonesa, la cebolla picada, el condimento de pepinillo dulce, la sal y la pimienta en un tazón mediano. Mezclar bien y dejar reposar durante al menos 10 minutos antes de servir."
-    },
-    'PIZ': {
-        'name': "Pizza",
-        'instructions': "Para hacer la salsa para pizza, mezcle la salsa de tomate y la pasta de tomate en un tazón mediano hasta que quede suave. Agregue el orégano, el ajo picado y el pimentón dulce."
-    },
-    'CRA': {
-        'name': "Arándanos",
-        'instructions': "Para la salsa de arándanos, disuelva el azúcar en el zumo de naranja en una cacerola a fuego medio. Agregue los arándanos y cocine hasta que empiecen a reventar. Retire del fuego y vierta la salsa en un tazón antes de servir."
-    },
-    'SEC': {
-        'name': "Secreta",
-        'instructions': "No hace falta que me dores la píldora, ni le eches guindas al pavo, la salsa está a buen resguardo."
-    }
-}
-
-# Hindi
-hi = {
-    'HON': {
-        'name': "हनी मस्टर्ड",
-        'instructions': "हनी मस्टर्ड सॉस बनाने के लिए मेयनेज़, येलो मस्टर्ड, डिजन मस्टर्ड, हनी और लेमन जूस एक कटोरी में साथ मिलाए. उसके बाद उसे रात भर फ़्रिज में रक दें."
-    },
-    'BBQ': {
-        'name': 'BBQ',
-        'instructions': "BBQ sauce बनाने के लिए ब्राउन शुगर, केचप, विनेगर और वुस्टर्शर सॉस को ब्लेंडर मैं दाल दे. फिर सॉल्ट, पेपर और केएन पेपर से सीज़न करे. सॉस स्मूट होने तक ब्लेंड करे."
-    },
-    'RAN': {
-        'name': "रैंच",
-        'instructions': "एक लार्ज बौल मैं मेयनेज़, सौर क्रीम, चाइव्ज़, पार्स्ली, डिल, गार्लिक पाउडर, अन्यन पाउडर, नमक और पेपर को विस्क करे. ३० मिनट्स फ़्रिज में रखे और रैंच सॉस रेडी."
-    },
-    'CAE': {
-        'name': "सीज़र",
-        'instructions': "सीज़र ड्रेसिंग के लिए लेमन जूस, विनेगर, पानी, श्रेडेड पार्मेज़ान चीज़, डीज़ान मस्टर्ड, गार्लिक पाउडर और पेपर को एक बौल मैं मिला ले. फिर उसे बंद करे और अच्छे से शेक करे और इस्तेमाल करने तक फ़्रिज में रक दे."
-    },
-    'WOR': {
-        'name': "वुस्टर्शर",
-        'instructions': "वुस्टर्शर सॉस बनाने के लिए ऐपल साइडर विनेगर, पानी, सोई सॉस, ब्राउन शुगर, मस्टर्ड पाउडर, अन्यन पाउडर, गार्लिक पाउडर, ग्राउंड सिनमॉन और काली मिर्च मिलाले. फिर तक़रीबन ४५ सेकंड्ज़ उसे गरम करे और फिर ठंडा करके सर्व करे"
-    },
-    'THO': {
-        'name': "थाउज़ंड आयलंड",
-        'instructions': "थाउज़ंड आयलंड ड्रेसिंग के लिए, मयोनीस, केचप, स्वीट पिकल रेलिश, नमक और काली मिर्च एक कटोरी में मिला ले. उसके बाद फ़्रिज में रखे और फिर परोसे."
-    },
-    'PES': {
-        'name': "पेस्टो",
-        'instructions': "फ़ूड प्रॉसेसर या ब्लेंडर में बेज़िल, गार्लिक, पार्मेज़ान चीज़, ऑलिव ओयल और पाइन नट्स मिलाए और स्मूथ ब्लेंड करे. अगर आप चाहे तो आप पार्स्ली भी मिला सकते हैं."
-    },
-    'TAR': {
-        'name': "टरटर",
-        'instructions': "टरटर सॉस बनाने के लिए मयोनीस, कटा हुआ प्याज़, स्वीट पिकल रेलिश, नमक और काली मिर्च मिला ले और तक़रीबन दस मिनट के बाद सर्व करे"
-    },
-    'PIZ': {
-        'name': "पिज़्ज़ा",
-        'instructions': "पिज़्ज़ा सॉस बनाने के लिए टमाटर सॉस और टमाटर पेस्ट में मिलाके मिक्स करे. उसके बाद ओरेगनो, लहसुन और पप्रीका मिलाए. आपका सॉस रेडी हैं."
-    },
-    'CRA': {
-        'name': "क्रैन्बेरी",
-        'instructions': "क्रैन्बेरी सॉस के लिए धीमे आँच पर, ऑरेंज जूस मैं शक्कर मिलाए. क्रैन्बेरी मिलाए और उनके पोप होने तक पकाए. आपका सॉस रेडी हैं."
-    },
-    'SEC': {
-        'name': "सीक्रेट",
-        'instructions': "आपका सीक्रेट सॉस मेरे साथ सेफ़ हैं."
-    }
-}
-
-# Japanese
-ja = {
-    'HON': {
-        'name': "ハニーマスタード",
-        'instructions':
-        "ハニーマスタードを作るには、ボウルにマヨネーズ、イエローマスタード、ディジョンマスタード、ハチミツ、レモンジュースを混ぜます。 蓋をして冷蔵庫で一晩冷やすと出来上がり。"
-    },
-    'BBQ': {
-        'name': "バーベキュー",
-        'instructions':
-        "バーベキューソースを作るには、ブラウンシュガー、ケチャップ、酢、ウスターソースをブレンダーで混ぜます。 塩、コショウ、カイエンペッパーで味を整え、なめらかになるまでよくかき混ぜたら出来上がり。"
-    },
-    'RAN': {
-        'name': "ランチ",
-        'instructions':
-        "ランチドレッシングは、大きなボウルにマヨネーズ、サワークリーム、チャイブ、パセリ、ディル、ニンニクパウダー、オニオンパウダー、塩、コショウを混ぜます。 蓋をして、30分ほど冷蔵庫で冷やしたら出来上がりです。"
-    },
-    'CAE': {
-        'name': "シーザー",
-        'instructions':
-        "シーザードレッシングは、レモン汁、酢、水、細切りパルメザンチーズ、ディジョンマスタード、ガーリックパウダー、コショウを瓶に入れ、蓋をして、よく振ります。そのまま冷蔵庫で冷やしてください。"
-    },
-    'WOR': {
-        'name': "ウスター",
-        'instructions':
-        "ウスターソースを作るには、アップルサイダービネガー、水、醤油、黒糖、マスタードパウダー、オニオンパウダー、ニンニクパウダー、挽いたシナモン、黒胡椒をひとつまみを、鍋の中に入れてかき混ぜます。約45秒、香りが出るまで煮沸し、常温まで冷やしたら出来上がりです。"
-    },
-    'THO': {
-        'name': "サウザンドアイランド",
-        'instructions':
-        "サウザンドアイランドドレッシングは、マヨネーズ、ケチャップ、甘酢漬け、塩、胡椒を小さなボウルに入れて、よく混ぜ合わせます。 しばらく冷蔵庫で冷やしたら出来上がりです。"
-    },
-    'PES': {
-        'name': "ペスト",
-        'instructions':
-        "ペストソースを作るには、バジル、ニンニク、パルメザンチーズ、オリーブオイル、松の実をフードプロセッサーまたはミキサーで混ぜます。 滑らかなペーストになるまでブレンドします。 お好みでパセリを加えてもいいでしょう。"
-    },
-    'TAR': {
-        'name': "タルタル",
-        'instructions':
-        "タルタルソースは、マヨネーズ、玉ねぎのみじん切り、甘酢漬け、塩コショウを、ちゅうくらいのボウルに入れて、よくかき混ぜます。10分程度、そのまま放置すれば出来上がりです。"
-    },
-    'PIZ': {
-        'name': "ピザ",
-        'instructions':
-        "ピザソースを作るには、トマトソースとトマトペーストを、ちゅうくらいのボウルで滑らかになるまでよく混ぜ合わせます。 そこに、オレガノ、乾燥ニンニク、パプリカを加えて混ぜ合わせたら出来上がりです。"
-    },
-    'CRA': {
-        'name': "クランベリー",
-        'instructions':
-        "クランベリーソースは、鍋にオレンジジュースと砂糖を入れて中火で熱して溶かします。 クランベリーを入れてかき混ぜ、沸騰し始めるまで調理します。 火から下ろし、ソースをボウルに移したら出来上がりです。"
-    },
-    'SEC': {
-        'name': "シークレット",
-        'instructions':
-        "私を試してもダメですよ。知りたい気持ちはわかります。でも、シークレットソースの秘密は、、、言えません。"
-    }
-}
-
-# Portuguese
-
-pt = {
-    'HON': {
-        'name': "Mostarda e Mel",
-        'instructions': "Para fazer molho de mostarda e mel, misture maionese, mustarda amarela, mustarda Dijon, mel, e suco de limão em uma tigela. Cubra e deixe pernoitar na geladeira."
-    },
-    'BBQ': {
-        'name': "BBQ",
-        'instructions': "Para fazer molho BBQ, misture açúcar mascavo, ketchup, vinagre e molho Worcestershire em um liquidificador. Tempere com sal, pimenta em pó e pimenta caiena. Bater no liquidificador até obter uma mistura homogênea."
-    },
-    'RAN': {
-        'name': "Ranch",
-        'instructions': "Para molho ranch, misture maionese, creme de leite, cebolinha, salsa, endro, alho em pó, vebola em pó, sal e pimenta em uma tigela grande. Cubra e leve à geladeira pelo menos 30 minutos antes de servir."
-    },
-    'CAE': {
-        'name': "Caesar",
-        'instructions': "Para o molho César, combine suco de limão, vinagre, água, queijo parmesão ralado, mostarda Dijon, alho em pó e pimenta em uma jarra. Feche com uma tampa e agite bem. Leve à geladeira até a hora de usar."
-    },
-    'WOR': {
-        'name': "Worcestershire",
-        'instructions': "Para fazer molho Worcestershire, combine vinagre de maçã, água, molho de soja, açúcar mascavo, mostarda em pó, cebola em pó, alho em pó, canela moída e uma pitada de pimenta do reino em uma panela. Deixe ferver e cozinhe até ficar perfumado, cerca de 45 segundos, e deixe esfriar até a temperatura ambiente."
-    },
-    'THO': {
-        'name': "Thousand Island",
-        'instructions': "Para o molho Thousand Island, combine maionese, ketchup, relish de pepino, sal e pimenta e uma tigela pequena até obter uma mistura homogênea. Resfrie e sirva."
-    },
-    'PES': {
-        'name': "Pesto",
-        'instructions': "Para fazer pesto, combine manjericão, alho, queijo parmesão, azeite de oliva e pinhões em um liquidificador. Bata até que a mistura fique homogênea. Adicione salsinha a gosto."
-    },
-    'TAR': {
-        'name': "Tártaro",
-        'instructions': "A receita do molho tártaro consiste em misturar maionese, cebola picada, relish de pepino sal e pimenta em uma tigela média. Misture bem e deixe descansar por pelo menos 10 minutos antes de servir."
-    },
-    'PIZ': {
-        'name': "Pizza",
-        'instructions': "Para fazer molho de pizza, misture molho de tomate e pasta de tomate em uma tigela média até obter uma mistura homogênea. Misture orégano, alho picado seco e colorau."
-    },
-    'CRA': {
-        'name': "Cranberry",
-        'instructions': "Para o molho de cranberry, dissolva açúcar em suco de laranja em uma panela em fogo médio. Misture os cranberries e cozinhe até começarem a estalar. Retire do fogo e transfira o molho para uma tigela antes de servir."
-    },
-    'SEC': {
-        'name': "Secreto",
-        'instructions': "Vocé é muito doce, mas não se preocupe. A receita secreta está bem segura comigo."
-    }
-}
-
-# Deutsche
-
-de = {
-    'HON': {
-        'name': "Honig Senf",
-        'instructions': "Für eine Honig-Senf-Sauce benötigst Du Mayonaise, scharfen Senf, süßen Senf, und etwas Zitronensaft. Verrühr alles in einer Schüssel, und lass es über Nacht im Kühlschrank ziehen."
-    },
-    'BBQ': {
-        'name': 'BBQ',
-        'instructions': "Für eine Barbecue-Sauce benötigst Du braunen Zucker, Ketchup, Essig, Woucestersauce, Salz, Pfeffer und Cayenne-Pfeffer. Verrühr alle Zutaten mit einem Mixer, bis die Sauce eine gleichmäßige Konsistenz hat."
-    },
-    'RAN': {
-        'name': "Ranch",
-        'instructions': "Für ein Ranch-Dressing benötigst Du Mayonaise, Schmand, Schnittlauch, Petersilie, Dill, Knoblauchpulver, Zwiebelpulver, Salz und Pfeffer. Verrühr alles in einer großen Schüssel, und lass es vor dem Servieren 30 Minuten ziehen."
-    },
-    'CAE': {
-        'name': "Caesar",
-        'instructions': "Für eine Caesar-Sauce benötigst Du Zitronensaft, Essig, Wasser, geriebenen Parmesan, süßen Senf, Knoblauchpulver und Pfeffer. Verrühr alle Zutaten in einem verschließbaren Schüssel, schüttel es gut durch, und stell es vor dem Servieren kühl."
-    },
-    'WOR': {
-        'name': "Worcestershire",
-        'instructions': "Für eine Worcestershire-Sauce benötigst Du Apfelessig, Wasser, Sojasauce, baunen Zucker, Senfpulver, Zwiebelpulver, Knoblauchpulver, gemahlenen Zimt, und eine Prise Pfeffer. Vermenge alles in einer Pfanne, bring es für etwa 45 Sekunden zum Kochen, und dann lass es abkühlen."
-    },
-    'THO': {
-        'name': "Thousand Island",
-        'instructions': "Für ein Thousand-Island-Dressing benötigst Du Mayonaise, Ketchup, Gewürzgurken, süßen Relish, Salz und Pfeffer. Vermische alles in einer kleinen Schüssel, und serviere es gekühlt."
-    },
-    'PES': {
-        'name': "Pesto",
-        'instructions': "Für eine Pesto-Sauce benötigst Du Basilikum, Knoblauch, Parmesan, Olivenöl und Pinienkerne. Zerkleinere alles in einem Mixer zu einer gleichmäßigen Masse, und gib nach Bedarf Petersilie dazu."
-    },
-    'TAR': {
-        'name': "Tartar",
-        'instructions': "Für eine Tartar-Sauce benötigst Du Mayonaise, Zwiebelwürfel, süßen Relish, Pfeffer und Salz. Vermische alles in einer mittelgroßen Schüssel, und lass es vor dem Servieren für 30 Minuten ziehen. "
-    },
-    'PIZ': {
-        'name': "Pizza",
-        'instructions': "Für eine Pizza-Sauce benötigst Du Tomatensauce, Tomatenmark, Oregano, Knoblauchwürfel und Paprika. Vermische alles in einer mittelgroßen Schüssel zu einer gleichmäßigen Masse. "
-    },
-    'CRA': {
-        'name': "Cranberry",
-        'instructions': "Für eine Cranberry-Sauce benötigst Du Zucker, Orangensaft und Cranberries. Löse zunächst den Zucker im Orangensaft in einer Pfanne auf mittlerer Hitze auf. Gib dann die Cranberries dazu und koche sie, bis sie sich öffnen. Nimm die Sauce vom Herd und serviere sie abgekühlt in einer Schüssel. "
-    },
-    'SEC': {
-        'name': "Secret",
-        'instructions': "Das Rezept für die geheime Sauce ist bei mir sicher. Du brauchst gar nicht weiter versuchen, es aus mir raus zu quetschen!"
-    }
-}
-
-
-translations = {
-    'en': en,
-    'fr': fr,
-    'es': es,
-    'hi': hi,
-    'ja': ja,
-    'pt': pt,
-    'de': de
-}
@@ -0,0 +1,38 @@
+import importlib
+from collections.abc import Mapping
+
+# Languages with recipes, each one defined in its own module (ex: recipes/en.py)
+LANGUAGES = ('en', 'fr', 'es', 'hi', 'ja', 'pt', 'de', 'it')
+
+
+class _LazyTranslations(Mapping):
+    """
+    Recipes dictionaries by language
+    The recipes of a language are only imported the first time they are used
+    """
+
+    def __init__(self, languages):
+        self._languages = languages
+        self._loaded = {}
+
+    def __getitem__(self, language):
+        recipes = self._loaded.get(language)
+        if recipes is None:
+            if language not in self._languages:
+                raise KeyError(language)
+            module = importlib.import_module('.' + language, __name__)
+            recipes = getattr(module, language)
+            self._loaded[language] = recipes
+        return recipes
+
+    def __contains__(self, language):
+        return language in self._languages
+
+    def __iter__(self):
+        return iter(self._languages)
+
+    def __len__(self):
+        return len(self._languages)
+
+
+translations = _LazyTranslations(LANGUAGES)
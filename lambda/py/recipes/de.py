@@ -0,0 +1,48 @@
+# Deutsche
+
+de = {
+    'HON': {
+        'name': "Honig Senf",
+        'instructions': "Für eine Honig-Senf-Sauce benötigst Du Mayonaise, scharfen Senf, süßen Senf, und etwas Zitronensaft. Verrühr alles in einer Schüssel, und lass es über Nacht im Kühlschrank ziehen."
+    },
+    'BBQ': {
+        'name': 'BBQ',
+        'instructions': "Für eine Barbecue-Sauce benötigst Du braunen Zucker, Ketchup, Essig, Woucestersauce, Salz, Pfeffer und Cayenne-Pfeffer. Verrühr alle Zutaten mit einem Mixer, bis die Sauce eine gleichmäßige Konsistenz hat."
+    },
+    'RAN': {
+        'name': "Ranch",
+        'instructions': "Für ein Ranch-Dressing benötigst Du Mayonaise, Schmand, Schnittlauch, Petersilie, Dill, Knoblauchpulver, Zwiebelpulver, Salz und Pfeffer. Verrühr alles in einer großen Schüssel, und lass es vor dem Servieren 30 Minuten ziehen."
+    },
+    'CAE': {
+        'name': "Caesar",
+        'instructions': "Für eine Caesar-Sauce benötigst Du Zitronensaft, Essig, Wasser, geriebenen Parmesan, süßen Senf, Knoblauchpulver und Pfeffer. Verrühr alle Zutaten in einem verschließbaren Schüssel, schüttel es gut durch, und stell es vor dem Servieren kühl."
+    },
+    'WOR': {
+        'name': "Worcestershire",
+        'instructions': "Für eine Worcestershire-Sauce benötigst Du Apfelessig, Wasser, Sojasauce, baunen Zucker, Senfpulver, Zwiebelpulver, Knoblauchpulver, gemahlenen Zimt, und eine Prise Pfeffer. Vermenge alles in einer Pfanne, bring es für etwa 45 Sekunden zum Kochen, und dann lass es abkühlen."
+    },
+    'THO': {
+        'name': "Thousand Island",
+        'instructions': "Für ein Thousand-Island-Dressing benötigst Du Mayonaise, Ketchup, Gewürzgurken, süßen Relish, Salz und Pfeffer. Vermische alles in einer kleinen Schüssel, und serviere es gekühlt."
+    },
+    'PES': {
+        'name': "Pesto",
+        'instructions': "Für eine Pesto-Sauce benötigst Du Basilikum, Knoblauch, Parmesan, Olivenöl und Pinienkerne. Zerkleinere alles in einem Mixer zu einer gleichmäßigen Masse, und gib nach Bedarf Petersilie dazu."
+    },
+    'TAR': {
+        'name': "Tartar",
+        'instructions': "Für eine Tartar-Sauce benötigst Du Mayonaise, Zwiebelwürfel, süßen Relish, Pfeffer und Salz. Vermische alles in einer mittelgroßen Schüssel, und lass es vor dem Servieren für 30 Minuten ziehen. "
+    },
+    'PIZ': {
+        'name': "Pizza",
+        'instructions': "Für eine Pizza-Sauce benötigst Du Tomatensauce, Tomatenmark, Oregano, Knoblauchwürfel und Paprika. Vermische alles in einer mittelgroßen Schüssel zu einer gleichmäßigen Masse. "
+    },
+    'CRA': {
+        'name': "Cranberry",
+        'instructions': "Für eine Cranberry-Sauce benötigst Du Zucker, Orangensaft und Cranberries. Löse zunächst den Zucker im Orangensaft in einer Pfanne auf mittlerer Hitze auf. Gib dann die Cranberries dazu und koche sie, bis sie sich öffnen. Nimm die Sauce vom Herd und serviere sie abgekühlt in einer Schüssel. "
+    },
+    'SEC': {
+        'name': "Secret",
+        'instructions': "Das Rezept für die geheime Sauce ist bei mir sicher. Du brauchst gar nicht weiter versuchen, es aus mir raus zu quetschen!"
+    }
+}
@@ -0,0 +1,49 @@
+# English
+
+en = {
+    'HON': {
+        'name': "Honey Mustard",
+        'instructions': "To make honey mustard, mix mayonnaise, yellow mustard, Dijon mustard, honey, and lemon juice together in a bowl. Cover and chill in the refrigerator overnight."
+    },
+    'BBQ': {
+        'name': 'BBQ',
+        'instructions': "To make BBQ sauce, combine brown sugar, ketchup, vinegar, and Worcestershire sauce in a blender. Season with salt, pepper, and cayenne pepper. Blend until smooth."
+    },
+    'RAN': {
+        'name': "Ranch",
+        'instructions': "For ranch dressing, whisk together mayonnaise, sour cream, chives, parsley, dill, garlic powder, onion powder, salt and pepper in a large bowl. Cover and refrigerate for 30 minutes before serving."
+    },
+    'CAE': {
+        'name': "Caesar",
+        'instructions': "For Caesar dressing, combine lemon juice, vinegar, water, shredded parmesan cheese, Dijon mustard, garlic powder and pepper in a jar. Cover with a lid and shake well. Refrigerate until ready to use."
+    },
+    'WOR': {
+        'name': "Worcestershire",
+        'instructions': "To make Worcestershire sauce, combine apple cider vinegar, water, soy sauce, brown sugar, mustard powder, onion powder, garlic powder, ground cinnamon, and a pinch of black pepper together in a saucepan \
+        bring to a boil and cook until fragrant, about 45 seconds, then cool to room temperature."
+    },
+    'THO': {
+        'name': "Thousand Island",
+        'instructions': "For Thousand Island dressing, mix together mayonnaise, ketchup, sweet pickle relish, salt and pepper in a small bowl until thoroughly combined. Chill and serve."
+    },
+    'PES': {
+        'name': "Pesto",
+        'instructions': "To make pesto, combine basil, garlic, Parmesan cheese, olive oil, and pine nuts in a food processor or blender. Blend to a smooth paste. Add parsley if desired."
+    },
+    'TAR': {
+        'name': "Tartar",
+        'instructions': "For tartar sauce, combine mayonnaise, chopped onion, sweet pickle relish, salt and pepper in a medium bowl. Mix well and let stand for at least 10 minutes before serving."
+    },
+    'PIZ': {
+        'name': "Pizza",
+        'instructions': "To make pizza sauce, mix together tomato sauce and tomato paste in a medium bowl until smooth. Stir in oregano, dried minced garlic and paprika."
+    },
+    'CRA': {
+        'name': "Cranberry",
+        'instructions': "For cranberry sauce, dissolve sugar in orange juice in a saucepan over medium heat. Stir in cranberries and cook until they start to pop. Remove from heat and transfer the sauce to a bowl before serving."
+    },
+    'SEC': {
+        'name': "Secret",
+        'instructions': "No need to butter me up, I can tell you're in a jam, but the secret sauce is safe with me."
+    }
+}
@@ -0,0 +1,47 @@
+# Espanol
+es = {
+    'HON': {
+        'name': "Mostaza y Miel",
+        'instructions': "Para preparar salsa de mostaza y miel, mezcla mayonesa, mostaza dulce, mostaza de dijon, miel, y zumo de limón en un cuenco. Cubre y enfría en la nevera durante toda la noche."
+    },
+    'BBQ': {
+        'name': "Barbacoa",
+        'instructions': "Para hacer salsa barbacoa, mezcla azúcar moreno, ketchup, vinagre, y salsa Worcestershire en una batidora. Sazona con sal, pimienta, y pimienta cayena. Báte hasta que quede una salsa homogénea."
+    },
+    'RAN': {
+        'name': "Ranchera",
+        'instructions': "Para la salsa ranchera, mezcle la mayonesa, la crema agria, las cebolletas, el perejil, el eneldo, el ajo en polvo, la cebolla en polvo, la sal y la pimienta en un tazón grande. Cubra y refrigere por 30 minutos antes de servir."
+    },
+    'CAE': {
+        'name': "César",
+        'instructions': "Para la salsa César, combine el zumo de limón, el vinagre, el agua, el queso parmesano rallado, la mostaza de Dijon, el ajo en polvo y la pimienta en un frasco. Cubrir con una tapa y agitar bien. Refrigere hasta que esté listo para su uso."
+    },
+    'WOR': {
+        'name': "Worcestershire",
+        'instructions': "Para hacer la salsa Worcestershire, combine el vinagre de manzana, el agua, la salsa de soya, el azúcar morena, la mostaza en polvo, la cebolla en polvo, el ajo en polvo, la canela molida y una pizca de pimienta negra en una cacerola. Llevar a ebullición y cocinar hasta que esté fragante, aproximadamente 45 segundos, luego enfriar a temperatura ambiente."
+    },
+    'THO': {
+        'name': "Mil Islas",
+        'instructions': "Para la salsa mil islas, mezcle la mayonesa, el ketchup, la salsa de pepinillos dulces, la sal y la pimienta en un tazón pequeño hasta que estén bien mezclados. Enfriar y servir."
+    },
+    'PES': {
+        'name': "Pesto",
+        'instructions': "Para peparar el pesto, combine la albahaca, el ajo, el queso parmesano, el aceite de oliva y los piñones en un robot de cocina o licuadora. Mezclar hasta obtener una pasta suave. Agrega el perejil si lo deseas."
+    },
+    'TAR': {
+        'name': "Tártara",
+        'instructions': "Para la salsa tártara, combine la mayonesa, la cebolla picada, el condimento de pepinillo dulce, la sal y la pimienta en un tazón mediano. Mezclar bien y dejar reposar durante al menos 10 minutos antes de servir."
+    },
+    'PIZ': {
+        'name': "Pizza",
+        'instructions': "Para hacer la salsa para pizza, mezcle la salsa de tomate y la pasta de tomate en un tazón mediano hasta que quede suave. Agregue el orégano, el ajo picado y el pimentón dulce."
+    },
+    'CRA': {
+        'name': "Arándanos",
+        'instructions': "Para la salsa de arándanos, disuelva el azúcar en el zumo de naranja en una cacerola a fuego medio. Agregue los arándanos y cocine hasta que empiecen a reventar. Retire del fuego y vierta la salsa en un tazón antes de servir."
+    },
+    'SEC': {
+        'name': "Secreta",
+        'instructions': "No hace falta que me dores la píldora, ni le eches guindas al pavo, la salsa está a buen resguardo."
+    }
+}
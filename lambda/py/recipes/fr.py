@@ -0,0 +1,47 @@
+# French
+fr = {
+    'HON': {
+        'name': "Moutarde au Miel",
+        'instructions': "Pour faire de la moutarde au miel, mélangez dans un bol la mayonnaise, la moutarde jaune, la moutarde de Dijon, le miel et le jus de citron. Couvrez et laissez au réfrigérateur pendant la nuit."
+    },
+    'BBQ': {
+        'name': "Barbecue",
+        'instructions': "Pour préparer une sauce barbecue, mélangez la cassonade, le ketchup, le vinaigre et la sauce Worcestershire dans un blender. Assaisonnez avec du sel, du poivre et du poivre de Cayenne. Mélangez jusqu'à obtenir une consistance lisse."
+    },
+    'RAN': {
+        'name': "Ranch",
+        'instructions': "Dans un grand bol, mélangez au fouet la mayonnaise, la crème fraîche, la ciboulette, le persil, l’aneth, la poudre d’ail, la poudre d’oignon, le sel et le poivre. Couvrir et réfrigérer 30 minutes avant de servir. Votre sauce ranch est prête à déguster!"
+    },
+    'CAE': {
+        'name': "César",
+        'instructions': "Mélanger le jus de citron, le vinaigre, l'eau, le parmesan râpé, la moutarde de Dijon, la poudre d'ail et le poivre dans un pot. Couvrir avec un couvercle et bien agiter. Réfrigérez jusqu'au moment de servir la sauce César."
+    },
+    'WOR': {
+        'name': "Worcestershire",
+        'instructions': "Pour préparer la sauce Worcestershire, combinez le vinaigre de cidre, l'eau, la sauce soja, la cassonade, la poudre de moutarde, la poudre d'oignon, la poudre d'ail, la cannelle en poudre et une pincée de poivre noir dans une casserole. Portez à ébullition et laissez cuire environ 45 secondes, puis laisser refroidir à température ambiante."
+    },
+    'THO': {
+        'name': "Vinaigrette aux Mille -îles",
+        'instructions': "Pour la vinaigrette aux mille -îles, mélangez la mayonnaise, le ketchup, la relish au cornichon, le sel et le poivre dans un petit bol jusqu'à obtenir un mélange homogène. Refroidissez et servez."
+    },
+    'PES': {
+        'name': "Pesto",
+        'instructions': "Pour faire un pesto, moudre le basilic, l'ail, le parmesan, l'huile d'olive et les pignons dans un mixeur. Mélangez jusqu'à obtention d'une pâte lisse. Ajoutez du persil selon votre goût."
+    },
+    'TAR': {
+        'name': "Tartare",
+        'instructions': "Pour la sauce tartare, ajoutez de la mayonnaise, de l'oignon haché, des cornichons, du sel et du poivre dans un bol de taille moyenne. Bien mélangez et laisser reposer au moins 10 minutes avant de servir."
+    },
+    'PIZ': {
+        'name': "Pizza",
+        'instructions': "Pour préparer une sauce de pizza, mélangez de la sauce tomate et de la pâte de tomates dans un bol de taille moyenne jusqu'à obtenir une consistance lisse. Puis, incorporez de l'origan, de l'ail sec préalablement haché et du paprika."
+    },
+    'CRA': {
+        'name': "Canneberges",
+        'instructions': "Pour la sauce aux canneberges, faire fondre du sucre dans du jus d’orange à feu moyen. Incorporez les canneberges et faites les cuire jusqu'à ce qu'elles commencent à apparaître. Retirez du feu et présentez la sauce dans un bol avant de servir."
+    },
+    'SEC': {
+        'name': "Secrete",
+        'instructions': "Bien essayez mais la recette secrète est bien gardée avec moi, inutile d'insister!"
+    }
+}
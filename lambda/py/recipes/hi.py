@@ -0,0 +1,47 @@
+# Hindi
+hi = {
+    'HON': {
+        'name': "हनी मस्टर्ड",
+        'instructions': "हनी मस्टर्ड सॉस बनाने के लिए मेयनेज़, येलो मस्टर्ड, डिजन मस्टर्ड, हनी और लेमन जूस एक कटोरी में साथ मिलाए. उसके बाद उसे रात भर फ़्रिज में रक दें."
+    },
+    'BBQ': {
+        'name': 'BBQ',
+        'instructions': "BBQ sauce बनाने के लिए ब्राउन शुगर, केचप, विनेगर और वुस्टर्शर सॉस को ब्लेंडर मैं दाल दे. फिर सॉल्ट, पेपर और केएन पेपर से सीज़न करे. सॉस स्मूट होने तक ब्लेंड करे."
+    },
+    'RAN': {
+        'name': "रैंच",
+        'instructions': "एक लार्ज बौल मैं मेयनेज़, सौर क्रीम, चाइव्ज़, पार्स्ली, डिल, गार्लिक पाउडर, अन्यन पाउडर, नमक और पेपर को विस्क करे. ३० मिनट्स फ़्रिज में रखे और रैंच सॉस रेडी."
+    },
+    'CAE': {
+        'name': "सीज़र",
+        'instructions': "सीज़र ड्रेसिंग के लिए लेमन जूस, विनेगर, पानी, श्रेडेड पार्मेज़ान चीज़, डीज़ान मस्टर्ड, गार्लिक पाउडर और पेपर को एक बौल मैं मिला ले. फिर उसे बंद करे और अच्छे से शेक करे और इस्तेमाल करने तक फ़्रिज में रक दे."
+    },
+    'WOR': {
+        'name': "वुस्टर्शर",
+        'instructions': "वुस्टर्शर सॉस बनाने के लिए ऐपल साइडर विनेगर, पानी, सोई सॉस, ब्राउन शुगर, मस्टर्ड पाउडर, अन्यन पाउडर, गार्लिक पाउडर, ग्राउंड सिनमॉन और काली मिर्च मिलाले. फिर तक़रीबन ४५ सेकंड्ज़ उसे गरम करे और फिर ठंडा करके सर्व करे"
+    },
+    'THO': {
+        'name': "थाउज़ंड आयलंड",
+        'instructions': "थाउज़ंड आयलंड ड्रेसिंग के लिए, मयोनीस, केचप, स्वीट पिकल रेलिश, नमक और काली मिर्च एक कटोरी में मिला ले. उसके बाद फ़्रिज में रखे और फिर परोसे."
+    },
+    'PES': {
+        'name': "पेस्टो",
+        'instructions': "फ़ूड प्रॉसेसर या ब्लेंडर में बेज़िल, गार्लिक, पार्मेज़ान चीज़, ऑलिव ओयल और पाइन नट्स मिलाए और स्मूथ ब्लेंड करे. अगर आप चाहे तो आप पार्स्ली भी मिला सकते हैं."
+    },
+    'TAR': {
+        'name': "टरटर",
+        'instructions': "टरटर सॉस बनाने के लिए मयोनीस, कटा हुआ प्याज़, स्वीट पिकल रेलिश, नमक और काली मिर्च मिला ले और तक़रीबन दस मिनट के बाद सर्व करे"
+    },
+    'PIZ': {
+        'name': "पिज़्ज़ा",
+        'instructions': "पिज़्ज़ा सॉस बनाने के लिए टमाटर सॉस और टमाटर पेस्ट में मिलाके मिक्स करे. उसके बाद ओरेगनो, लहसुन और पप्रीका मिलाए. आपका सॉस रेडी हैं."
+    },
+    'CRA': {
+        'name': "क्रैन्बेरी",
+        'instructions': "क्रैन्बेरी सॉस के लिए धीमे आँच पर, ऑरेंज जूस मैं शक्कर मिलाए. क्रैन्बेरी मिलाए और उनके पोप होने तक पकाए. आपका सॉस रेडी हैं."
+    },
+    'SEC': {
+        'name': "सीक्रेट",
+        'instructions': "आपका सीक्रेट सॉस मेरे साथ सेफ़ हैं."
+    }
+}
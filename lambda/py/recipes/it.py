@@ -0,0 +1,47 @@
+# Italian
+it = {
+    'HON': {
+        'name': "Mostarda e Miele",
+        'instructions': "Per preparare la salsa mostarda e miele, mescola in una ciotola maionese, senape gialla, senape di Digione, miele e succo di limone. Copri e lascia raffreddare in frigorifero per tutta la notte."
+    },
+    'BBQ': {
+        'name': "Barbeque",
+        'instructions': "Per preparare la salsa barbeque, metti nel frullatore zucchero di canna, ketchup, aceto e salsa Worcestershire. Condisci con sale, pepe e pepe di Caienna. Frulla fino a ottenere una salsa omogenea."
+    },
+    'RAN': {
+        'name': "Ranch",
+        'instructions': "Per la salsa ranch, sbatti in una ciotola grande maionese, panna acida, erba cipollina, prezzemolo, aneto, aglio in polvere, cipolla in polvere, sale e pepe. Copri e lascia in frigorifero per 30 minuti prima di servire."
+    },
+    'CAE': {
+        'name': "Caesar",
+        'instructions': "Per la salsa Caesar, metti in un barattolo succo di limone, aceto, acqua, parmigiano grattugiato, senape di Digione, aglio in polvere e pepe. Chiudi con il coperchio e agita bene. Conserva in frigorifero fino al momento di usarla."
+    },
+    'WOR': {
+        'name': "Worcestershire",
+        'instructions': "Per preparare la salsa Worcestershire, metti in un pentolino aceto di mele, acqua, salsa di soia, zucchero di canna, senape in polvere, cipolla in polvere, aglio in polvere, cannella e un pizzico di pepe nero. Porta a ebollizione e cuoci finché non diventa profumata, circa 45 secondi, poi lascia raffreddare a temperatura ambiente."
+    },
+    'THO': {
+        'name': "Mille Isole",
+        'instructions': "Per la salsa mille isole, mescola in una ciotolina maionese, ketchup, sottaceti dolci tritati, sale e pepe fino a ottenere un composto omogeneo. Fai raffreddare e servi."
+    },
+    'PES': {
+        'name': "Pesto",
+        'instructions': "Per preparare il pesto, metti nel mixer o nel frullatore basilico, aglio, parmigiano, olio d'oliva e pinoli. Frulla fino a ottenere una crema liscia. Aggiungi del prezzemolo se lo desideri."
+    },
+    'TAR': {
+        'name': "Tartara",
+        'instructions': "Per la salsa tartara, mescola in una ciotola media maionese, cipolla tritata, sottaceti dolci tritati, sale e pepe. Mescola bene e lascia riposare almeno 10 minuti prima di servire."
+    },
+    'PIZ': {
+        'name': "Pizza",
+        'instructions': "Per preparare la salsa per la pizza, mescola in una ciotola media passata di pomodoro e concentrato di pomodoro fino a ottenere un composto liscio. Aggiungi origano, aglio secco tritato e paprika."
+    },
+    'CRA': {
+        'name': "Mirtilli",
+        'instructions': "Per la salsa di mirtilli, sciogli lo zucchero nel succo d'arancia in un pentolino a fuoco medio. Aggiungi i mirtilli e cuoci finché non iniziano a scoppiare. Togli dal fuoco e versa la salsa in una ciotola prima di servire."
+    },
+    'SEC': {
+        'name': "Segreta",
+        'instructions': "Inutile che mi lisci il pelo, la ricetta della salsa segreta resta al sicuro con me."
+    }
+}
@@ -0,0 +1,58 @@
+# Japanese
+ja = {
+    'HON': {
+        'name': "ハニーマスタード",
+        'instructions':
+        "ハニーマスタードを作るには、ボウルにマヨネーズ、イエローマスタード、ディジョンマスタード、ハチミツ、レモンジュースを混ぜます。 蓋をして冷蔵庫で一晩冷やすと出来上がり。"
+    },
+    'BBQ': {
+        'name': "バーベキュー",
+        'instructions':
+        "バーベキューソースを作るには、ブラウンシュガー、ケチャップ、酢、ウスターソースをブレンダーで混ぜます。 塩、コショウ、カイエンペッパーで味を整え、なめらかになるまでよくかき混ぜたら出来上がり。"
+    },
+    'RAN': {
+        'name': "ランチ",
+        'instructions':
+        "ランチドレッシングは、大きなボウルにマヨネーズ、サワークリーム、チャイブ、パセリ、ディル、ニンニクパウダー、オニオンパウダー、塩、コショウを混ぜます。 蓋をして、30分ほど冷蔵庫で冷やしたら出来上がりです。"
+    },
+    'CAE': {
+        'name': "シーザー",
+        'instructions':
+        "シーザードレッシングは、レモン汁、酢、水、細切りパルメザンチーズ、ディジョンマスタード、ガーリックパウダー、コショウを瓶に入れ、蓋をして、よく振ります。そのまま冷蔵庫で冷やしてください。"
+    },
+    'WOR': {
+        'name': "ウスター",
+        'instructions':
+        "ウスターソースを作るには、アップルサイダービネガー、水、醤油、黒糖、マスタードパウダー、オニオンパウダー、ニンニクパウダー、挽いたシナモン、黒胡椒をひとつまみを、鍋の中に入れてかき混ぜます。約45秒、香りが出るまで煮沸し、常温まで冷やしたら出来上がりです。"
+    },
+    'THO': {
+        'name': "サウザンドアイランド",
+        'instructions':
+        "サウザンドアイランドドレッシングは、マヨネーズ、ケチャップ、甘酢漬け、塩、胡椒を小さなボウルに入れて、よく混ぜ合わせます。 しばらく冷蔵庫で冷やしたら出来上がりです。"
+    },
+    'PES': {
+        'name': "ペスト",
+        'instructions':
+        "ペストソースを作るには、バジル、ニンニク、パルメザンチーズ、オリーブオイル、松の実をフードプロセッサーまたはミキサーで混ぜます。 滑らかなペーストになるまでブレンドします。 お好みでパセリを加えてもいいでしょう。"
+    },
+    'TAR': {
+        'name': "タルタル",
+        'instructions':
+        "タルタルソースは、マヨネーズ、玉ねぎのみじん切り、甘酢漬け、塩コショウを、ちゅうくらいのボウルに入れて、よくかき混ぜます。10分程度、そのまま放置すれば出来上がりです。"
+    },
+    'PIZ': {
+        'name': "ピザ",
+        'instructions':
+        "ピザソースを作るには、トマトソースとトマトペーストを、ちゅうくらいのボウルで滑らかになるまでよく混ぜ合わせます。 そこに、オレガノ、乾燥ニンニク、パプリカを加えて混ぜ合わせたら出来上がりです。"
+    },
+    'CRA': {
+        'name': "クランベリー",
+        'instructions':
+        "クランベリーソースは、鍋にオレンジジュースと砂糖を入れて中火で熱して溶かします。 クランベリーを入れてかき混ぜ、沸騰し始めるまで調理します。 火から下ろし、ソースをボウルに移したら出来上がりです。"
+    },
+    'SEC': {
+        'name': "シークレット",
+        'instructions':
+        "私を試してもダメですよ。知りたい気持ちはわかります。でも、シークレットソースの秘密は、、、言えません。"
+    }
+}
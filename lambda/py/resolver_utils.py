@@ -0,0 +1,200 @@
+import json
+import heapq
+import logging
+import unicodedata
+import asset_utils
+from functools import lru_cache
+
+logger = logging.getLogger("main")
+logger.setLevel(logging.INFO)
+
+# Values and synonyms of the LIST_OF_ITEMS slot type by locale and sauce id
+# Generated from models/*.json with tools/build_sauce_names.py
+SAUCE_NAMES_FILE = "sauce_names.json"
+
+# Max number of candidates (sharing the most trigrams) scored by edit distance
+MAX_CANDIDATES = 8
+
+# Max edit distance of a match, lower for short names (see get_max_distance)
+MAX_DISTANCE = 3
+
+# Spoken values resolved by the resolver, per container
+RESOLVE_CACHE_SIZE = 256
+
+
+def normalize(text):
+    """
+    Returns the lookup key of a sauce name: case folded, without spaces, punctuation
+    and accents of latin letters (ex: "Mille Îles" -> "milleiles", "b. b. q." -> "bbq")
+    Marks of other scripts (ex: Japanese dakuten, Devanagari vowel signs) are kept
+    """
+    chars = []
+    base = ''
+    for char in unicodedata.normalize('NFKD', text.casefold()):
+        category = unicodedata.category(char)
+        if category[0] == 'M':
+            # Accent of a latin letter (below the IPA extensions block)
+            if base < '\u0250':
+                continue
+        elif category[0] in 'LN':
+            base = char
+        else:
+            base = ''
+            continue
+        chars.append(char)
+    return unicodedata.normalize('NFKC', ''.join(chars))
+
+
+def trigrams(key):
+    """
+    Returns the set of trigrams of a lookup key, padded to index its first and last letters
+    """
+    padded = '^' + key + '$'
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def get_max_distance(key):
+    """
+    Returns the max edit distance of a match for a lookup key: none under 3 letters,
+    then about 2 edits every 5 letters up to MAX_DISTANCE
+    """
+    if len(key) < 3:
+        return 0
+    return min(MAX_DISTANCE, max(1, len(key) * 2 // 5))
+
+
+def edit_distance(a, b, bound):
+    """
+    Returns the edit distance (insertions, deletions, substitutions and adjacent
+    transpositions) of two strings, or bound + 1 as soon as it is above the bound
+    """
+    if abs(len(a) - len(b)) > bound:
+        return bound + 1
+    # Only the cells of the diagonal band are computed, the others are above the bound
+    above = bound + 1
+    before = None
+    previous = [j if j < above else above for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        char = a[i - 1]
+        current = [i if i < above else above] + [above] * len(b)
+        lowest = current[0]
+        for j in range(max(1, i - bound), min(len(b), i + bound) + 1):
+            distance = previous[j - 1] if char == b[j - 1] else previous[j - 1] + 1
+            if previous[j] + 1 < distance:
+                distance = previous[j] + 1
+            if current[j - 1] + 1 < distance:
+                distance = current[j - 1] + 1
+            if i > 1 and j > 1 and char == b[j - 2] and a[i - 2] == b[j - 1] and before[j - 2] + 1 < distance:
+                distance = before[j - 2] + 1
+            if distance > above:
+                distance = above
+            current[j] = distance
+            if distance < lowest:
+                lowest = distance
+        if lowest > bound:
+            return above
+        before, previous = previous, current
+    return previous[-1]
+
+
+class SauceIndex(object):
+    """
+    Index of the sauce names of every locale
+        - names: sauce id and locales of each lookup key (ex: "bbq" -> ("BBQ", {"en-US", ...}))
+        - grams: lookup keys of each trigram
+        - sizes: number of trigrams of each lookup key
+    """
+    __slots__ = ('names', 'grams', 'sizes')
+
+    def __init__(self, sauce_names):
+        self.names = {}
+        self.grams = {}
+        self.sizes = {}
+        for locale, sauces in sauce_names.items():
+            for sauce_id, values in sauces.items():
+                for value in values:
+                    key = normalize(value)
+                    if not key:
+                        continue
+                    if key in self.names:
+                        if self.names[key][0] != sauce_id:
+                            raise ValueError("Sauce name {} is used by {} and {}".format(
+                                value, self.names[key][0], sauce_id))
+                        self.names[key][1].add(locale)
+                    else:
+                        self.names[key] = (sauce_id, {locale})
+                        grams = trigrams(key)
+                        self.sizes[key] = len(grams)
+                        for gram in grams:
+                            self.grams.setdefault(gram, []).append(key)
+
+    def resolve(self, spoken, locale):
+        """
+        Returns the sauce id of a spoken value or None if there is no close enough name
+        Names of the request locale win over the names of other locales at the same distance,
+        and a tie between different sauces is not resolved
+        """
+        key = normalize(spoken)
+        if not key:
+            return None
+        name = self.names.get(key)
+        if name is not None:
+            return name[0]
+        bound = get_max_distance(key)
+        if bound == 0:
+            return None
+        # Candidates are the names sharing the most trigrams with the spoken value
+        grams = trigrams(key)
+        shared = {}
+        for gram in grams:
+            for candidate in self.grams.get(gram, ()):
+                shared[candidate] = shared.get(candidate, 0) + 1
+        # An edit changes at most 3 trigrams: names sharing fewer trigrams are too far
+        candidates = [candidate for candidate, count in shared.items()
+                      if count >= max(len(grams), self.sizes[candidate]) - 3 * bound]
+        candidates = heapq.nlargest(MAX_CANDIDATES, candidates, key=lambda candidate: (shared[candidate], candidate))
+        best_score = None
+        best_ids = set()
+        for candidate in candidates:
+            distance = edit_distance(key, candidate, bound)
+            if distance > bound:
+                continue
+            # Farther names can no longer win
+            bound = distance
+            sauce_id, locales = self.names[candidate]
+            score = (distance, locale not in locales)
+            if best_score is None or score < best_score:
+                best_score = score
+                best_ids = {sauce_id}
+            elif score == best_score:
+                best_ids.add(sauce_id)
+        if len(best_ids) != 1:
+            return None
+        return best_ids.pop()
+
+
+# Built on first use, as most requests are resolved by Alexa entity resolution
+SAUCE_INDEX = []
+
+
+def get_sauce_index():
+    """
+    Returns the SauceIndex of the sauce names file, loaded once per container
+    """
+    if not SAUCE_INDEX:
+        sauce_names = asset_utils.get_asset('sauce_names')
+        if sauce_names is None:
+            with open(SAUCE_NAMES_FILE, encoding='utf-8') as f:
+                sauce_names = json.load(f)
+        SAUCE_INDEX.append(SauceIndex(sauce_names))
+    return SAUCE_INDEX[0]
+
+
+@lru_cache(maxsize=RESOLVE_CACHE_SIZE)
+def resolve_sauce_id(spoken, locale):
+    """
+    Returns the sauce id of a value spoken by the user, when Alexa entity resolution has no match
+    """
+    sauce_id = get_sauce_index().resolve(spoken, locale)
+    logger.debug("Resolved spoken value %s to %s", spoken, sauce_id)
+    return sauce_id
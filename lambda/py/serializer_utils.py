@@ -0,0 +1,139 @@
+import json
+
+from ask_sdk_core.serialize import DefaultSerializer
+from ask_sdk_model import Response
+
+
+class SerializedDocument(dict):
+    """
+    JSON document that is serialized once and reused in every response
+    The dict content is already JSON compatible, so the skill serializer
+    returns it as is instead of walking it again on every request
+    The compact JSON text is kept in `json`, spliced as is by dumps
+    It is shared between requests and must not be mutated
+    """
+
+    def __init__(self, document):
+        super().__init__(document)
+        self.json = json.dumps(document, separators=(',', ':'), ensure_ascii=False)
+
+
+# Placeholder of the serialized documents in the JSON text of a response envelope (see dumps)
+DOCUMENT_PLACEHOLDER = '\x00serialized-document-{}\x00'
+
+
+def dumps(serialized):
+    """
+    Returns the compact JSON text of a serialized response envelope
+    The documents of the RenderDocument directives which are serialized documents
+    are not encoded again: their JSON text is spliced in the output as is
+    """
+    response = serialized.get('response')
+    directives = response.get('directives') if response else None
+    documents = []
+    if directives:
+        copies = []
+        for directive in directives:
+            document = directive.get('document')
+            if type(document) is SerializedDocument:
+                directive = dict(directive, document=DOCUMENT_PLACEHOLDER.format(len(documents)))
+                documents.append(document.json)
+            copies.append(directive)
+        if documents:
+            serialized = dict(serialized, response=dict(response, directives=copies))
+    text = json.dumps(serialized, separators=(',', ':'), ensure_ascii=False)
+    for index, document in enumerate(documents):
+        text = text.replace(json.dumps(DOCUMENT_PLACEHOLDER.format(index)), document, 1)
+    return text
+
+
+class RenderedResponse(Response):
+    """
+    Response already serialized, rendered from a response template (see template_utils)
+    The serialized dict is returned as is by the skill serializer, the output speech
+    and reprompt models are only set for the response interceptors
+    Parts of the serialized dict are shared with the template and must not be mutated
+    """
+
+    def __init__(self, serialized, output_speech=None, reprompt=None, should_end_session=None):
+        super().__init__(output_speech=output_speech, reprompt=reprompt, should_end_session=should_end_session)
+        self.serialized = serialized
+
+    def to_dict(self):
+        return self.serialized
+
+
+# Model types emitted by the skill (module.class), serialized from a table of their
+# fields instead of the reflection of the default serializer. Names rather than
+# classes, so that the APL models are only imported when a screen is rendered
+FAST_PATH_TYPES = frozenset((
+    'ask_sdk_model.response_envelope.ResponseEnvelope',
+    'ask_sdk_model.response.Response',
+    'ask_sdk_model.ui.ssml_output_speech.SsmlOutputSpeech',
+    'ask_sdk_model.ui.reprompt.Reprompt',
+    'ask_sdk_model.ui.standard_card.StandardCard',
+    'ask_sdk_model.ui.image.Image',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.render_document_directive.RenderDocumentDirective',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.execute_commands_directive.ExecuteCommandsDirective',
+    'ask_sdk_model.interfaces.alexa.presentation.apl.speak_item_command.SpeakItemCommand'
+))
+
+# JSON values returned as is
+JSON_SCALAR_TYPES = frozenset((str, int, float, bool))
+
+
+def get_fields(model_type):
+    """
+    Returns the (attribute, json key) of a fast path model type in serialization order,
+    None for the other types (serialized by the default serializer)
+    """
+    if model_type.__module__ + '.' + model_type.__qualname__ not in FAST_PATH_TYPES:
+        return None
+    attribute_map = getattr(model_type, 'attribute_map', {})
+    return tuple((attr, attribute_map.get(attr, attr)) for attr in model_type.deserialized_types)
+
+
+class SkillSerializer(DefaultSerializer):
+    """
+    Serializer of the skill responses:
+        - skips the already serialized documents and responses
+        - serializes the model types the skill emits (FAST_PATH_TYPES) from their fields table
+        - falls back to the default serializer for any other type
+    The output is the same as the default serializer: keys in the order of the model
+    deserialized_types, None attributes left out
+    """
+
+    def __init__(self):
+        # Fields table of each serialized type, None for the types of the default serializer
+        self._fields = {}
+
+    def serialize(self, obj):
+        if obj is None:
+            return None
+        obj_type = type(obj)
+        if obj_type in JSON_SCALAR_TYPES:
+            return obj
+        if obj_type is dict:
+            return {key: self.serialize(value) for key, value in obj.items()}
+        if obj_type is list:
+            return [self.serialize(item) for item in obj]
+        if obj_type is SerializedDocument:
+            return obj
+        if obj_type is RenderedResponse:
+            return obj.serialized
+        try:
+            fields = self._fields[obj_type]
+        except KeyError:
+            fields = self._fields[obj_type] = get_fields(obj_type)
+        if fields is None:
+            if isinstance(obj, SerializedDocument):
+                return obj
+            if isinstance(obj, RenderedResponse):
+                return obj.serialized
+            return super().serialize(obj)
+        serialized = {}
+        for attr, key in fields:
+            value = getattr(obj, attr)
+            if value is not None:
+                serialized[key] = self.serialize(value)
+        return serialized
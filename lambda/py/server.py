@@ -0,0 +1,194 @@
+"""
+Self-hosted HTTP endpoint of the skill
+
+`application` is a WSGI application serving the same handlers as lambda_function.lambda_handler:
+the Alexa request envelope is POSTed as json and the response envelope is returned as json.
+The signature and the timestamp of the requests are verified before they are handled (see verifier_utils).
+It can be served by any multi-threaded WSGI server, or by the worker pool server of this module.
+The working directory must be the lambda folder, as the skill loads its files from it.
+
+usage: python server.py [--host 127.0.0.1] [--port 8080] [--workers 8] [--capture requests/]
+"""
+import os
+import sys
+import logging
+import argparse
+import template_utils
+import serializer_utils
+import verifier_utils
+import lambda_function
+
+from concurrent.futures import ThreadPoolExecutor
+from ask_sdk_core.exceptions import SerializationException
+from wsgiref.simple_server import WSGIServer, WSGIRequestHandler
+
+logger = logging.getLogger("main")
+logger.setLevel(logging.INFO)
+
+# Max size of a request envelope (bytes), larger requests are rejected
+MAX_REQUEST_BYTES = 256 * 1024
+
+# Number of threads handling the requests, set with the SERVER_WORKERS environment variable
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+def _load_verify_requests(setting):
+    """
+    Returns whether the request signatures and timestamps are verified
+    """
+    return setting.strip().lower() not in ('0', 'false', 'no', 'off')
+
+
+# Request verification, only disabled with the VERIFY_REQUESTS environment variable (ex: "false")
+# to test the endpoint locally with unsigned requests
+VERIFY_REQUESTS = _load_verify_requests(os.environ.get('VERIFY_REQUESTS', 'true'))
+
+# Request headers of the signature, by WSGI environ key
+SIGNATURE_HEADERS = {
+    'HTTP_SIGNATURECERTCHAINURL': 'SignatureCertChainUrl',
+    'HTTP_SIGNATURE_256': 'Signature-256'
+}
+
+JSON_HEADERS = [('Content-Type', 'application/json;charset=UTF-8')]
+
+
+def _error(start_response, status):
+    """
+    Returns an empty error response
+    """
+    start_response(status, [('Content-Type', 'text/plain'), ('Content-Length', '0')])
+    return [b'']
+
+
+def application(environ, start_response):
+    """
+    WSGI application handling the Alexa request envelopes POSTed to any path
+    """
+    if environ['REQUEST_METHOD'] != 'POST':
+        return _error(start_response, '405 Method Not Allowed')
+    try:
+        length = int(environ.get('CONTENT_LENGTH') or 0)
+    except ValueError:
+        return _error(start_response, '400 Bad Request')
+    if length <= 0:
+        return _error(start_response, '400 Bad Request')
+    if length > MAX_REQUEST_BYTES:
+        return _error(start_response, '413 Request Entity Too Large')
+    body = environ['wsgi.input'].read(length)
+    try:
+        if VERIFY_REQUESTS:
+            headers = {name: environ[key] for key, name in SIGNATURE_HEADERS.items() if key in environ}
+            verifier_utils.verify_signature(headers, body)
+        response_envelope = lambda_function.sb.invoke(
+            body.decode('utf-8'), verifier=verifier_utils.verify_timestamp if VERIFY_REQUESTS else None)
+    except verifier_utils.VerificationError as e:
+        logger.warning("Rejected request: %s", e)
+        return _error(start_response, '400 Bad Request')
+    except (UnicodeDecodeError, SerializationException):
+        return _error(start_response, '400 Bad Request')
+    except Exception:
+        logger.exception("Failed to handle request")
+        return _error(start_response, '500 Internal Server Error')
+    body = serializer_utils.dumps(response_envelope).encode('utf-8')
+    start_response('200 OK', JSON_HEADERS + [('Content-Length', str(len(body)))])
+    return [body]
+
+
+class QuietRequestHandler(WSGIRequestHandler):
+    """
+    Request handler logging the requests in the skill logger at debug level instead of stderr
+    """
+
+    def log_message(self, format, *args):
+        logger.debug("%s %s", self.address_string(), format % args)
+
+
+class PooledWSGIServer(WSGIServer):
+    """
+    WSGI server handling the connections with a fixed pool of worker threads
+    The accepting thread only queues the connections, so a slow request does not block the others
+    """
+    request_queue_size = 128
+
+    def __init__(self, server_address, RequestHandlerClass, workers=DEFAULT_WORKERS):
+        self.workers = workers
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='skill-worker')
+        super().__init__(server_address, RequestHandlerClass)
+
+    def process_request(self, request, client_address):
+        self.executor.submit(self._process_request, request, client_address)
+
+    def _process_request(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(wait=True)
+
+
+def capture_requests(app, capture_dir):
+    """
+    Returns a WSGI application writing the signature headers and the raw body of every request
+    to capture_dir/<n>.json before handing it to app, to replay genuine Alexa requests
+    with tools/check_request_verification.py
+    """
+    import io
+    import json
+    import itertools
+    counter = itertools.count(1)
+    os.makedirs(capture_dir, exist_ok=True)
+
+    def application_with_capture(environ, start_response):
+        length = int(environ.get('CONTENT_LENGTH') or 0)
+        if environ['REQUEST_METHOD'] == 'POST' and 0 < length <= MAX_REQUEST_BYTES:
+            body = environ['wsgi.input'].read(length)
+            environ['wsgi.input'] = io.BytesIO(body)
+            capture = {
+                'headers': {name: environ[key] for key, name in SIGNATURE_HEADERS.items() if key in environ},
+                'body': body.decode('utf-8', 'replace')
+            }
+            with open(os.path.join(capture_dir, '{}.json'.format(next(counter))), 'w', encoding='utf-8') as f:
+                json.dump(capture, f, ensure_ascii=False)
+        return app(environ, start_response)
+    return application_with_capture
+
+
+def create_server(host, port, workers=DEFAULT_WORKERS, capture_dir=None):
+    """
+    Returns a PooledWSGIServer serving the skill (port 0 picks a free port)
+    """
+    # The skill and the response templates are created before accepting requests, instead of by the first workers
+    lambda_function.sb.get_skill()
+    template_utils.prerender()
+    server = PooledWSGIServer((host, port), QuietRequestHandler, workers)
+    server.set_app(capture_requests(application, capture_dir) if capture_dir else application)
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1', help='address to listen on')
+    parser.add_argument('--port', type=int, default=8080, help='port to listen on, 0 for a free port')
+    parser.add_argument('--workers', type=int, default=int(os.environ.get('SERVER_WORKERS', DEFAULT_WORKERS)),
+                        help='number of worker threads')
+    parser.add_argument('--capture', default=None, help='folder to write the received requests to')
+    args = parser.parse_args()
+
+    server = create_server(args.host, args.port, args.workers, args.capture)
+    print("Serving on http://{}:{} with {} workers".format(
+        server.server_address[0], server.server_address[1], server.workers), flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,199 @@
+import os
+import json
+import logging
+import recipe_utils
+
+logger = logging.getLogger("main")
+logger.setLevel(logging.INFO)
+
+# Version of the compact session attributes schema
+# Session attributes with another version are ignored (the session starts over)
+SESSION_SCHEMA_VERSION = 2
+
+# Kinds of the actionable requests recorded in the history
+HISTORY_LAUNCH = 'L'
+HISTORY_HELP = 'H'
+HISTORY_RECIPE = 'R'
+
+# Max length of the spoken sauce name recorded in the history
+MAX_SPOKEN_LENGTH = 40
+
+# Message key of the recipe instructions in the last utterance, its argument is the sauce id
+RECIPE_INSTRUCTIONS_MESSAGE = "#RECIPE"
+
+# Message key of a recipe step in the last utterance, its arguments are the sauce id and the step index
+RECIPE_STEP_MESSAGE = "#STEP"
+
+# Request attributes used to share the session state during the request
+SESSION_STATE_ATTRIBUTE = "_session_state"
+SESSION_BYTES_ATTRIBUTE = "_session_bytes"
+
+
+def _load_budget(setting):
+    """
+    Returns the maximum size (bytes) of the encoded session attributes
+    """
+    budget = int(setting)
+    if budget <= 0:
+        raise ValueError("Invalid session attributes budget: {}".format(setting))
+    return budget
+
+
+# Set with the SESSION_ATTRIBUTES_BUDGET_BYTES environment variable
+SESSION_BUDGET_BYTES = _load_budget(os.environ.get('SESSION_ATTRIBUTES_BUDGET_BYTES', '1024'))
+
+
+class SessionState(object):
+    """
+    Skill state kept in session attributes between turns
+        - history: actionable requests, ex: [HISTORY_RECIPE, sauce id, spoken value]
+        - utterance: [speech, reprompt] of the last response, for AMAZON.RepeatIntent
+          Each one is either the final SSML or a list of messages [message key, format args...]
+        - utterance_set: whether the utterance was set by the handler of the current request
+          (not stored in session attributes)
+        - step: [sauce id, step index] of the recipe read step by step (guided mode), None otherwise
+    """
+    __slots__ = ('history', 'utterance', 'utterance_set', 'step')
+
+    def __init__(self, history=None, utterance=None, step=None):
+        self.history = history if history is not None else []
+        self.utterance = utterance
+        self.utterance_set = False
+        self.step = step
+
+
+def recipe_history_entry(sauce_item):
+    """
+    Returns the history entry of a recipe request from its sauce item
+    """
+    spoken = sauce_item['spoken']
+    if spoken:
+        spoken = spoken[:MAX_SPOKEN_LENGTH]
+    return [HISTORY_RECIPE, sauce_item['id'], spoken]
+
+
+def decode(session_attributes):
+    """
+    Returns the SessionState stored in session attributes
+    """
+    if not session_attributes or session_attributes.get('v') != SESSION_SCHEMA_VERSION:
+        return SessionState()
+    return SessionState(
+        history=[list(entry) for entry in session_attributes.get('h', [])],
+        utterance=session_attributes.get('u'),
+        step=session_attributes.get('s'))
+
+
+def _encode(state):
+    """
+    Returns the compact session attributes of a SessionState, without empty values
+    """
+    session_attributes = {'v': SESSION_SCHEMA_VERSION}
+    if state.history:
+        session_attributes['h'] = state.history
+    if state.utterance:
+        session_attributes['u'] = state.utterance
+    if state.step:
+        session_attributes['s'] = state.step
+    return session_attributes
+
+
+def encoded_size(session_attributes):
+    """
+    Returns the size (bytes) of the session attributes in the JSON response
+    """
+    return len(json.dumps(session_attributes, separators=(',', ':'), ensure_ascii=False).encode('utf-8'))
+
+
+def encode(state, budget=SESSION_BUDGET_BYTES):
+    """
+    Returns the compact session attributes of a SessionState and their size (bytes)
+    The state is trimmed to fit in the budget: oldest history entries first,
+    then the last utterance
+    """
+    session_attributes = _encode(state)
+    size = encoded_size(session_attributes)
+    if size <= budget:
+        return session_attributes, size
+    logger.warning("Session attributes size %s is above the %s bytes budget", size, budget)
+    # Keep the last 2 entries of history, needed to go back to the previous request
+    while len(state.history) > 2 and size > budget:
+        state.history.pop(0)
+        session_attributes = _encode(state)
+        size = encoded_size(session_attributes)
+    if size > budget:
+        state.utterance = None
+        session_attributes = _encode(state)
+        size = encoded_size(session_attributes)
+    if size > budget:
+        state.history = []
+        session_attributes = _encode(state)
+        size = encoded_size(session_attributes)
+    return session_attributes, size
+
+
+def get_session_state(handler_input):
+    """
+    Returns the SessionState of the request, decoded from session attributes on first use
+    """
+    request_attributes = handler_input.attributes_manager.request_attributes
+    state = request_attributes.get(SESSION_STATE_ATTRIBUTE)
+    if state is None:
+        session_attributes = None
+        if handler_input.request_envelope.session is not None:
+            session_attributes = handler_input.attributes_manager.session_attributes
+        state = decode(session_attributes)
+        request_attributes[SESSION_STATE_ATTRIBUTE] = state
+    return state
+
+
+def save_session_state(handler_input):
+    """
+    Stores the SessionState of the request in session attributes
+    Returns the size (bytes) of the session attributes
+    """
+    if handler_input.request_envelope.session is None:
+        return 0
+    session_attributes, size = encode(get_session_state(handler_input))
+    handler_input.attributes_manager.session_attributes = session_attributes
+    handler_input.attributes_manager.request_attributes[SESSION_BYTES_ATTRIBUTE] = size
+    return size
+
+
+def set_last_utterance(handler_input, speech, reprompt):
+    """
+    Records the speech and reprompt of the response, for AMAZON.RepeatIntent
+    Each one is a list of messages [message key, format args...] (ex: [[prompts.HELP_MESSAGE, "Pesto"]])
+    """
+    state = get_session_state(handler_input)
+    state.utterance = [speech, reprompt]
+    state.utterance_set = True
+
+
+def _render(data, recipes, output):
+    """
+    Returns the text of a recorded speech or reprompt
+    """
+    if output is None or isinstance(output, str):
+        return output
+    texts = []
+    for message in output:
+        if message[0] == RECIPE_INSTRUCTIONS_MESSAGE:
+            texts.append(recipes[message[1]].instructions)
+        elif message[0] == RECIPE_STEP_MESSAGE:
+            texts.append(recipes[message[1]].steps[message[2]])
+        else:
+            texts.append(data[message[0]].format(*message[1:]))
+    return " ".join(texts)
+
+
+def render_last_utterance(handler_input):
+    """
+    Returns the (speech, reprompt) texts of the last response, (None, None) if unknown
+    """
+    utterance = get_session_state(handler_input).utterance
+    if not utterance:
+        return None, None
+    data = handler_input.attributes_manager.request_attributes["_"]
+    recipes = recipe_utils.get_locale_specific_recipes(handler_input.request_envelope.request.locale)
+    return _render(data, recipes, utterance[0]), _render(data, recipes, utterance[1])
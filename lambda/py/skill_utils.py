@@ -0,0 +1,188 @@
+import json
+import log_utils
+import threading
+import metrics_utils
+import profile_utils
+
+from ask_sdk_core.skill_builder import CustomSkillBuilder
+from ask_sdk_core.dispatch_components import AbstractRequestHandler
+from ask_sdk_model import RequestEnvelope
+from ask_sdk_runtime.dispatch_components import GenericRequestMapper
+
+INTENT_REQUEST = 'IntentRequest'
+APL_USER_EVENT = 'Alexa.Presentation.APL.UserEvent'
+
+
+def request_route(request_type):
+    """
+    Returns the route of a request type (ex: LaunchRequest)
+    """
+    return (request_type, None, None)
+
+
+def intent_route(intent_name):
+    """
+    Returns the route of an IntentRequest for an intent
+    """
+    return (INTENT_REQUEST, intent_name, None)
+
+
+def apl_user_event_route(argument):
+    """
+    Returns the route of an Alexa.Presentation.APL.UserEvent for its first argument
+    """
+    return (APL_USER_EVENT, None, argument)
+
+
+def get_route(request):
+    """
+    Returns the route of a request: (request type, intent name, first APL argument)
+    """
+    request_type = request.object_type
+    if request_type == INTENT_REQUEST:
+        return (request_type, request.intent.name, None)
+    if request_type == APL_USER_EVENT:
+        arguments = request.arguments
+        return (request_type, None, arguments[0] if arguments else None)
+    return (request_type, None, None)
+
+
+class RoutedRequestHandler(AbstractRequestHandler):
+    """
+    Request handler which can handle the requests matching its routes
+    The routes are used by RoutingRequestMapper to resolve the handler with one lookup
+    """
+    routes = ()
+
+    def can_handle(self, handler_input):
+        return get_route(handler_input.request_envelope.request) in self.routes
+
+
+class RoutingRequestMapper(GenericRequestMapper):
+    """
+    Request mapper resolving the handler with a dispatch table keyed by route
+    The handlers which are not a RoutedRequestHandler are matched in order with
+    their can_handle function when no route matches the request
+    """
+
+    def __init__(self, request_handler_chains):
+        self.routes = {}
+        self.fallback_chains = []
+        super().__init__(request_handler_chains=request_handler_chains)
+
+    def add_request_handler_chain(self, request_handler_chain):
+        super().add_request_handler_chain(request_handler_chain)
+        handler = request_handler_chain.request_handler
+        if isinstance(handler, RoutedRequestHandler):
+            for route in handler.routes:
+                # The first registered handler of a route wins, as in the handlers chain
+                self.routes.setdefault(route, request_handler_chain)
+        else:
+            self.fallback_chains.append(request_handler_chain)
+
+    def get_request_handler_chain(self, handler_input):
+        chain = self.routes.get(get_route(handler_input.request_envelope.request))
+        if chain is None:
+            for fallback_chain in self.fallback_chains:
+                if fallback_chain.request_handler.can_handle(handler_input=handler_input):
+                    chain = fallback_chain
+                    break
+        if chain is not None:
+            log_utils.set_request_handler(handler_input, chain.request_handler)
+        return chain
+
+
+class SkillBuilder(CustomSkillBuilder):
+    """
+    Custom Skill Builder using a specific serializer and the routing request mapper
+    The skill is created once per container and reused by the lambda handler
+    and the self-hosted endpoint
+    """
+
+    def __init__(self, serializer=None, persistence_adapter=None, api_client=None):
+        super().__init__(persistence_adapter=persistence_adapter, api_client=api_client)
+        self.serializer = serializer
+        self._skill = None
+        self._skill_lock = threading.Lock()
+
+    @property
+    def skill_configuration(self):
+        skill_config = super().skill_configuration
+        skill_config.request_mappers = [RoutingRequestMapper(
+            request_handler_chains=self.runtime_configuration_builder.request_handler_chains)]
+        return skill_config
+
+    def add_request_handler(self, request_handler):
+        super().add_request_handler(metrics_utils.instrument(request_handler))
+
+    def add_exception_handler(self, exception_handler):
+        super().add_exception_handler(metrics_utils.instrument(exception_handler))
+
+    def add_global_request_interceptor(self, request_interceptor):
+        super().add_global_request_interceptor(metrics_utils.instrument(request_interceptor))
+
+    def add_global_response_interceptor(self, response_interceptor):
+        super().add_global_response_interceptor(metrics_utils.instrument(response_interceptor))
+
+    def create(self):
+        skill = super().create()
+        if self.serializer is not None:
+            skill.serializer = self.serializer
+        return skill
+
+    def get_skill(self):
+        """
+        Returns the skill of the builder, created on first use
+        The skill is shared by the threads of a self-hosted endpoint (see server.py)
+        """
+        if self._skill is None:
+            with self._skill_lock:
+                if self._skill is None:
+                    self._skill = self.create()
+        return self._skill
+
+    def invoke(self, payload, context=None, verifier=None):
+        """
+        Handles a request envelope serialized as json and returns the serialized response envelope
+        The verifier, if any, is called with the request envelope before it is handled
+        and raises an exception to reject it (ex: verifier_utils.verify_timestamp)
+        The timing metrics of the invocation, if enabled, are written once it is handled
+        """
+        skill = self.get_skill()
+        metrics = metrics_utils.start_invocation()
+        if metrics is None:
+            request_envelope = skill.serializer.deserialize(
+                payload=payload, obj_type=RequestEnvelope)
+            if verifier is not None:
+                verifier(request_envelope)
+            response_envelope = self.dispatch(skill, request_envelope, context)
+            return skill.serializer.serialize(response_envelope)
+        try:
+            request_envelope = skill.serializer.deserialize(
+                payload=payload, obj_type=RequestEnvelope)
+            metrics.lap(metrics_utils.DESERIALIZATION_METRIC)
+            metrics.set_request(request_envelope)
+            if verifier is not None:
+                verifier(request_envelope)
+                metrics.lap(metrics_utils.VERIFICATION_METRIC)
+            response_envelope = self.dispatch(skill, request_envelope, context)
+            metrics.lap(metrics_utils.DISPATCH_METRIC)
+            serialized = skill.serializer.serialize(response_envelope)
+            metrics.lap(metrics_utils.SERIALIZATION_METRIC)
+            return serialized
+        finally:
+            metrics_utils.flush_invocation(metrics)
+
+    def dispatch(self, skill, request_envelope, context):
+        """
+        Handles a request envelope with the skill, under the profiler if the invocation is profiled
+        """
+        reason = profile_utils.get_profile_reason(request_envelope)
+        if reason is None:
+            return skill.invoke(request_envelope=request_envelope, context=context)
+        return profile_utils.profile_dispatch(skill.invoke, request_envelope, context, reason)
+
+    def lambda_handler(self):
+        def wrapper(event, context):
+            return self.invoke(json.dumps(event), context)
+        return wrapper
@@ -0,0 +1,97 @@
+import os
+import re
+
+
+def _load_guided_recipes(setting):
+    """
+    Returns whether the recipes are read step by step
+    """
+    return setting.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+# Set with the GUIDED_RECIPES environment variable ("true" reads the recipes one step per turn,
+# with AMAZON.NextIntent and AMAZON.PreviousIntent), default is the whole recipe in one response
+GUIDED_RECIPES = _load_guided_recipes(os.environ.get('GUIDED_RECIPES', 'false'))
+
+# Sentence ends of the languages without spaces between sentences (full-width punctuation),
+# closing quotes and brackets stay with their sentence
+CJK_SENTENCE_END = re.compile(r'(?<=[。！？][」』）])|(?<=[。！？])(?![」』）])')
+
+# Sentence ends of the other languages: punctuation followed by spaces
+# Hindi sentences end with a danda (।) or a period
+SENTENCE_END = re.compile(r'(?<=[.!?।॥])\s+')
+
+# Abbreviations which do not end a sentence, by language (lowercase, without the final period)
+# Abbreviations of several words (ex: "p. ej") are split after each word by SENTENCE_END
+ABBREVIATIONS = {
+    'en': ('approx', 'e.g', 'i.e', 'tbsp', 'tsp', 'oz', 'lb'),
+    'fr': ('env', 'c.-à-d', 'cuil', 'càs', 'càc'),
+    'es': ('aprox', 'cda', 'cdta', 'p. ej', 'p.ej'),
+    'pt': ('aprox', 'colh', 'p. ex', 'p.ex'),
+    'de': ('ca', 'z.b', 'bzw', 'evtl', 'ggf', 'el', 'tl'),
+    'it': ('ca', 'cucch', 'es')
+}
+
+# Languages segmented with CJK_SENTENCE_END
+CJK_LANGUAGES = ('ja', 'zh')
+
+
+def _ends_with_abbreviation(sentence, abbreviations):
+    """
+    Returns whether a sentence piece ends with an abbreviation of the language (ex: "ca.")
+    """
+    if not sentence.endswith('.'):
+        return False
+    lowered = sentence[:-1].lower()
+    return any(lowered == abbreviation or lowered.endswith(' ' + abbreviation) for abbreviation in abbreviations)
+
+
+def _starts_abbreviation(sentence, next_piece, abbreviations):
+    """
+    Returns whether a sentence piece ends with the first words of an abbreviation of several words,
+    completed by the next piece (ex: "p." followed by "ej. ...")
+    """
+    if not sentence.endswith('.'):
+        return False
+    lowered = next_piece.lower()
+    for abbreviation in abbreviations:
+        head, space, tail = abbreviation.rpartition(' ')
+        if space and head.endswith('.') and lowered.startswith(tail + '.') \
+                and _ends_with_abbreviation(sentence, (head[:-1],)):
+            return True
+    return False
+
+
+def split_steps(instructions, language):
+    """
+    Returns the steps of recipe instructions, one sentence each, with the sentence segmentation of the language
+    examples:
+        "Mix the mustard and the honey. Serve cold." -> ("Mix the mustard and the honey.", "Serve cold.")
+        "鍋に入れます。煮沸します。" -> ("鍋に入れます。", "煮沸します。")
+    """
+    text = ' '.join(instructions.split())
+    if not text:
+        return ()
+    if language in CJK_LANGUAGES:
+        pieces = CJK_SENTENCE_END.split(text)
+    else:
+        pieces = SENTENCE_END.split(text)
+    abbreviations = ABBREVIATIONS.get(language, ())
+    pieces = [piece.strip() for piece in pieces if piece.strip()]
+    steps = []
+    pending = ''
+    for number, piece in enumerate(pieces):
+        pending = pending + ' ' + piece if pending else piece
+        if _ends_with_abbreviation(pending, abbreviations):
+            continue
+        if number + 1 < len(pieces) and _starts_abbreviation(pending, pieces[number + 1], abbreviations):
+            continue
+        # Pieces without letters (ex: a lone "!") stay with the previous step
+        if steps and not any(c.isalpha() for c in pending):
+            steps[-1] = steps[-1] + ' ' + pending
+        else:
+            steps.append(pending)
+        pending = ''
+    if pending:
+        steps.append(pending)
+    return tuple(steps)
@@ -0,0 +1,192 @@
+import os
+import logging
+import apl_utils
+import language_utils
+import serializer_utils
+
+from ask_sdk_core.response_helper import ResponseFactory
+from ask_sdk_model.ui import SsmlOutputSpeech, Reprompt
+
+logger = logging.getLogger("main")
+logger.setLevel(logging.INFO)
+
+# Responses rendered from templates
+#   - launch: welcome speech and reprompt, with the Launch Screen on APL devices
+#   - help: help speech and reprompt, with the Help Screen on APL devices
+#   - speech: speech only (ex: stop)
+#   - prompt: speech and reprompt (ex: recipe not found)
+LAUNCH = 'launch'
+HELP = 'help'
+SPEECH = 'speech'
+PROMPT = 'prompt'
+
+TEMPLATE_NAMES = (LAUNCH, HELP, SPEECH, PROMPT)
+
+# Templates with an APL screen, built for each APL viewport profile
+SCREEN_TEMPLATE_NAMES = (LAUNCH, HELP)
+
+# Texts substituted at request time, marked in the templates by characters of
+# the Unicode private use area, which are not found in the skill strings
+SLOT_MARK = '\ue000'
+SPEECH_SLOT = SLOT_MARK + 'speech' + SLOT_MARK
+REPROMPT_SLOT = SLOT_MARK + 'reprompt' + SLOT_MARK
+HINT_SLOT = SLOT_MARK + 'hint' + SLOT_MARK
+
+
+def _load_templates_enabled(setting):
+    """
+    Returns whether the responses are rendered from templates
+    """
+    return setting.strip().lower() not in ('0', 'false', 'no', 'off')
+
+
+# Set with the RESPONSE_TEMPLATES environment variable ("false" builds every response with the response builder)
+TEMPLATES_ENABLED = _load_templates_enabled(os.environ.get('RESPONSE_TEMPLATES', 'true'))
+
+
+def to_ssml(speech):
+    """
+    Returns the SSML of a speech, as ResponseFactory.speak and ResponseFactory.ask do
+    """
+    if speech is None:
+        return "<speak></speak>"
+    speech = speech.strip()
+    if speech.startswith("<speak>") and speech.endswith("</speak>"):
+        speech = speech[7:-8].strip()
+    return "<speak>{}</speak>".format(speech)
+
+
+# Slot of each text marking a slot in the serialized responses
+SLOT_TEXTS = {to_ssml(SPEECH_SLOT): SPEECH_SLOT, to_ssml(REPROMPT_SLOT): REPROMPT_SLOT, HINT_SLOT: HINT_SLOT}
+
+
+def _find_slots(value, path, slots):
+    """
+    Adds the (path, slot) of the texts to substitute of a serialized response to slots
+    """
+    if isinstance(value, dict):
+        for key, item in value.items():
+            _find_slots(item, path + (key,), slots)
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            _find_slots(item, path + (index,), slots)
+    elif isinstance(value, str):
+        if value in SLOT_TEXTS:
+            slots.append((path, SLOT_TEXTS[value]))
+        elif SLOT_MARK in value:
+            raise ValueError("Invalid response template text: {}".format(value))
+
+
+class ResponseTemplate(object):
+    """
+    Serialized response of a (locale, APL device, new session), whose speech, reprompt and
+    APL hint are substituted at request time
+        - serialized: serialized response with the slot texts, shared by the rendered responses
+        - slots: (path, slot) of the texts to substitute
+    """
+    __slots__ = ('serialized', 'slots', 'has_reprompt', 'has_hint', 'should_end_session')
+
+    def __init__(self, response):
+        self.serialized = serializer_utils.SkillSerializer().serialize(response)
+        slots = []
+        _find_slots(self.serialized, (), slots)
+        self.slots = tuple(slots)
+        self.has_reprompt = response.reprompt is not None
+        self.has_hint = any(slot == HINT_SLOT for _, slot in slots)
+        self.should_end_session = response.should_end_session
+
+    def render(self, handler_input, speech, reprompt=None):
+        """
+        Returns the RenderedResponse of the speech and reprompt texts
+        The APL hint is drawn like the screens do (see apl_utils.get_hint_text)
+        """
+        speech_ssml = to_ssml(speech)
+        reprompt_ssml = to_ssml(reprompt) if self.has_reprompt else None
+        values = {
+            SPEECH_SLOT: speech_ssml,
+            REPROMPT_SLOT: reprompt_ssml,
+            HINT_SLOT: apl_utils.get_hint_text(handler_input) if self.has_hint else None
+        }
+        # Only the containers on the path of a slot are copied
+        serialized = dict(self.serialized)
+        copies = {(): serialized}
+        for path, slot in self.slots:
+            container = serialized
+            for depth in range(1, len(path)):
+                parent_path = path[:depth]
+                copy = copies.get(parent_path)
+                if copy is None:
+                    copy = container[path[depth - 1]]
+                    copy = dict(copy) if isinstance(copy, dict) else list(copy)
+                    container[path[depth - 1]] = copy
+                    copies[parent_path] = copy
+                container = copy
+            container[path[-1]] = values[slot]
+        return serializer_utils.RenderedResponse(
+            serialized,
+            output_speech=SsmlOutputSpeech(ssml=speech_ssml),
+            reprompt=Reprompt(output_speech=SsmlOutputSpeech(ssml=reprompt_ssml)) if self.has_reprompt else None,
+            should_end_session=self.should_end_session)
+
+
+def build_template(name, locale, apl, session_new, viewport_profile=None):
+    """
+    Returns the ResponseTemplate of a response, built with the response builder
+    """
+    data = language_utils.get_locale_strings(locale)
+    response_builder = ResponseFactory()
+    if(apl and name == LAUNCH):
+        response_builder.add_directive(apl_utils.launch_screen_directive(locale, data, HINT_SLOT, viewport_profile))
+    elif(apl and name == HELP):
+        response_builder.add_directive(apl_utils.help_screen_directive(locale, data, session_new, viewport_profile))
+    response_builder.speak(SPEECH_SLOT)
+    if(name != SPEECH):
+        response_builder.ask(REPROMPT_SLOT)
+    return ResponseTemplate(response_builder.response)
+
+
+# Response templates, keyed by (name, locale, APL device, new session, APL viewport profile)
+# Templates are built on first use, or all at once by prerender. Unknown locales share the
+# templates of their language (see language_utils.get_registry_locale), so the request
+# locales cannot grow the table
+TEMPLATES = {}
+
+
+def get_template(handler_input, name):
+    """
+    Returns the ResponseTemplate of a response for the request, None if templates are disabled
+    """
+    if not TEMPLATES_ENABLED:
+        return None
+    request_envelope = handler_input.request_envelope
+    apl = apl_utils.supports_apl(handler_input)
+    key = (name, language_utils.get_registry_locale(request_envelope.request.locale), apl,
+           bool(request_envelope.session and request_envelope.session.new),
+           apl_utils.get_viewport_profile(handler_input) if apl and name in SCREEN_TEMPLATE_NAMES else None)
+    template = TEMPLATES.get(key)
+    if template is None:
+        template = build_template(*key)
+        TEMPLATES[key] = template
+    return template
+
+
+def prerender(locales=language_utils.SUPPORTED_LOCALES):
+    """
+    Builds the templates of every response of the locales (ex: when a server starts),
+    for every APL viewport profile the documents are pruned for
+    Returns the number of templates
+    """
+    viewport_profiles = (None,)
+    if apl_utils.APL_DOC_PRUNING:
+        viewport_profiles += tuple(apl_utils.PRUNED_VIEWPORT_PROFILES.values())
+    if TEMPLATES_ENABLED:
+        for locale in locales:
+            for name in TEMPLATE_NAMES:
+                for apl in (True, False):
+                    for session_new in (True, False):
+                        screen = apl and name in SCREEN_TEMPLATE_NAMES
+                        for viewport_profile in (viewport_profiles if screen else (None,)):
+                            key = (name, locale, apl, session_new, viewport_profile)
+                            if key not in TEMPLATES:
+                                TEMPLATES[key] = build_template(*key)
+    return len(TEMPLATES)
@@ -1,25 +1,142 @@
 import logging
 import os
-import boto3
-from botocore.exceptions import ClientError
+import threading
+import time
 
+# Capped expiration of the presigned URLs (seconds)
+PRESIGNED_URL_EXPIRATION = 60*1
 
-def create_presigned_url(object_name):
-    """Generate a presigned URL to share an S3 object with a capped expiration of 60 seconds
+# A cached presigned URL is signed again this many seconds before it expires,
+# so that it is still valid when the device downloads it
+PRESIGNED_URL_EXPIRY_MARGIN = 15
+
+# Max number of cached presigned URLs
+PRESIGNED_URL_CACHE_SIZE = 256
+
+# S3 client created on first use, and reused for the container lifetime
+# boto3 clients can be shared by threads, but are not safely created concurrently
+S3_CLIENTS = []
+S3_CLIENT_LOCK = threading.Lock()
+
+
+def get_s3_client():
+    """Returns the S3 client of the container, created on first use
+
+    The S3_ENDPOINT_URL environment variable points the client to a local S3 stand-in
+    """
+    if not S3_CLIENTS:
+        with S3_CLIENT_LOCK:
+            if not S3_CLIENTS:
+                # boto3 is only imported when needed as it is slow to import
+                import boto3
+                S3_CLIENTS.append(boto3.client(
+                    's3', endpoint_url=os.environ.get('S3_ENDPOINT_URL') or None,
+                    config=boto3.session.Config(signature_version='s3v4', s3={'addressing_style': 'path'})))
+    return S3_CLIENTS[0]
+
+
+def sign_with_s3_client(bucket_name, object_name, expiration):
+    """Default signer: presigned URL of an S3 object generated by the S3 client
 
-    :param object_name: string
     :return: Presigned URL as string. If error, returns None.
     """
-    s3_client = boto3.client('s3', config=boto3.session.Config(signature_version='s3v4',s3={'addressing_style': 'path'}))
+    from botocore.exceptions import ClientError
+
     try:
-        bucket_name = os.environ.get('S3_PERSISTENCE_BUCKET')
-        response = s3_client.generate_presigned_url('get_object',
-                                                    Params={'Bucket': bucket_name,
-                                                            'Key': object_name},
-                                                    ExpiresIn=60*1)
+        return get_s3_client().generate_presigned_url('get_object',
+                                                      Params={'Bucket': bucket_name,
+                                                              'Key': object_name},
+                                                      ExpiresIn=expiration)
     except ClientError as e:
         logging.error(e)
         return None
 
-    # The response contains the presigned URL
-    return response
\ No newline at end of file
+
+class PresignedUrlCache(object):
+    """Presigned URLs by (bucket name, object name), with the time (time.monotonic) they stop being reused
+
+    It can be shared by threads, the URLs are read and evicted under a lock
+    """
+    __slots__ = ('max_size', '_urls', '_lock')
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._urls = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, now):
+        with self._lock:
+            entry = self._urls.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= now:
+                del self._urls[key]
+                return None
+            return entry[0]
+
+    def put(self, key, url, reuse_until, now):
+        with self._lock:
+            if key not in self._urls and len(self._urls) >= self.max_size:
+                # Evict the expired URLs, or the first to expire if none
+                expired = [cached for cached, entry in self._urls.items() if entry[1] <= now]
+                if not expired:
+                    expired = [min(self._urls, key=lambda cached: self._urls[cached][1])]
+                for cached in expired:
+                    del self._urls[cached]
+            self._urls[key] = (url, reuse_until)
+
+    def clear(self):
+        with self._lock:
+            self._urls.clear()
+
+    def __len__(self):
+        return len(self._urls)
+
+
+PRESIGNED_URLS = PresignedUrlCache(PRESIGNED_URL_CACHE_SIZE)
+
+# Function signing an object: (bucket name, object name, expiration) -> URL or None
+URL_SIGNERS = [sign_with_s3_client]
+
+
+def set_url_signer(signer):
+    """Replaces the signer of the presigned URLs (ex: a stub to run offline) and clears the cache"""
+    URL_SIGNERS[0] = signer
+    PRESIGNED_URLS.clear()
+
+
+def create_presigned_urls(object_names):
+    """Generate the presigned URLs of S3 objects, with a capped expiration of 60 seconds
+
+    URLs of the same bucket and object signed less than
+    PRESIGNED_URL_EXPIRATION - PRESIGNED_URL_EXPIRY_MARGIN seconds ago are reused,
+    only the other objects are signed (ex: every image of the launch screen grid)
+
+    :param object_names: list of strings
+    :return: Presigned URLs as a dict by object name. If error, the URL is None.
+    """
+    bucket_name = os.environ.get('S3_PERSISTENCE_BUCKET')
+    signer = URL_SIGNERS[0]
+    now = time.monotonic()
+    reuse_until = now + PRESIGNED_URL_EXPIRATION - PRESIGNED_URL_EXPIRY_MARGIN
+    urls = {}
+    for object_name in object_names:
+        key = (bucket_name, object_name)
+        url = PRESIGNED_URLS.get(key, now)
+        if url is None:
+            url = signer(bucket_name, object_name, PRESIGNED_URL_EXPIRATION)
+            if url is not None:
+                PRESIGNED_URLS.put(key, url, reuse_until, now)
+        urls[object_name] = url
+    return urls
+
+
+def create_presigned_url(object_name):
+    """Generate a presigned URL to share an S3 object with a capped expiration of 60 seconds
+
+    The URL is reused as by create_presigned_urls
+
+    :param object_name: string
+    :return: Presigned URL as string. If error, returns None.
+    """
+    return create_presigned_urls((object_name,))[object_name]
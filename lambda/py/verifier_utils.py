@@ -0,0 +1,327 @@
+"""
+Verification of the requests of the self-hosted endpoint (see server.py)
+
+Performs the checks of the RequestVerifier and TimestampVerifier of ask-sdk-webservice-support:
+certificate chain URL, chain up to a trusted root, echo-api.amazon.com signing certificate
+with the digital signature key usage, Signature-256 of the raw body, and the request timestamp
+(150 seconds, one hour for the skill events). They are not used directly as:
+    - they import certvalidator, whose oscrypto dependency fails to load with OpenSSL 3.0.10
+      and later ("Error detecting the version of libcrypto"), and freezegun at runtime
+    - RequestVerifier validates the whole chain again on every request, keeps the downloaded
+      chains forever in a dict updated without lock, and downloads them without timeout
+Here the chain is validated with cryptography once per URL and its public key cached until the
+chain expires. tools/check_request_verification.py replays captured Alexa requests through
+both verifiers and fails if they disagree.
+"""
+import ssl
+import time
+import base64
+import logging
+import datetime
+import posixpath
+import threading
+from concurrent.futures import Future
+from urllib.parse import urlsplit, urlunsplit
+
+logger = logging.getLogger("main")
+logger.setLevel(logging.INFO)
+
+# Requests sent by Alexa are signed with the certificate of this domain
+SIGNING_CERT_DNS_NAME = 'echo-api.amazon.com'
+
+# The certificate chain URL must be on this host and under this path
+CERT_CHAIN_URL_HOST = 's3.amazonaws.com'
+CERT_CHAIN_URL_PATH = '/echo.api/'
+
+# Max difference between the request timestamp and the server time (seconds)
+MAX_TIMESTAMP_TOLERANCE = 150
+
+# Skill events are sent up to an hour after they happen (seconds)
+MAX_SKILL_EVENT_TIMESTAMP_TOLERANCE = 3600
+SKILL_EVENT_TYPES = frozenset((
+    'AlexaSkillEvent.SkillEnabled',
+    'AlexaSkillEvent.SkillDisabled',
+    'AlexaSkillEvent.SkillPermissionChanged',
+    'AlexaSkillEvent.SkillPermissionAccepted',
+    'AlexaSkillEvent.SkillAccountLinked'
+))
+
+# Request headers of the signature (matched case insensitively)
+CERT_CHAIN_URL_HEADER = 'SignatureCertChainUrl'
+SIGNATURE_HEADER = 'Signature-256'
+
+# Max number of cached certificate chains, Alexa uses a handful of chain URLs at a time
+CERT_CHAIN_CACHE_SIZE = 16
+
+# Certificate chain download timeout (seconds) and max size (bytes)
+CERT_CHAIN_FETCH_TIMEOUT = 5
+MAX_CERT_CHAIN_BYTES = 64 * 1024
+
+
+class VerificationError(Exception):
+    """
+    The request was not sent by Alexa: it must be rejected with HTTP 400
+    """
+
+
+def normalize_cert_chain_url(url):
+    """
+    Returns the normalized certificate chain URL, or raises VerificationError if it is not an Alexa one
+    example: "https://s3.amazonaws.com/echo.api/../echo.api/echo-api-cert.pem"
+          -> "https://s3.amazonaws.com/echo.api/echo-api-cert.pem"
+    """
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        raise VerificationError("Invalid certificate chain URL: {}".format(url))
+    path = posixpath.normpath(parts.path) if parts.path else ''
+    if(parts.scheme.lower() != 'https' or (parts.hostname or '').lower() != CERT_CHAIN_URL_HOST
+            or port not in (None, 443) or not path.startswith(CERT_CHAIN_URL_PATH)):
+        raise VerificationError("Invalid certificate chain URL: {}".format(url))
+    return urlunsplit(('https', CERT_CHAIN_URL_HOST, path, parts.query, ''))
+
+
+def fetch_cert_chain(url):
+    """
+    Default fetcher: downloads the PEM certificate chain at the URL
+    """
+    from urllib.request import urlopen
+    with urlopen(url, timeout=CERT_CHAIN_FETCH_TIMEOUT) as response:
+        pem = response.read(MAX_CERT_CHAIN_BYTES + 1)
+    if len(pem) > MAX_CERT_CHAIN_BYTES:
+        raise VerificationError("Certificate chain too large: {}".format(url))
+    return pem
+
+
+def load_trusted_roots():
+    """
+    Returns the PEM bundle of the certificate authorities trusted by the system (or certifi)
+    """
+    cafile = ssl.get_default_verify_paths().cafile
+    if cafile is None:
+        import certifi
+        cafile = certifi.where()
+    with open(cafile, 'rb') as f:
+        return f.read()
+
+
+def validate_cert_chain(pem, trusted_roots, now):
+    """
+    Validates a PEM certificate chain (signing certificate first) against the trusted roots:
+    signatures up to a trusted root, validity dates, the Alexa domain name and the
+    digital signature key usage of the signing certificate
+    Returns (public key of the signing certificate, time.time() when the first certificate of the chain expires)
+    """
+    # cryptography is only imported when requests are verified (self-hosted endpoint)
+    from cryptography import x509
+    from cryptography.x509 import verification
+
+    try:
+        certificates = x509.load_pem_x509_certificates(pem)
+        verifier = verification.PolicyBuilder().store(trusted_roots).time(
+            datetime.datetime.fromtimestamp(now, datetime.timezone.utc)).build_server_verifier(
+                x509.DNSName(SIGNING_CERT_DNS_NAME))
+        path = verifier.verify(certificates[0], certificates[1:])
+        key_usage = certificates[0].extensions.get_extension_for_class(x509.KeyUsage).value
+    except x509.ExtensionNotFound:
+        raise VerificationError("Invalid certificate chain: signing certificate has no key usage")
+    except (ValueError, verification.VerificationError) as e:
+        raise VerificationError("Invalid certificate chain: {}".format(e))
+    if not key_usage.digital_signature:
+        raise VerificationError("Invalid certificate chain: signing certificate is not for digital signatures")
+    expires_at = min(certificate.not_valid_after_utc.timestamp() for certificate in path)
+    return certificates[0].public_key(), expires_at
+
+
+class CertChainCache(object):
+    """
+    Public keys of the validated certificate chains by URL, with the time (time.time) the chain expires
+    It can be shared by threads, the keys are read and evicted under a lock
+    """
+    __slots__ = ('max_size', '_keys', '_lock')
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._keys = {}
+        self._lock = threading.Lock()
+
+    def get(self, url, now):
+        with self._lock:
+            entry = self._keys.get(url)
+            if entry is None:
+                return None
+            if entry[1] <= now:
+                del self._keys[url]
+                return None
+            return entry[0]
+
+    def put(self, url, public_key, expires_at, now):
+        with self._lock:
+            if url not in self._keys and len(self._keys) >= self.max_size:
+                # Evict the expired chains, or the first to expire if none
+                expired = [name for name, entry in self._keys.items() if entry[1] <= now]
+                if not expired:
+                    expired = [min(self._keys, key=lambda name: self._keys[name][1])]
+                for name in expired:
+                    del self._keys[name]
+            self._keys[url] = (public_key, expires_at)
+
+    def clear(self):
+        with self._lock:
+            self._keys.clear()
+
+    def __len__(self):
+        return len(self._keys)
+
+
+CERT_CHAINS = CertChainCache(CERT_CHAIN_CACHE_SIZE)
+
+# Function downloading a certificate chain: URL -> PEM bytes
+CERT_CHAIN_FETCHERS = [fetch_cert_chain]
+
+# Store of the trusted certificate authorities, loaded on first use
+TRUST_STORES = []
+
+# Certificate chains being downloaded and validated, as a Future by URL: only one thread
+# downloads a missing chain, the threads verifying requests of the same URL wait for it
+# and the others go on. CERT_CHAIN_LOCK only guards this table and the settings, it is
+# never held during a download
+PENDING_CERT_CHAINS = {}
+CERT_CHAIN_LOCK = threading.Lock()
+
+
+def set_cert_chain_fetcher(fetcher, trusted_roots=None):
+    """
+    Replaces the certificate chain fetcher and clears the cache
+    trusted_roots (PEM bundle) replaces the system certificate authorities,
+    ex: a locally generated root to verify requests signed without network
+    """
+    trust_store = _create_trust_store(trusted_roots) if trusted_roots is not None else None
+    with CERT_CHAIN_LOCK:
+        CERT_CHAIN_FETCHERS[0] = fetcher
+        del TRUST_STORES[:]
+        if trust_store is not None:
+            TRUST_STORES.append(trust_store)
+        CERT_CHAINS.clear()
+
+
+def _create_trust_store(pem):
+    from cryptography import x509
+    from cryptography.x509 import verification
+    return verification.Store(x509.load_pem_x509_certificates(pem))
+
+
+def _get_trust_store():
+    """
+    Returns the store of the trusted certificate authorities, the system ones loaded on first use
+    """
+    with CERT_CHAIN_LOCK:
+        if TRUST_STORES:
+            return TRUST_STORES[0]
+    trust_store = _create_trust_store(load_trusted_roots())
+    with CERT_CHAIN_LOCK:
+        if not TRUST_STORES:
+            TRUST_STORES.append(trust_store)
+        return TRUST_STORES[0]
+
+
+def _load_signing_key(url, now):
+    """
+    Downloads and validates the certificate chain at the URL, caches and returns its public key
+    """
+    trust_store = _get_trust_store()
+    try:
+        pem = CERT_CHAIN_FETCHERS[0](url)
+    except VerificationError:
+        raise
+    except Exception as e:
+        raise VerificationError("Failed to fetch certificate chain {}: {}".format(url, e))
+    public_key, expires_at = validate_cert_chain(pem, trust_store, now)
+    CERT_CHAINS.put(url, public_key, expires_at, now)
+    logger.info("Certificate chain %s valid until %s", url, expires_at)
+    return public_key
+
+
+def get_signing_key(cert_chain_url, now):
+    """
+    Returns the public key of the validated certificate chain at the URL,
+    downloaded and validated on first use, and again once expired
+    """
+    url = normalize_cert_chain_url(cert_chain_url)
+    public_key = CERT_CHAINS.get(url, now)
+    if public_key is not None:
+        return public_key
+    with CERT_CHAIN_LOCK:
+        public_key = CERT_CHAINS.get(url, now)
+        if public_key is not None:
+            return public_key
+        pending = PENDING_CERT_CHAINS.get(url)
+        if pending is None:
+            pending = PENDING_CERT_CHAINS[url] = Future()
+            owner = True
+        else:
+            owner = False
+    if not owner:
+        # Raises the error of the download, if any
+        return pending.result()
+    try:
+        public_key = _load_signing_key(url, now)
+        pending.set_result(public_key)
+        return public_key
+    except BaseException as e:
+        pending.set_exception(e)
+        raise
+    finally:
+        with CERT_CHAIN_LOCK:
+            del PENDING_CERT_CHAINS[url]
+
+
+def get_header(headers, name):
+    """
+    Returns the value of a request header, whatever the case of its name, None if it is missing
+    """
+    value = headers.get(name)
+    if value is None:
+        lowered = name.lower()
+        value = next((value for key, value in headers.items() if key.lower() == lowered), None)
+    return value
+
+
+def verify_signature(headers, body, now=None):
+    """
+    Verifies the signature of the raw request body with the certificate chain of the request headers
+        - headers: mapping with the SignatureCertChainUrl and Signature-256 (SHA-256) headers
+        - body: request body bytes, as received
+    Raises VerificationError if the signature is missing or invalid
+    """
+    from cryptography.exceptions import InvalidSignature
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import padding
+
+    cert_chain_url = get_header(headers, CERT_CHAIN_URL_HEADER)
+    signature = get_header(headers, SIGNATURE_HEADER)
+    if not cert_chain_url or not signature:
+        raise VerificationError("Missing request signature")
+    public_key = get_signing_key(cert_chain_url, time.time() if now is None else now)
+    try:
+        public_key.verify(base64.b64decode(signature), body, padding.PKCS1v15(), hashes.SHA256())
+    except (ValueError, TypeError, InvalidSignature):
+        raise VerificationError("Invalid request signature")
+
+
+def verify_timestamp(request_envelope, now=None):
+    """
+    Verifies that the request was sent less than MAX_TIMESTAMP_TOLERANCE seconds ago (replay protection),
+    or MAX_SKILL_EVENT_TIMESTAMP_TOLERANCE seconds for the skill events
+    Raises VerificationError otherwise
+    """
+    request = request_envelope.request
+    timestamp = getattr(request, 'timestamp', None)
+    if not isinstance(timestamp, datetime.datetime) or timestamp.tzinfo is None:
+        raise VerificationError("Missing request timestamp")
+    delay = (time.time() if now is None else now) - timestamp.timestamp()
+    tolerance = MAX_SKILL_EVENT_TIMESTAMP_TOLERANCE if request.object_type in SKILL_EVENT_TYPES \
+        else MAX_TIMESTAMP_TOLERANCE
+    if abs(delay) > tolerance:
+        raise VerificationError("Request timestamp is {:.0f} seconds old".format(delay))
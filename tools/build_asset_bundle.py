@@ -0,0 +1,147 @@
+"""
+Build the asset bundle of the skill
+
+Validates the static content of the skill (localized strings, recipes package,
+recipe steps, recipe images, APL documents and sauce names table) and compiles
+it into a single versioned file, lambda/py/assets.bundle, which the skill loads
+with one read at cold start (when ASSET_BUNDLE_FILE is set) instead of parsing
+the JSON files, importing the recipe modules and splitting the recipes in
+steps. The bundle is marshal data of the parsed (minified) content, behind a
+header with the format and marshal versions and the content sha256. Rebuild it
+whenever one of the sources changes; --check fails if it is out of date.
+
+usage: python tools/build_asset_bundle.py [--output lambda/py/assets.bundle] [--check]
+"""
+import argparse
+import json
+import os
+import sys
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+LAMBDA_DIR = os.path.join(ROOT_DIR, 'lambda', 'py')
+DEFAULT_OUTPUT_FILE = os.path.join(LAMBDA_DIR, 'assets.bundle')
+
+
+def collect_assets():
+    """
+    Returns the sections of the bundle, read from the source files of the skill
+    """
+    import apl_utils
+    import language_utils
+    import recipe_utils
+    import recipes
+    import resolver_utils
+    import step_utils
+
+    with open(resolver_utils.SAUCE_NAMES_FILE, encoding='utf-8') as f:
+        sauce_names = json.load(f)
+    assets = {
+        'language_strings': language_utils._load_language_strings(language_utils.LANGUAGE_STRINGS_FILE),
+        'recipes': {language: dict(recipes.translations[language]) for language in recipes.LANGUAGES},
+        'recipe_steps': {language: {recipe_id: list(step_utils.split_steps(recipe['instructions'], language))
+                                    for recipe_id, recipe in recipes.translations[language].items()}
+                         for language in recipes.LANGUAGES},
+        'recipe_images': dict(recipe_utils.RECIPE_IMAGES),
+        'apl_documents': {name: apl_utils._load_apl_document(file_path)
+                          for name, file_path in apl_utils.APL_DOC_FILES.items()},
+        'sauce_names': sauce_names
+    }
+    # Fresh JSON values: drops anything marshal could store but JSON could not
+    return json.loads(json.dumps(assets, ensure_ascii=False))
+
+
+def validate_assets(assets):
+    """
+    Returns the list of errors of the assets
+    """
+    import language_utils
+    import prompts
+
+    errors = []
+    try:
+        language_utils.build_registry(assets['language_strings'], language_utils.SUPPORTED_LOCALES)
+    except ValueError as e:
+        errors.append(str(e))
+    keys = [value for name, value in vars(prompts).items() if name.isupper() and isinstance(value, str)]
+    for locale in language_utils.SUPPORTED_LOCALES:
+        strings = dict(assets['language_strings'].get(locale[:2], {}))
+        strings.update(assets['language_strings'].get(locale, {}))
+        missing = [key for key in keys if key not in strings]
+        if missing:
+            errors.append("Locale {} has no strings for {}".format(locale, ', '.join(missing)))
+        if locale[:2] not in assets['recipes']:
+            errors.append("Locale {} has no recipes".format(locale))
+
+    for language, recipes in assets['recipes'].items():
+        if not recipes:
+            errors.append("Language {} has no recipes".format(language))
+        for recipe_id, recipe in recipes.items():
+            for field in ('name', 'instructions'):
+                if not isinstance(recipe.get(field), str) or not recipe[field].strip():
+                    errors.append("Recipe {} {} has no {}".format(language, recipe_id, field))
+            if not assets['recipe_steps'].get(language, {}).get(recipe_id):
+                errors.append("Recipe {} {} has no steps".format(language, recipe_id))
+
+    for recipe_id, url in assets['recipe_images'].items():
+        if not isinstance(url, str) or not url.startswith('https://'):
+            errors.append("Recipe {} image is not an https url: {}".format(recipe_id, url))
+
+    for name, document in assets['apl_documents'].items():
+        if document.get('type') != 'APL' or 'version' not in document or 'mainTemplate' not in document:
+            errors.append("APL document {} is not an APL document".format(name))
+
+    for locale, sauces in assets['sauce_names'].items():
+        recipes = assets['recipes'].get(locale[:2], {})
+        for sauce_id, names in sauces.items():
+            if sauce_id not in recipes:
+                errors.append("Sauce names of {} {} have no recipe".format(locale, sauce_id))
+            if not names:
+                errors.append("Sauce {} {} has no names".format(locale, sauce_id))
+    return errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output', default=DEFAULT_OUTPUT_FILE, help='bundle file to write')
+    parser.add_argument('--check', action='store_true', help='fail if the bundle is not up to date')
+    args = parser.parse_args()
+    output_path = os.path.abspath(args.output)
+
+    # The skill modules load their files from the lambda folder, and the
+    # source of the bundle is always the source files
+    os.chdir(LAMBDA_DIR)
+    sys.path.insert(0, LAMBDA_DIR)
+    os.environ['ASSET_BUNDLE_FILE'] = ''
+    os.environ.pop('RECIPE_CATALOG_FILE', None)
+    import asset_utils
+
+    assets = collect_assets()
+    errors = validate_assets(assets)
+    for error in errors:
+        print("INVALID: {}".format(error))
+    if errors:
+        return 1
+
+    if args.check:
+        try:
+            with open(output_path, 'rb') as f:
+                bundle, _ = asset_utils.loads_bundle(f.read())
+        except (OSError, ValueError, EOFError) as e:
+            print("{} cannot be loaded ({}), run python tools/build_asset_bundle.py".format(output_path, e))
+            return 1
+        if json.dumps(bundle) != json.dumps(assets):
+            print("{} is out of date, run python tools/build_asset_bundle.py".format(output_path))
+            return 1
+        print("{} is up to date".format(output_path))
+        return 0
+
+    data = asset_utils.dumps_bundle(assets)
+    with open(output_path, 'wb') as f:
+        f.write(data)
+    _, digest = asset_utils.loads_bundle(data)
+    print("{}: {} bytes, {}".format(output_path, len(data), digest[:12]))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,45 @@
+"""
+Build the SQLite recipe catalog of the skill
+
+Converts the recipes package (one module per language) and the recipe images
+of recipe_utils into a read-only SQLite catalog file. Deploy the file with the
+function and set the RECIPE_CATALOG_FILE environment variable to its path to
+read the recipes on demand instead of importing them.
+
+usage: python tools/build_recipe_catalog.py [--output lambda/py/recipes.db]
+"""
+import argparse
+import os
+import sys
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+LAMBDA_DIR = os.path.join(ROOT_DIR, 'lambda', 'py')
+DEFAULT_OUTPUT_FILE = os.path.join(LAMBDA_DIR, 'recipes.db')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output', default=DEFAULT_OUTPUT_FILE, help='catalog file to write')
+    args = parser.parse_args()
+    output_path = os.path.abspath(args.output)
+
+    # The skill modules load their files from the lambda folder, and the
+    # source of the catalog is always the recipes package
+    os.chdir(LAMBDA_DIR)
+    sys.path.insert(0, LAMBDA_DIR)
+    os.environ.pop('RECIPE_CATALOG_FILE', None)
+    os.environ['ASSET_BUNDLE_FILE'] = ''
+    import catalog_utils
+    import recipe_utils
+    import recipes
+
+    catalog_utils.write_sqlite_catalog(
+        output_path, recipes.LANGUAGES, recipe_utils.CATALOG_BACKEND.iter_recipes, recipe_utils.RECIPE_IMAGES)
+    backend = catalog_utils.SqliteCatalogBackend(output_path)
+    print("{}: {} recipes, {} bytes".format(
+        output_path, sum(backend.count(language) for language in recipes.LANGUAGES), os.path.getsize(output_path)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,62 @@
+"""
+Build the sauce names table of the skill from the interaction models
+
+Extracts the values and synonyms of the LIST_OF_ITEMS slot type of every
+models/*.json file into lambda/py/sauce_names.json, used by the skill to
+resolve the spoken sauce names which entity resolution does not match.
+
+usage: python tools/build_sauce_names.py [--check]
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+MODELS_DIR = os.path.join(ROOT_DIR, 'models')
+OUTPUT_FILE = os.path.join(ROOT_DIR, 'lambda', 'py', 'sauce_names.json')
+SLOT_TYPE = 'LIST_OF_ITEMS'
+
+
+def build_sauce_names(models_dir):
+    """
+    Returns the names (value and synonyms) of each sauce id by locale
+    """
+    sauce_names = {}
+    for file_path in sorted(glob.glob(os.path.join(models_dir, '*.json'))):
+        locale = os.path.splitext(os.path.basename(file_path))[0]
+        with open(file_path, encoding='utf-8') as f:
+            model = json.load(f)['interactionModel']['languageModel']
+        names = {}
+        for model_type in model['types']:
+            if model_type['name'] == SLOT_TYPE:
+                for value in model_type['values']:
+                    names[value['id']] = [value['name']['value']] + value['name'].get('synonyms', [])
+        sauce_names[locale] = names
+    return sauce_names
+
+
+def dumps(sauce_names):
+    return json.dumps(sauce_names, indent=2, sort_keys=True, ensure_ascii=False) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--check', action='store_true', help='fail if the table is not up to date')
+    args = parser.parse_args()
+
+    content = dumps(build_sauce_names(MODELS_DIR))
+    if args.check:
+        with open(OUTPUT_FILE, encoding='utf-8') as f:
+            if f.read() != content:
+                print("{} is out of date, run python tools/build_sauce_names.py".format(OUTPUT_FILE))
+                return 1
+        return 0
+    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,239 @@
+"""
+Check the responses of the whole request matrix against the golden responses and the payload budgets
+
+Renders every combination of locale of models/ x request type x sauce id x
+APL/voice-only device x new/ongoing session through the lambda handler:
+launch, help, stop, cancel, navigate home, session ended, ingredients (with
+and without a recipe containing all of them), recipe (found for every sauce
+id, not found, without item, and step by step), repeat, previous and next
+after a recipe, and the APL touch events. Ongoing sessions
+carry the session attributes of a conversation played first (ex: launch,
+recipe, help before a previous request). The random sauces are seeded by case,
+so the responses are deterministic. Cases are rendered by a process pool, one
+task per locale and device.
+
+Fails when the skill logs an error (ex: a request answered by the CatchAll
+handler), when a response envelope or its session attributes are larger than
+the byte budgets, or when a response differs from the golden response stored
+in tools/golden/responses/<locale>.json (see golden_utils.py), printing the
+diff. Run it with --update after an intended change of the responses, and
+--output to write every response (ex: to diff two commits).
+
+usage: python tools/check_golden_responses.py [--locales en-US,fr-FR] [--workers 4] [--max-response-bytes 8192]
+                                              [--max-session-bytes 1024] [--output responses/] [--update]
+"""
+import argparse
+import concurrent.futures
+import json
+import os
+import random
+import sys
+import time
+import zlib
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+GOLDEN_DIR = os.path.join(ROOT_DIR, 'tools', 'golden', 'responses')
+sys.path.insert(0, os.path.join(ROOT_DIR, 'benchmarks'))
+
+import envelopes  # noqa: E402
+import golden_utils  # noqa: E402
+
+# Request id of every request, the responses do not depend on it
+REQUEST_ID = 'amzn1.echo-api.request.GOLDEN'
+
+# Skill of the worker process, loaded once by its initializer
+_worker = {}
+
+
+def build_cases(locale, model, apl):
+    """
+    Returns the list of (case name, setup requests, request, guided) of a locale and device
+    The setup requests are played first in the session of ongoing session cases
+    """
+    launch = envelopes.launch_request()
+    help_request = envelopes.intent_request('AMAZON.HelpIntent')
+    next_request = envelopes.intent_request('AMAZON.NextIntent')
+    cases = []
+    for new in (True, False):
+        session = 'new' if new else 'ongoing'
+
+        def case(name, request, setup=(), guided=False):
+            cases.append(('{} {} {}'.format('apl' if apl else 'voice', session, name),
+                          () if new else (launch,) + tuple(setup), request, guided))
+
+        case('LaunchRequest', launch)
+        case('HelpIntent', help_request)
+        case('StopIntent', envelopes.intent_request('AMAZON.StopIntent'))
+        case('CancelIntent', envelopes.intent_request('AMAZON.CancelIntent'))
+        case('NavigateHomeIntent', envelopes.intent_request('AMAZON.NavigateHomeIntent'))
+        case('SessionEndedRequest', envelopes.session_ended_request())
+        case('IngredientIntent', envelopes.ingredient_intent_request(envelopes.SAMPLE_INGREDIENTS[locale[:2]]))
+        case('IngredientIntent no common recipe', envelopes.ingredient_intent_request(
+            envelopes.SAMPLE_UNMATCHED_INGREDIENTS[locale[:2]]))
+        case('RecipeIntent not found', envelopes.recipe_intent_request('chocolate'))
+        case('RecipeIntent without item', envelopes.intent_request(
+            'RecipeIntent', {'Item': {'name': 'Item', 'confirmationStatus': 'NONE'}}))
+        case('RepeatIntent', envelopes.intent_request('AMAZON.RepeatIntent'))
+        case('PreviousIntent', envelopes.intent_request('AMAZON.PreviousIntent'))
+        case('NextIntent', next_request)
+        if apl:
+            case('UserEvent goBack', envelopes.apl_user_event_request('goBack'), (help_request,))
+        for sauce_id, value, _ in envelopes.get_slot_values(model):
+            recipe = envelopes.recipe_intent_request(value, sauce_id)
+            case('RecipeIntent ' + sauce_id, recipe)
+            case('RecipeIntent {} guided'.format(sauce_id), recipe, guided=True)
+            if apl:
+                case('UserEvent sauceInstructions ' + sauce_id,
+                     envelopes.apl_user_event_request('sauceInstructions', sauce_id))
+            if not new:
+                # Follow-up requests of the recipe
+                case('RepeatIntent after ' + sauce_id, envelopes.intent_request('AMAZON.RepeatIntent'), (recipe,))
+                case('PreviousIntent after {} and help'.format(sauce_id),
+                     envelopes.intent_request('AMAZON.PreviousIntent'), (recipe, help_request))
+                case('NextIntent after {} guided'.format(sauce_id), next_request, (recipe,), guided=True)
+                case('PreviousIntent after {} next guided'.format(sauce_id),
+                     envelopes.intent_request('AMAZON.PreviousIntent'), (recipe, next_request), guided=True)
+    return cases
+
+
+def _init_worker():
+    _worker['lambda_function'] = envelopes.load_skill()
+    _worker['models'] = envelopes.load_models()
+
+
+def render_cases(locale, apl):
+    """
+    Renders the cases of a locale and device in the worker process
+    Returns the list of (case name, compact response envelope json, session attributes bytes, error logged)
+    """
+    lambda_handler = _worker['lambda_function'].lambda_handler
+    import step_utils
+    results = []
+    for name, setup, request, guided in build_cases(locale, _worker['models'][locale], apl):
+        random.seed(zlib.crc32('{} {}'.format(locale, name).encode('utf-8')))
+        step_utils.GUIDED_RECIPES = guided
+        errors = envelopes.logged_errors()
+        try:
+            attributes = None
+            for number, setup_request in enumerate(setup):
+                attributes = lambda_handler(envelopes.envelope(
+                    setup_request, locale, apl=apl, new=number == 0, attributes=attributes,
+                    request_id=REQUEST_ID), None).get('sessionAttributes')
+            response_envelope = lambda_handler(envelopes.envelope(
+                request, locale, apl=apl, new=not setup, attributes=attributes, request_id=REQUEST_ID), None)
+        finally:
+            step_utils.GUIDED_RECIPES = False
+        # The SDK user agent depends on the installed versions
+        response_envelope.pop('userAgent', None)
+        session_attributes = response_envelope.get('sessionAttributes')
+        results.append((name, golden_utils.compact(response_envelope),
+                        len(golden_utils.compact(session_attributes).encode('utf-8'))
+                        if session_attributes is not None else 0,
+                        envelopes.logged_errors() != errors))
+    return results
+
+
+def render_matrix(locales, workers):
+    """
+    Returns the rendered cases by locale, rendered by a process pool
+    """
+    tasks = [(locale, apl) for locale in locales for apl in (True, False)]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        results = list(pool.map(render_cases, *zip(*tasks)))
+    rendered = {locale: [] for locale in locales}
+    for (locale, _), cases in zip(tasks, results):
+        rendered[locale].extend(cases)
+    return rendered
+
+
+def golden_file(locale):
+    return os.path.join(GOLDEN_DIR, locale + '.json')
+
+
+def write_responses(output_dir, rendered):
+    """
+    Writes every response envelope, pretty printed, to output_dir/<locale>/<case name>.json
+    """
+    for locale, cases in rendered.items():
+        locale_dir = os.path.join(output_dir, locale)
+        os.makedirs(locale_dir, exist_ok=True)
+        for name, response, _, _ in cases:
+            with open(os.path.join(locale_dir, name.replace(' ', '_') + '.json'), 'w', encoding='utf-8') as f:
+                json.dump(json.loads(response), f, indent=1, ensure_ascii=False, sort_keys=True)
+                f.write('\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--locales', default=None, help='comma separated locales (default: every model)')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: number of cores)')
+    parser.add_argument('--max-response-bytes', type=int, default=8192,
+                        help='budget of each response envelope (compact json)')
+    parser.add_argument('--max-session-bytes', type=int, default=1024,
+                        help='budget of the session attributes of each response')
+    parser.add_argument('--output', default=None, help='folder to write every response to')
+    parser.add_argument('--update', action='store_true', help='write the golden responses')
+    args = parser.parse_args()
+
+    locales = args.locales.split(',') if args.locales else sorted(envelopes.load_models())
+    start = time.perf_counter()
+    rendered = render_matrix(locales, args.workers)
+    elapsed = time.perf_counter() - start
+    if args.output:
+        write_responses(os.path.abspath(args.output), rendered)
+
+    failures = 0
+    count = 0
+    largest = (0, None)
+    largest_session = (0, None)
+    for locale, cases in rendered.items():
+        golden = None if args.update else golden_utils.read_golden(golden_file(locale))
+        responses = {}
+        for name, response, session_bytes, error in cases:
+            count += 1
+            response_bytes = len(response.encode('utf-8'))
+            responses[name] = response
+            largest = max(largest, (response_bytes, '{} {}'.format(locale, name)))
+            largest_session = max(largest_session, (session_bytes, '{} {}'.format(locale, name)))
+            if error:
+                print("ERROR: {} {} logged an error".format(locale, name))
+                failures += 1
+            if response_bytes > args.max_response_bytes:
+                print("OVER BUDGET: {} {} response is {} bytes > {}".format(
+                    locale, name, response_bytes, args.max_response_bytes))
+                failures += 1
+            if session_bytes > args.max_session_bytes:
+                print("OVER BUDGET: {} {} session attributes are {} bytes > {}".format(
+                    locale, name, session_bytes, args.max_session_bytes))
+                failures += 1
+            if golden is None:
+                continue
+            expected = golden.get(name)
+            if expected is None:
+                print("MISSING: {} {} has no golden response".format(locale, name))
+                failures += 1
+            elif expected != response:
+                print("FAILED: {} {} differs from the golden response ({:+d} response bytes)".format(
+                    locale, name, response_bytes - len(expected.encode('utf-8'))))
+                print(golden_utils.diff(expected, response, 'golden', 'rendered'))
+                failures += 1
+        if golden is not None:
+            for name in sorted(set(golden) - set(responses)):
+                print("STALE: {} {} golden response is not rendered anymore".format(locale, name))
+                failures += 1
+        if args.update:
+            os.makedirs(GOLDEN_DIR, exist_ok=True)
+            golden_utils.write_golden(golden_file(locale), responses)
+
+    print("{} responses rendered in {:.1f} s, largest {} bytes ({}), largest session attributes {} bytes ({})".format(
+        count, elapsed, largest[0], largest[1], largest_session[0], largest_session[1]))
+    if args.update:
+        print("{}: golden responses of {} locales written".format(GOLDEN_DIR, len(rendered)))
+    if failures:
+        print("{} failures, run python tools/check_golden_responses.py --update after an intended change".format(
+            failures))
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""
+Check that the locales supported by the skill match the locales published in skill.json
+
+skill.json is not deployed with the lambda function, so the skill keeps its
+own list (language_utils.SUPPORTED_LOCALES). Fails when the two lists differ,
+when a published locale has no interaction model in models/, or when a
+supported locale has no localized strings or recipes in the source files.
+
+usage: python tools/check_locales.py [--skill skill.json]
+"""
+import argparse
+import json
+import os
+import sys
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+LAMBDA_DIR = os.path.join(ROOT_DIR, 'lambda', 'py')
+MODELS_DIR = os.path.join(ROOT_DIR, 'models')
+DEFAULT_SKILL_FILE = os.path.join(ROOT_DIR, 'skill.json')
+
+
+def get_published_locales(file_path):
+    """
+    Returns the locales of the publishing information of a skill manifest
+    """
+    with open(file_path, encoding='utf-8') as f:
+        manifest = json.load(f)['manifest']
+    return set(manifest['publishingInformation']['locales'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--skill', default=DEFAULT_SKILL_FILE, help='skill manifest')
+    args = parser.parse_args()
+    published = get_published_locales(os.path.abspath(args.skill))
+
+    # The skill modules load their files from the lambda folder, from the source files
+    os.chdir(LAMBDA_DIR)
+    sys.path.insert(0, LAMBDA_DIR)
+    os.environ['ASSET_BUNDLE_FILE'] = ''
+    os.environ.pop('RECIPE_CATALOG_FILE', None)
+    try:
+        import language_utils
+    except ValueError as e:
+        print("INVALID: {}".format(e))
+        return 1
+
+    errors = []
+    supported = set(language_utils.SUPPORTED_LOCALES)
+    for locale in sorted(published - supported):
+        errors.append("Locale {} is published in skill.json but not in language_utils.SUPPORTED_LOCALES".format(
+            locale))
+    for locale in sorted(supported - published):
+        errors.append("Locale {} is in language_utils.SUPPORTED_LOCALES but not published in skill.json".format(
+            locale))
+    for locale in sorted(published):
+        if not os.path.exists(os.path.join(MODELS_DIR, locale + '.json')):
+            errors.append("Locale {} has no interaction model in models/".format(locale))
+
+    for error in errors:
+        print("INVALID: {}".format(error))
+    if errors:
+        return 1
+    print("{} locales published, supported and modeled".format(len(published)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
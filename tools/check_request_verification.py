@@ -0,0 +1,196 @@
+"""
+Check the request verification of the self-hosted endpoint against the verifiers of the SDK
+
+Replays genuine Alexa requests, captured by the endpoint (python server.py
+--capture requests/), through verifier_utils and through the RequestVerifier
+and TimestampVerifier of ask-sdk-webservice-support, at the time each request
+was sent: the request as received, and altered copies (tampered body, other
+signature, missing signature, certificate chain URL off echo.api, sent after
+the timestamp tolerance). Fails when verifier_utils rejects a genuine request,
+accepts an altered one, or disagrees with the SDK verifiers.
+
+The certificate chains are downloaded from their SignatureCertChainUrl, or
+read from --cert-chain (PEM file) to run offline. --trusted-roots replaces the
+system certificate authorities (ex: requests signed with a locally generated
+chain, see benchmarks/request_verification.py). The SDK verifiers are run
+when ask-sdk-webservice-support can be imported (pip install
+ask-sdk-webservice-support), the other checks run without them.
+
+usage: python tools/check_request_verification.py requests/*.json [--cert-chain echo-api-cert.pem]
+                                                   [--trusted-roots roots.pem]
+"""
+import argparse
+import base64
+import datetime
+import json
+import os
+import sys
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+LAMBDA_DIR = os.path.join(ROOT_DIR, 'lambda', 'py')
+
+
+def load_capture(file_path):
+    """
+    Returns the (signature headers, raw body bytes) of a captured request
+    """
+    with open(file_path, encoding='utf-8') as f:
+        capture = json.load(f)
+    return capture['headers'], capture['body'].encode('utf-8')
+
+
+def get_timestamp(body):
+    """
+    Returns the time.time() of the request timestamp of a request body
+    """
+    timestamp = json.loads(body)['request']['timestamp']
+    return datetime.datetime.strptime(timestamp[:19], '%Y-%m-%dT%H:%M:%S').replace(
+        tzinfo=datetime.timezone.utc).timestamp()
+
+
+def build_cases(headers, body, tolerance):
+    """
+    Returns the list of (case name, headers, body, seconds after the request timestamp, expected to be accepted)
+    """
+    tampered = body.replace(b'"timestamp"', b'"timestamp" ', 1)
+    other_signature = base64.b64encode(bytes(reversed(base64.b64decode(headers['Signature-256'])))).decode('ascii')
+    return [
+        ('genuine', headers, body, 1, True),
+        ('genuine, received late', headers, body, tolerance - 1, True),
+        ('tampered body', headers, tampered, 1, False),
+        ('other signature', dict(headers, **{'Signature-256': other_signature}), body, 1, False),
+        ('missing signature', {'SignatureCertChainUrl': headers['SignatureCertChainUrl']}, body, 1, False),
+        ('chain URL off echo.api', dict(headers, SignatureCertChainUrl=headers['SignatureCertChainUrl'].replace(
+            '/echo.api/', '/echo.api/../other/')), body, 1, False),
+        ('replayed after the tolerance', headers, body, tolerance + 60, False)
+    ]
+
+
+def verify_with_skill(verifier_utils, request_envelope, headers, body, now):
+    """
+    Returns None if verifier_utils accepts the request, the error message otherwise
+    """
+    try:
+        verifier_utils.verify_signature(headers, body, now=now)
+        verifier_utils.verify_timestamp(request_envelope, now=now)
+    except verifier_utils.VerificationError as e:
+        return str(e)
+    return None
+
+
+def load_sdk_verifiers(cert_chain, trusted_roots):
+    """
+    Returns the (RequestVerifier, TimestampVerifier, VerificationException) of the SDK,
+    or the error message if it cannot be imported
+    """
+    try:
+        from ask_sdk_webservice_support import verifier
+        from asn1crypto import pem
+        from certvalidator import CertificateValidator, ValidationContext
+        from certvalidator.errors import ValidationError, PathError
+    except Exception as e:
+        return "{}: {}".format(type(e).__name__, e)
+
+    class RequestVerifier(verifier.RequestVerifier):
+        def _load_cert_chain(self, cert_url):
+            if cert_chain is not None:
+                return cert_chain
+            return super()._load_cert_chain(cert_url)
+
+        def _validate_cert_chain(self, chain):
+            if trusted_roots is None:
+                return super()._validate_cert_chain(chain)
+            # The validation of the SDK, with the trusted roots instead of the system ones
+            certificates = [der_bytes for _, _, der_bytes in pem.unarmor(chain, multiple=True)]
+            roots = [der_bytes for _, _, der_bytes in pem.unarmor(trusted_roots, multiple=True)]
+            try:
+                CertificateValidator(certificates[0], certificates[1:], ValidationContext(
+                    trust_roots=roots)).validate_usage(key_usage={'digital_signature'})
+            except (PathError, ValidationError) as e:
+                raise verifier.VerificationException("Certificate chain is not valid", e)
+
+    return RequestVerifier(), verifier.TimestampVerifier(), verifier.VerificationException
+
+
+def verify_with_sdk(sdk, request_envelope, headers, body, now):
+    """
+    Returns None if the SDK verifiers accept the request at the time now, the error message otherwise
+    """
+    from freezegun import freeze_time
+    request_verifier, timestamp_verifier, verification_exception = sdk
+    try:
+        with freeze_time(datetime.datetime.fromtimestamp(now, datetime.timezone.utc)):
+            for sdk_verifier in (request_verifier, timestamp_verifier):
+                sdk_verifier.verify(headers=headers, serialized_request_env=body.decode('utf-8'),
+                                    deserialized_request_env=request_envelope)
+    except verification_exception as e:
+        return str(e)
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('captures', nargs='+', help='captured requests (python server.py --capture)')
+    parser.add_argument('--cert-chain', default=None, help='PEM certificate chain used instead of downloading it')
+    parser.add_argument('--trusted-roots', default=None,
+                        help='PEM certificate authorities trusted instead of the system ones')
+    args = parser.parse_args()
+    captures = [(os.path.basename(file_path), load_capture(file_path)) for file_path in args.captures]
+    cert_chain = None
+    if args.cert_chain:
+        with open(args.cert_chain, 'rb') as f:
+            cert_chain = f.read()
+    trusted_roots = None
+    if args.trusted_roots:
+        with open(args.trusted_roots, 'rb') as f:
+            trusted_roots = f.read()
+
+    os.chdir(LAMBDA_DIR)
+    sys.path.insert(0, LAMBDA_DIR)
+    import lambda_function
+    import verifier_utils
+    from ask_sdk_model import RequestEnvelope
+    if cert_chain is not None or trusted_roots is not None:
+        verifier_utils.set_cert_chain_fetcher(
+            (lambda url: cert_chain) if cert_chain is not None else verifier_utils.fetch_cert_chain, trusted_roots)
+    serializer = lambda_function.sb.get_skill().serializer
+    sdk = load_sdk_verifiers(cert_chain, trusted_roots)
+    if isinstance(sdk, str):
+        print("SDK verifiers not compared, ask_sdk_webservice_support cannot be imported ({})".format(sdk))
+        sdk = None
+
+    failures = 0
+    count = 0
+    for name, (headers, body) in captures:
+        request_envelope = serializer.deserialize(body.decode('utf-8'), RequestEnvelope)
+        tolerance = verifier_utils.MAX_SKILL_EVENT_TIMESTAMP_TOLERANCE \
+            if request_envelope.request.object_type in verifier_utils.SKILL_EVENT_TYPES \
+            else verifier_utils.MAX_TIMESTAMP_TOLERANCE
+        sent = get_timestamp(body)
+        for case, case_headers, case_body, delay, accepted in build_cases(headers, body, tolerance):
+            count += 1
+            # Chains are validated at the time of each case
+            verifier_utils.CERT_CHAINS.clear()
+            case_envelope = request_envelope if case_body == body else serializer.deserialize(
+                case_body.decode('utf-8'), RequestEnvelope)
+            error = verify_with_skill(verifier_utils, case_envelope, case_headers, case_body, sent + delay)
+            if (error is None) != accepted:
+                print("FAILED: {} {}: verifier_utils {} it ({})".format(
+                    name, case, 'accepts' if error is None else 'rejects', error))
+                failures += 1
+            if sdk is None:
+                continue
+            sdk_error = verify_with_sdk(sdk, case_envelope, case_headers, case_body, sent + delay)
+            if (sdk_error is None) != (error is None):
+                print("FAILED: {} {}: verifier_utils {} it ({}), the SDK verifiers {} it ({})".format(
+                    name, case, 'accepts' if error is None else 'rejects', error,
+                    'accept' if sdk_error is None else 'reject', sdk_error))
+                failures += 1
+
+    print("{} cases of {} captured requests checked{}, {} failures".format(
+        count, len(captures), '' if sdk is None else ' against the SDK verifiers', failures))
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
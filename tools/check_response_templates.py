@@ -0,0 +1,109 @@
+"""
+Check the pre-rendered response templates against the golden responses
+
+Handles the requests answered with response templates (launch, help, stop,
+cancel, recipe not found, previous and repeat without history) for every
+locale of models/, APL and voice-only devices and new or ongoing sessions,
+with a seeded random sauce. The response envelopes must be byte-for-byte
+equal to the golden responses rendered by the response builder, stored in
+tools/golden/response_templates.json (see golden_utils.py), with the
+templates enabled and disabled. Differences are printed.
+
+usage: python tools/check_response_templates.py [--update]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+GOLDEN_FILE = os.path.join(ROOT_DIR, 'tools', 'golden', 'response_templates.json')
+sys.path.insert(0, os.path.join(ROOT_DIR, 'benchmarks'))
+
+import envelopes  # noqa: E402
+import golden_utils  # noqa: E402
+
+
+def build_cases(models):
+    """
+    Returns the list of (case name, event)
+    """
+    cases = []
+    for locale in sorted(models):
+        for apl in (True, False):
+            for new in (True, False):
+                def case(name, request):
+                    cases.append(('{} {} {} {}'.format(locale, 'apl' if apl else 'voice', 'new' if new else 'ongoing',
+                                                       name),
+                                  envelopes.envelope(request, locale, apl=apl, new=new,
+                                                     request_id='amzn1.echo-api.request.GOLDEN')))
+
+                case('LaunchRequest', envelopes.launch_request())
+                case('HelpIntent', envelopes.intent_request('AMAZON.HelpIntent'))
+                case('StopIntent', envelopes.intent_request('AMAZON.StopIntent'))
+                case('CancelIntent', envelopes.intent_request('AMAZON.CancelIntent'))
+                case('RecipeIntent not found', envelopes.recipe_intent_request('chocolate'))
+                case('RecipeIntent without item', envelopes.intent_request(
+                    'RecipeIntent', {'Item': {'name': 'Item', 'confirmationStatus': 'NONE'}}))
+                case('PreviousIntent without history', envelopes.intent_request('AMAZON.PreviousIntent'))
+                case('RepeatIntent without history', envelopes.intent_request('AMAZON.RepeatIntent'))
+    return cases
+
+
+def render(lambda_handler, cases):
+    """
+    Returns the compact json of the response envelope of each case, by case name
+    The random sauces are seeded by case, the SDK user agent is left out
+    """
+    responses = {}
+    for number, (name, event) in enumerate(cases):
+        random.seed(number)
+        response_envelope = lambda_handler(event, None)
+        response_envelope.pop('userAgent', None)
+        responses[name] = json.dumps(response_envelope, separators=(',', ':'), ensure_ascii=False)
+    return responses
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--update', action='store_true', help='write the golden responses of the response builder')
+    args = parser.parse_args()
+
+    lambda_function = envelopes.load_skill()
+    import template_utils
+    cases = build_cases(envelopes.load_models())
+
+    template_utils.TEMPLATES_ENABLED = False
+    built = render(lambda_function.lambda_handler, cases)
+    if args.update:
+        os.makedirs(os.path.dirname(GOLDEN_FILE), exist_ok=True)
+        golden_utils.write_golden(GOLDEN_FILE, built)
+        print("{}: {} golden responses".format(GOLDEN_FILE, len(built)))
+        return 0
+
+    template_utils.TEMPLATES_ENABLED = True
+    rendered = render(lambda_function.lambda_handler, cases)
+    golden = golden_utils.read_golden(GOLDEN_FILE)
+
+    failures = 0
+    for name, _ in cases:
+        if name not in golden:
+            print("MISSING: {} has no golden response, run python tools/check_response_templates.py --update".format(
+                name))
+            failures += 1
+            continue
+        if built[name] != golden[name]:
+            print("FAILED: {} response builder differs from the golden response".format(name))
+            print(golden_utils.diff(golden[name], built[name], 'golden', 'builder'))
+            failures += 1
+        if rendered[name] != built[name]:
+            print("FAILED: {} template differs from the response builder".format(name))
+            print(golden_utils.diff(built[name], rendered[name], 'builder', 'template'))
+            failures += 1
+    print("{} responses checked, {} failures".format(len(cases), failures))
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""
+Golden response files of the check tools (check_response_templates.py, check_golden_responses.py)
+
+A golden file stores the response envelopes, pretty printed and with their keys
+in the order of the skill output, so that a change of the responses is reviewed
+as a diff of the file. The APL documents, shared by many responses, are stored
+once in the "documents" section and referenced by their sha256 prefix.
+"""
+import difflib
+import hashlib
+import json
+
+# Length of the sha256 prefix of the document references
+DIGEST_LENGTH = 16
+
+# Prefix of a document reference, in place of the document of a RenderDocument directive
+DOCUMENT_REFERENCE = 'golden-document:'
+
+
+def compact(value):
+    """
+    Returns the compact json of a value, as the skill responses are compared
+    """
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False)
+
+
+def digest(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:DIGEST_LENGTH]
+
+
+def _split_documents(response, documents):
+    """
+    Returns the response envelope (compact json) as a dict, its APL documents replaced by a
+    reference to the documents table
+    """
+    response_envelope = json.loads(response)
+    for directive in response_envelope.get('response', {}).get('directives', []):
+        document = directive.get('document')
+        if isinstance(document, dict):
+            reference = DOCUMENT_REFERENCE + digest(compact(document))
+            documents[reference] = document
+            directive['document'] = reference
+    return response_envelope
+
+
+def _join_documents(response_envelope, documents):
+    """
+    Returns the compact json of a stored response envelope, with its APL documents
+    """
+    for directive in response_envelope.get('response', {}).get('directives', []):
+        document = directive.get('document')
+        if isinstance(document, str) and document.startswith(DOCUMENT_REFERENCE):
+            directive['document'] = documents[document]
+    return compact(response_envelope)
+
+
+def write_golden(file_path, responses):
+    """
+    Writes the responses (compact json by case name) to a golden file
+    """
+    documents = {}
+    stored = {name: _split_documents(response, documents) for name, response in sorted(responses.items())}
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump({'documents': documents, 'responses': stored}, f, indent=1, ensure_ascii=False)
+        f.write('\n')
+
+
+def read_golden(file_path):
+    """
+    Returns the responses (compact json by case name) of a golden file, an empty dict if there is none
+    """
+    try:
+        with open(file_path, encoding='utf-8') as f:
+            golden = json.load(f)
+    except FileNotFoundError:
+        return {}
+    return {name: _join_documents(response_envelope, golden['documents'])
+            for name, response_envelope in golden['responses'].items()}
+
+
+def diff(expected, actual, expected_name='golden', actual_name='rendered'):
+    """
+    Returns the differences between two compact json responses, pretty printed
+    """
+    def lines(response):
+        return json.dumps(json.loads(response), indent=1, ensure_ascii=False).splitlines()
+    return '\n'.join(difflib.unified_diff(lines(expected), lines(actual), expected_name, actual_name, lineterm=''))
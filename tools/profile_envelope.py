@@ -0,0 +1,80 @@
+"""
+Replay a saved request envelope under the profiler
+
+Loads the skill from the lambda folder and handles the request envelope of a
+JSON file (ex: the JSON input of the Alexa developer console, or a Lambda test
+event) after warm-up invocations, with the skill dispatch run under cProfile
+and tracemalloc as for the invocations profiled in production (see
+PROFILE_SAMPLE_RATE, PROFILE_INTENTS and PROFILE_LOCALES). Prints the top
+functions by cumulative time and the top allocation sites of the dispatch
+(memory allocated during the invocation and still allocated after it), or
+the profile record logged by the skill with --json. --pstats saves the full
+cProfile statistics (ex: for snakeviz or pstats).
+
+usage: python tools/profile_envelope.py envelope.json [--warmup 1] [--top 15] [--pstats out.prof] [--json]
+"""
+import argparse
+import json
+import os
+import sys
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(ROOT_DIR, 'benchmarks'))
+
+import envelopes  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('envelope', help='request envelope json file ("-" for stdin)')
+    parser.add_argument('--warmup', type=int, default=1,
+                        help='invocations handled before the profiled one, 0 profiles a cold invocation')
+    parser.add_argument('--top', type=int, default=15, help='functions and allocation sites reported')
+    parser.add_argument('--pstats', default=None, help='file to save the cProfile statistics to')
+    parser.add_argument('--json', action='store_true', help='print the profile record as json')
+    args = parser.parse_args()
+
+    if args.envelope == '-':
+        payload = sys.stdin.read()
+    else:
+        with open(args.envelope, encoding='utf-8') as f:
+            payload = f.read()
+    pstats_path = os.path.abspath(args.pstats) if args.pstats else None
+
+    lambda_function = envelopes.load_skill()
+    import profile_utils
+    from ask_sdk_model import RequestEnvelope
+
+    skill = lambda_function.sb.get_skill()
+    for _ in range(args.warmup):
+        lambda_function.sb.invoke(payload)
+    request_envelope = skill.serializer.deserialize(payload=payload, obj_type=RequestEnvelope)
+    capture = profile_utils.ProfileCapture(top=args.top)
+    response_envelope = capture.run(skill.invoke, request_envelope=request_envelope, context=None)
+    skill.serializer.serialize(response_envelope)
+    if pstats_path:
+        capture.profiler.dump_stats(pstats_path)
+    record = profile_utils.get_profile_record(request_envelope, 'replay', capture)
+
+    if args.json:
+        print(json.dumps(record, indent=2, ensure_ascii=False))
+        return 0
+    profile = record['profile']
+    print("{type} {intent} {locale}  dispatch {wallMs:.3f} ms  peak {peakKiB:.1f} KiB".format(
+        wallMs=profile['wallMs'], peakKiB=profile['peakKiB'], **record))
+    print()
+    print("{:>8} {:>10} {:>10}  {}".format('calls', 'total ms', 'cum ms', 'function'))
+    for function in profile['functions']:
+        print("{calls:>8} {totalMs:>10.3f} {cumulativeMs:>10.3f}  {function}".format(**function))
+    print()
+    print("{:>8} {:>10}  {}".format('blocks', 'KiB', 'allocation site'))
+    for allocation in profile['allocations']:
+        print("{blocks:>8} {kib:>10.2f}  {site}".format(**allocation))
+    if pstats_path:
+        print()
+        print("cProfile statistics saved to {}".format(pstats_path))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())